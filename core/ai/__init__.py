@@ -1,3 +1,9 @@
 from .enhanced_ai import EnhancedAIController, EnhancedRaiderAI, EnhancedWildDogAI, EnhancedFriendlyScavengerAI
+from .perception import LineOfSight
+from .flow_field import FlowField
+from .pathfinding import HierarchicalPathfinder
+from .batch import AIBatch
+from .scheduler import DecisionScheduler
+from .pack import Pack
 
-__all__ = ['EnhancedAIController', 'EnhancedRaiderAI', 'EnhancedWildDogAI', 'EnhancedFriendlyScavengerAI']
+__all__ = ['EnhancedAIController', 'EnhancedRaiderAI', 'EnhancedWildDogAI', 'EnhancedFriendlyScavengerAI', 'LineOfSight', 'FlowField', 'HierarchicalPathfinder', 'AIBatch', 'DecisionScheduler', 'Pack']
@@ -0,0 +1,247 @@
+import random
+import numpy as np
+import pygame
+from core.settings import ENEMY_DETECT_RADIUS
+from .states import AIState, AIPersonality, STATE_SPEED, PERSONALITY_SPEED
+
+vec = pygame.math.Vector2
+
+STUCK_DISTANCE = 5
+STUCK_TIME = 2.0
+# O menor sorteio de _handle_idle_state para sair de IDLE
+IDLE_MIN_TIME = 2.0
+
+# Escalares por controlador guardados no lote: nome -> (dtype, valor inicial)
+BATCH_FIELDS = {
+    'state': (np.int8, 0),
+    'personality': (np.int8, 0),
+    'alertness': (np.float64, 1.0),
+    'idle_timer': (np.float64, 0.0),
+    'wander_timer': (np.float64, 0.0),
+    'last_decision_time': (np.float64, 0.0),
+    'decision_interval': (np.float64, 1.0),
+    'random_action_chance': (np.float64, 0.1),
+    'is_confused': (np.bool_, False),
+    'confusion_timer': (np.float64, 0.0),
+    'stuck_timer': (np.float64, 0.0),
+    'x': (np.float64, 0.0),
+    'y': (np.float64, 0.0),
+    'speed': (np.float64, 0.0),
+    # Para onde o controlador está andando: destino e próximo ponto do caminho, com raios de chegada
+    'goal_x': (np.float64, 0.0),
+    'goal_y': (np.float64, 0.0),
+    'goal_radius': (np.float64, -1.0),
+    'steer_x': (np.float64, 0.0),
+    'steer_y': (np.float64, 0.0),
+    'steer_radius': (np.float64, 0.0),
+    'last_x': (np.float64, 0.0),
+    'last_y': (np.float64, 0.0),
+    # Resultados do passo vetorizado, lidos pelos controladores no mesmo frame
+    'distance': (np.float64, np.inf),
+    'in_range': (np.bool_, False),
+    'stuck': (np.bool_, False),
+    'random_decision': (np.bool_, False),
+    # Alerta vindo de fora (a matilha), marcado até o controlador decidir
+    'alerted': (np.bool_, False),
+    'speed_modifier': (np.float64, 1.0),
+    'quiet': (np.bool_, False),
+    'vx': (np.float64, 0.0),
+    'vy': (np.float64, 0.0),
+    # Agendamento das decisões (DecisionScheduler): vez neste frame e frame da última decisão
+    'granted': (np.bool_, False),
+    'last_decided': (np.int64, 0),
+    # Inimigo fora da atualização neste frame e tempo simulado de quem atualiza (SimulationLOD)
+    'dormant': (np.bool_, False),
+    'elapsed': (np.float64, 0.0),
+}
+
+def _lookup_table(enum, values):
+    table = np.ones(max(member.value for member in enum) + 1, dtype=np.float64)
+    for member, value in values.items():
+        table[member.value] = value
+    return table
+
+_STATE_SPEED = _lookup_table(AIState, STATE_SPEED)
+_PERSONALITY_SPEED = _lookup_table(AIPersonality, PERSONALITY_SPEED)
+
+class BatchField:
+    """
+    Atributo de controlador guardado numa coluna do AIBatch.
+
+    `enum` converte o inteiro da coluna de/para um Enum (o estado da IA).
+    """
+
+    def __init__(self, name, enum=None):
+        self.name = name
+        self.enum = enum
+        self.members = {member.value: member for member in enum} if enum is not None else None
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = obj.batch.columns[self.name].item(obj.slot)
+        if self.members is not None:
+            return self.members[value]
+        return value
+
+    def __set__(self, obj, value):
+        if self.enum is not None:
+            value = value.value
+        obj.batch.columns[self.name][obj.slot] = value
+
+class AIBatch:
+    """
+    Estado escalar de todos os controladores de IA em arrays NumPy (SoA).
+
+    Cada controlador ocupa um slot; seus timers, estado e traços de
+    personalidade são colunas acessadas por BatchField. Uma vez por frame,
+    `update` calcula para todos de uma vez a distância ao jogador, o teste
+    de raio de detecção, os timers e as decisões aleatórias e de "preso";
+    os controladores só leem o resultado do seu slot. Os timers andam pelo
+    tempo que o SimulationLOD simula para cada inimigo no frame; inimigos
+    dormentes não têm a posição lida nem os timers avançados.
+
+    Inimigos "quietos" (vagando, patrulhando ou parados, sem o jogador no
+    raio e sem nenhum timer vencendo) não mudam de decisão de um frame para
+    o outro: o lote já calcula a velocidade deles, e só os demais rodam a
+    máquina de estados em Python. Slots de inimigos mortos (ou de
+    controladores substituídos) são reaproveitados trocando com o último.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.count = 0
+        self.controllers = []
+        self.columns = {name: np.full(capacity, default, dtype=dtype)
+                        for name, (dtype, default) in BATCH_FIELDS.items()}
+        self.player_pos = vec(0, 0)
+        self.rng = np.random.default_rng(random.getrandbits(32))
+
+    def clear(self):
+        for controller in self.controllers:
+            controller.slot = None
+        self.controllers = []
+        self.count = 0
+
+    def register(self, controller, x, y):
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name, (dtype, default) in BATCH_FIELDS.items():
+                column = np.full(self.capacity, default, dtype=dtype)
+                column[:self.count] = self.columns[name][:self.count]
+                self.columns[name] = column
+
+        slot = self.count
+        for name, (dtype, default) in BATCH_FIELDS.items():
+            self.columns[name][slot] = default
+        self.columns['x'][slot] = self.columns['last_x'][slot] = x
+        self.columns['y'][slot] = self.columns['last_y'][slot] = y
+        self.controllers.append(controller)
+        self.count += 1
+        controller.slot = slot
+
+    def _remove(self, slot):
+        removed = self.controllers[slot]
+        last = self.count - 1
+        if slot != last:
+            for column in self.columns.values():
+                column[slot] = column[last]
+            moved = self.controllers[last]
+            self.controllers[slot] = moved
+            moved.slot = slot
+        self.controllers.pop()
+        self.count -= 1
+        removed.slot = None
+
+    def _compact(self):
+        slot = 0
+        while slot < self.count:
+            controller = self.controllers[slot]
+            enemy = controller.enemy
+            if enemy.alive() and enemy.ai_controller is controller:
+                slot += 1
+            else:
+                self._remove(slot)
+
+    def update(self, dt, player_pos):
+        self._compact()
+        self.player_pos = vec(player_pos)
+        n = self.count
+        if n == 0:
+            return
+        c = {name: column[:n] for name, column in self.columns.items()}
+
+        awake = ~c['dormant']
+        step = np.where(awake, c['elapsed'], 0.0)
+        active = np.flatnonzero(awake)
+        controllers = self.controllers
+        enemies = [controllers[slot].enemy for slot in active.tolist()]
+        gathered = np.array([(enemy.position.x, enemy.position.y, enemy.speed) for enemy in enemies],
+                            dtype=np.float64).reshape(len(enemies), 3)
+        c['x'][active] = gathered[:, 0]
+        c['y'][active] = gathered[:, 1]
+        c['speed'][active] = gathered[:, 2]
+        x, y = c['x'], c['y']
+
+        # Preso: andou menos que STUCK_DISTANCE desde a última posição registrada
+        still = np.hypot(x - c['last_x'], y - c['last_y']) < STUCK_DISTANCE
+        c['stuck_timer'][:] = np.where(awake, np.where(still, c['stuck_timer'] + step, 0.0), c['stuck_timer'])
+        moved = awake & ~still
+        c['last_x'][moved] = x[moved]
+        c['last_y'][moved] = y[moved]
+        # "Preso" e a decisão aleatória ficam marcados até o controlador decidir (ele limpa a marca)
+        stuck = awake & (c['stuck_timer'] > STUCK_TIME)
+        c['stuck_timer'][stuck] = 0.0
+        c['stuck'] |= stuck
+
+        confused = c['is_confused']
+        c['confusion_timer'][confused] -= step[confused]
+        c['is_confused'][:] = confused & (c['confusion_timer'] > 0)
+
+        c['distance'][:] = np.hypot(x - self.player_pos.x, y - self.player_pos.y)
+        c['in_range'][:] = c['distance'] < ENEMY_DETECT_RADIUS * c['alertness']
+
+        # Timers que só correm em certos estados
+        idle = c['state'] == AIState.IDLE.value
+        wander = c['state'] == AIState.WANDER.value
+        c['idle_timer'][idle] += step[idle]
+        c['wander_timer'][wander] -= step[wander]
+
+        c['last_decision_time'] += step
+        due = awake & (c['last_decision_time'] >= c['decision_interval'])
+        c['last_decision_time'][due] = 0.0
+        c['decision_interval'][due] = self.rng.uniform(1.0, 4.0, size=int(due.sum()))
+        c['random_decision'] |= due & (self.rng.random(n) < c['random_action_chance'])
+
+        speed = _STATE_SPEED[c['state']] * _PERSONALITY_SPEED[c['personality']]
+        erratic = c['personality'] == AIPersonality.ERRATIC.value
+        speed[erratic] *= self.rng.uniform(0.5, 1.5, size=int(erratic.sum()))
+        c['speed_modifier'][:] = speed
+
+        # Quem segue a mesma decisão do frame anterior: velocidade constante rumo ao ponto atual
+        state = c['state']
+        steer_dx, steer_dy = c['steer_x'] - x, c['steer_y'] - y
+        steer_dist = np.hypot(steer_dx, steer_dy)
+        moving = ((c['goal_radius'] >= 0)
+                  & (np.hypot(c['goal_x'] - x, c['goal_y'] - y) >= c['goal_radius'])
+                  & (steer_dist >= c['steer_radius']) & (steer_dist > 0)
+                  & ((state == AIState.PATROL.value)
+                     | ((state == AIState.WANDER.value) & (c['wander_timer'] > 0))))
+        resting = (state == AIState.IDLE.value) & (c['idle_timer'] <= IDLE_MIN_TIME)
+        c['quiet'][:] = ((moving | resting) & ~c['in_range'] & ~c['stuck']
+                         & ~c['random_decision'] & ~c['alerted'] & ~c['is_confused'])
+
+        scale = np.where(moving, c['speed'] * speed / np.where(steer_dist > 0, steer_dist, 1.0), 0.0)
+        c['vx'][:] = steer_dx * scale
+        c['vy'][:] = steer_dy * scale
+
+    def set_steering(self, slot, goal, goal_radius, steer, steer_radius):
+        """Registra o destino do controlador; goal=None marca que ele não está só andando."""
+        columns = self.columns
+        if goal is None:
+            columns['goal_radius'][slot] = -1.0
+            return
+        columns['goal_x'][slot], columns['goal_y'][slot] = goal
+        columns['goal_radius'][slot] = goal_radius
+        columns['steer_x'][slot], columns['steer_y'][slot] = steer
+        columns['steer_radius'][slot] = steer_radius
@@ -1,31 +1,33 @@
 import pygame
 import random
 import math
-from enum import Enum
 from core.settings import *
+from .states import AIState, AIPersonality, STATE_SPEED, PERSONALITY_SPEED
+from .batch import BatchField
 
 vec = pygame.math.Vector2
 
-class AIState(Enum):
-    IDLE = 1
-    PATROL = 2
-    CHASE = 3
-    ATTACK = 4
-    SEARCH = 5
-    WANDER = 6
-    INVESTIGATE = 7
-
-class AIPersonality(Enum):
-    AGGRESSIVE = 1
-    CAUTIOUS = 2
-    LAZY = 3
-    ERRATIC = 4
-
 class EnhancedAIController:
 
+    # Escalares guardados nas colunas do AIBatch do jogo
+    state = BatchField('state', AIState)
+    personality = BatchField('personality', AIPersonality)
+    alertness = BatchField('alertness')
+    idle_timer = BatchField('idle_timer')
+    wander_timer = BatchField('wander_timer')
+    last_decision_time = BatchField('last_decision_time')
+    decision_interval = BatchField('decision_interval')
+    random_action_chance = BatchField('random_action_chance')
+    is_confused = BatchField('is_confused')
+    confusion_timer = BatchField('confusion_timer')
+    stuck_timer = BatchField('stuck_timer')
+
     def __init__(self, enemy_sprite):
         self.enemy = enemy_sprite
         self.game = enemy_sprite.game
+        self.batch = self.game.ai_batch
+        self.slot = None
+        self.batch.register(self, self.enemy.position.x, self.enemy.position.y)
         self.state = AIState.WANDER
         self.previous_state = AIState.WANDER
 
@@ -57,7 +59,9 @@ class EnhancedAIController:
         self.confusion_timer = 0
         self.last_player_direction = vec(0, 0)
         self.stuck_timer = 0
-        self.last_position = vec(self.enemy.position)
+        self.player_in_sight = False
+        self.path = []
+        self.path_goal = None
 
         self._generate_patrol_points()
         self._set_personality_traits()
@@ -115,60 +119,21 @@ class EnhancedAIController:
         self.last_direction = new_direction
         self.wander_timer = random.uniform(2.0, 8.0)
 
-    def _check_if_stuck(self, dt):
-        current_pos = vec(self.enemy.position)
-        if current_pos.distance_to(self.last_position) < 5:
-            self.stuck_timer += dt
-            if self.stuck_timer > 2.0:
-
-                self.set_new_wander_target()
-                self.stuck_timer = 0
-        else:
-            self.stuck_timer = 0
-            self.last_position = current_pos
-
-    def _should_make_random_decision(self, dt):
-        self.last_decision_time += dt
-        if self.last_decision_time >= self.decision_interval:
-            self.last_decision_time = 0
-            self.decision_interval = random.uniform(1.0, 4.0)
-            return random.random() < self.random_action_chance
-        return False
-
-    def _handle_confusion(self, dt):
+    def _handle_confusion(self):
+        # O AIBatch já descontou o timer e encerrou a confusão vencida
         if self.is_confused:
-            self.confusion_timer -= dt
-            if self.confusion_timer <= 0:
-                self.is_confused = False
-                return False
-
             if random.random() < 0.3:
                 self.set_new_wander_target()
             return True
         return False
 
     def _get_speed_modifier(self):
-        base_modifier = 1.0
-
-        if self.state == AIState.WANDER:
-            base_modifier = 0.4
-        elif self.state == AIState.PATROL:
-            base_modifier = 0.6
-        elif self.state == AIState.SEARCH:
-            base_modifier = 0.8
-        elif self.state == AIState.CHASE:
-            base_modifier = 1.0
-        elif self.state == AIState.INVESTIGATE:
-            base_modifier = 0.5
-        elif self.state == AIState.IDLE:
-            base_modifier = 0.0
+        base_modifier = STATE_SPEED.get(self.state, 1.0)
 
-        if self.personality == AIPersonality.AGGRESSIVE:
-            base_modifier *= 1.2
-        elif self.personality == AIPersonality.LAZY:
-            base_modifier *= 0.7
-        elif self.personality == AIPersonality.ERRATIC:
+        if self.personality == AIPersonality.ERRATIC:
             base_modifier *= random.uniform(0.5, 1.5)
+        else:
+            base_modifier *= PERSONALITY_SPEED.get(self.personality, 1.0)
 
         return base_modifier
 
@@ -192,54 +157,111 @@ class EnhancedAIController:
                 self.search_start_time = pygame.time.get_ticks()
 
     def update(self, dt):
+        # Distância, raio de detecção, timers e decisões já vêm do passo vetorizado do AIBatch
+        batch, slot = self.batch, self.slot
+        if slot is None:
+            return False
+        columns = batch.columns
+        if columns['quiet'].item(slot):
+            self.enemy.velocity = vec(columns['vx'].item(slot), columns['vy'].item(slot))
+            self._refine_velocity()
+            if self.enemy.velocity.x or self.enemy.velocity.y:
+                self.enemy.set_animation('walk')
+            return False
+
+        # Decisões (estado, alvo, percepção) entram no orçamento do DecisionScheduler;
+        # sem vez neste frame, o inimigo segue com a velocidade que já tinha
+        scheduler = self.game.ai_scheduler
+        if not scheduler.should_decide(batch, slot):
+            return False
+        started = scheduler.begin_decision()
+        should_attack = self._decide(dt)
+        scheduler.end_decision(batch, self.slot, started)
+        self._refine_velocity()
+        return should_attack
+
+    def _refine_velocity(self):
+        """Ajuste da velocidade recém-escolhida; frames sem decisão mantêm a anterior intacta."""
+        pass
+
+    def _decide(self, dt):
+        batch, slot = self.batch, self.slot
+        columns = batch.columns
         now = pygame.time.get_ticks()
-        player_pos = vec(self.game.player.position)
-        enemy_pos = vec(self.enemy.position)
-        distance_to_player = enemy_pos.distance_to(player_pos)
+        player_pos = batch.player_pos
+        enemy_pos = self.enemy.position
+        distance_to_player = columns['distance'].item(slot)
 
-        self._check_if_stuck(dt)
+        if columns['stuck'].item(slot):
+            columns['stuck'][slot] = False
+            self.set_new_wander_target()
+            self.path_goal = None
 
-        if self._handle_confusion(dt):
+        if self._handle_confusion():
             return False
 
-        detection_radius = ENEMY_DETECT_RADIUS * self.alertness
-        can_see_player = distance_to_player < detection_radius
+        can_see_player = columns['in_range'].item(slot) and self._has_line_of_sight(enemy_pos, player_pos)
 
-        if self._should_make_random_decision(dt):
+        speed_modifier = columns['speed_modifier'].item(slot)
+        if columns['random_decision'].item(slot):
+            columns['random_decision'][slot] = False
             self._make_random_decision()
+            speed_modifier = self._get_speed_modifier()
 
         new_velocity = vec(0, 0)
         should_attack = False
+        state = self.state
 
-        if self.state == AIState.IDLE:
+        if state == AIState.IDLE:
             self._handle_idle_state(dt, can_see_player, player_pos)
 
-        elif self.state == AIState.WANDER:
+        elif state == AIState.WANDER:
             new_velocity = self._handle_wander_state(dt, can_see_player, player_pos, enemy_pos)
 
-        elif self.state == AIState.PATROL:
+        elif state == AIState.PATROL:
             new_velocity = self._handle_patrol_state(dt, can_see_player, player_pos, enemy_pos)
 
-        elif self.state == AIState.INVESTIGATE:
+        elif state == AIState.INVESTIGATE:
             new_velocity = self._handle_investigate_state(dt, can_see_player, player_pos, enemy_pos)
 
-        elif self.state == AIState.SEARCH:
+        elif state == AIState.SEARCH:
             new_velocity = self._handle_search_state(dt, can_see_player, player_pos, enemy_pos, now)
 
-        elif self.state == AIState.CHASE:
+        elif state == AIState.CHASE:
             new_velocity = self._handle_chase_state(dt, can_see_player, player_pos, enemy_pos, distance_to_player, now)
 
-        elif self.state == AIState.ATTACK:
+        elif state == AIState.ATTACK:
             should_attack = self._handle_attack_state(dt, can_see_player, player_pos, enemy_pos, distance_to_player, now)
 
-        speed_modifier = self._get_speed_modifier()
+        # Quem muda de estado no handler volta parado, então o multiplicador do lote basta
         self.enemy.velocity = new_velocity * speed_modifier
+        self._record_steering()
 
         return should_attack
 
-    def _handle_idle_state(self, dt, can_see_player, player_pos):
-        self.idle_timer += dt
+    def _record_steering(self):
+        state = self.state
+        if state == AIState.WANDER and self.target_position is not None:
+            self.batch.set_steering(self.slot, self.target_position, 20, self.target_position, 0)
+        elif state == AIState.PATROL and self.patrol_points:
+            goal = self.patrol_points[self.current_patrol_index]
+            if self.path and self.path_goal == (int(goal.x // TILE_SIZE), int(goal.y // TILE_SIZE)):
+                self.batch.set_steering(self.slot, goal, 30, self.path[-1], TILE_SIZE / 2)
+            else:
+                self.batch.set_steering(self.slot, goal, 30, goal, 0)
+        else:
+            self.batch.set_steering(self.slot, None, 0, None, 0)
+
+    def _has_line_of_sight(self, enemy_pos, player_pos):
+        line_of_sight = getattr(self.game, 'line_of_sight', None)
+        if line_of_sight is None:
+            return True
+        # Sem orçamento de raios neste frame, mantém o que já sabia
+        self.player_in_sight = line_of_sight.can_see(enemy_pos.x, enemy_pos.y, player_pos.x, player_pos.y,
+                                                     default=self.player_in_sight)
+        return self.player_in_sight
 
+    def _handle_idle_state(self, dt, can_see_player, player_pos):
         if can_see_player and random.random() < self.alertness:
             self.state = AIState.CHASE
             self.last_known_player_pos = player_pos
@@ -259,8 +281,6 @@ class EnhancedAIController:
                 self.last_known_player_pos = player_pos
             return vec(0, 0)
 
-        self.wander_timer -= dt
-
         if self.target_position:
             direction = self.target_position - enemy_pos
             if direction.length() < 20 or self.wander_timer <= 0:
@@ -295,7 +315,7 @@ class EnhancedAIController:
                     self.state = AIState.IDLE
                     return vec(0, 0)
             else:
-                return direction.normalize() * self.enemy.speed
+                return self._path_direction(target, enemy_pos).normalize() * self.enemy.speed
         else:
             self.state = AIState.WANDER
 
@@ -321,7 +341,7 @@ class EnhancedAIController:
                 self.search_start_time = pygame.time.get_ticks()
                 return vec(0, 0)
             else:
-                return direction.normalize() * self.enemy.speed * 0.7
+                return self._path_direction(self.target_position, enemy_pos).normalize() * self.enemy.speed * 0.7
         else:
             self.state = AIState.WANDER
 
@@ -348,7 +368,7 @@ class EnhancedAIController:
             if direction.length() < 30:
                 self.set_new_wander_target()
             else:
-                return direction.normalize() * self.enemy.speed * 0.8
+                return self._path_direction(self.target_position, enemy_pos).normalize() * self.enemy.speed * 0.8
 
         return vec(0, 0)
 
@@ -367,7 +387,7 @@ class EnhancedAIController:
 
         self.last_known_player_pos = player_pos
 
-        direction = player_pos - enemy_pos
+        direction = self._pursuit_direction(player_pos, enemy_pos)
 
         if self.personality == AIPersonality.ERRATIC:
 
@@ -381,6 +401,39 @@ class EnhancedAIController:
 
         return direction.normalize() * self.enemy.speed
 
+    def _path_direction(self, target, enemy_pos):
+        direction = target - enemy_pos
+        pathfinder = getattr(self.game, 'pathfinder', None)
+        if pathfinder is None:
+            return direction
+
+        # Replaneja só quando o alvo muda de tile; o caminho fica invertido para consumir com pop()
+        goal = (int(target.x // TILE_SIZE), int(target.y // TILE_SIZE))
+        if goal != self.path_goal:
+            self.path_goal = goal
+            path = pathfinder.find_path(enemy_pos.x, enemy_pos.y, target.x, target.y)
+            self.path = [vec(point) for point in reversed(path)] if path else []
+
+        while self.path and enemy_pos.distance_to(self.path[-1]) < TILE_SIZE / 2:
+            self.path.pop()
+        if not self.path:
+            return direction
+        step = self.path[-1] - enemy_pos
+        return step if step.length() > 0 else direction
+
+    def _pursuit_direction(self, player_pos, enemy_pos):
+        direction = player_pos - enemy_pos
+        flow_field = getattr(self.game, 'flow_field', None)
+        if flow_field is None or direction.length() < TILE_SIZE * 2:
+            return direction
+
+        # Segue o campo de fluxo compartilhado para contornar obstáculos
+        waypoint = flow_field.next_waypoint(enemy_pos.x, enemy_pos.y)
+        if waypoint is None:
+            return direction
+        step = vec(waypoint) - enemy_pos
+        return step if step.length() > 0 else direction
+
     def _handle_attack_state(self, dt, can_see_player, player_pos, enemy_pos, distance_to_player, now):
         self.enemy.set_animation('attack')
 
@@ -438,6 +491,32 @@ class EnhancedWildDogAI(EnhancedAIController):
             self.enemy.attack()
         return should_attack
 
+    def _refine_velocity(self):
+        # Só sobre a velocidade nova; repetir em frames adiados acumularia o ajuste
+        pack = getattr(self.enemy, 'pack', None)
+        if pack is not None:
+            pack.flock(self.enemy)
+
+    def _decide(self, dt):
+        pack = getattr(self.enemy, 'pack', None)
+        if pack is not None:
+            self.batch.columns['alerted'][self.slot] = False
+            pack.share_alert(self, pygame.time.get_ticks())
+        return super()._decide(dt)
+
+    def _has_line_of_sight(self, enemy_pos, player_pos):
+        pack = getattr(self.enemy, 'pack', None)
+        if pack is None:
+            return super()._has_line_of_sight(enemy_pos, player_pos)
+        self.player_in_sight = pack.can_see(enemy_pos, player_pos)
+        return self.player_in_sight
+
+    def alert_damage(self, source_pos):
+        super().alert_damage(source_pos)
+        pack = getattr(self.enemy, 'pack', None)
+        if pack is not None:
+            pack.alert(source_pos)
+
     def _handle_chase_state(self, dt, can_see_player, player_pos, enemy_pos, distance_to_player, now):
         base_velocity = super()._handle_chase_state(dt, can_see_player, player_pos, enemy_pos, distance_to_player, now)
 
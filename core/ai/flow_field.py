@@ -0,0 +1,137 @@
+import heapq
+import math
+import numpy as np
+from core.settings import TILE_SIZE
+from core.collision import NEIGHBORS_8
+
+FLOW_FIELD_RADIUS = 24
+# Inimigos ocupam ~2 tiles; um tile só entra no campo com essa folga livre em volta
+FLOW_FIELD_CLEARANCE = 1
+
+class FlowField:
+    """
+    Campo de fluxo compartilhado em direção a um alvo (o jogador).
+
+    Um Dijkstra parte do tile do alvo pela grade caminhável, até
+    FLOW_FIELD_RADIUS tiles, e só é refeito quando o alvo muda de tile ou a
+    grade de colisão muda. Cada inimigo só lê o próximo passo do seu tile,
+    memorizado até o campo ser refeito, então o custo não cresce com o
+    número de perseguidores.
+    """
+
+    def __init__(self, collision, radius=FLOW_FIELD_RADIUS, clearance=FLOW_FIELD_CLEARANCE):
+        self.collision = collision
+        self.radius = radius
+        self.clearance = clearance
+        self.width = collision.width
+        self.height = collision.height
+
+        self.target = None
+        self.stale = True
+        self.grid_version = None
+        self.walkable = None
+        self.dist = None
+        self.steps = {}
+        self.builds = 0
+
+    def set_target(self, px, py):
+        """Atualiza o alvo (em pixels). O campo só é marcado para refazer se o tile mudou."""
+        target = (int(px // TILE_SIZE), int(py // TILE_SIZE))
+        if target != self.target:
+            self.target = target
+            self.stale = True
+
+    def _build_walkable(self):
+        # Borda de um tile não caminhável, para o Dijkstra não checar limites
+        walkable = np.zeros((self.height + 2, self.width + 2), dtype=np.uint8)
+        walkable[1:-1, 1:-1] = self.collision.clearance_mask(self.clearance)
+        self.walkable = bytearray(walkable.tobytes())
+        self.grid_version = self.collision.version
+
+    def _index(self, x, y):
+        return (y + 1) * (self.width + 2) + x + 1
+
+    def _build(self):
+        if self.grid_version != self.collision.version or self.walkable is None:
+            self._build_walkable()
+        self.stale = False
+        self.steps = {}
+        self.builds += 1
+
+        width, height = self.width, self.height
+        stride = width + 2
+        self.dist = dist = [math.inf] * (stride * (height + 2))
+        goal_x, goal_y = self.target
+        if not (0 <= goal_x < width and 0 <= goal_y < height):
+            return
+
+        # Perto do alvo basta o tile estar livre: o jogador pode estar encostado numa parede
+        walkable = bytearray(self.walkable)
+        blocked = self.collision.blocked
+        r = self.clearance
+        for y in range(max(0, goal_y - r), min(height, goal_y + r + 1)):
+            for x in range(max(0, goal_x - r), min(width, goal_x + r + 1)):
+                if not blocked[y * width + x]:
+                    walkable[self._index(x, y)] = 1
+
+        # (delta do vizinho, custo, deltas ortogonais que uma diagonal não pode cortar)
+        neighbors = [(dy * stride + dx, cost, dx, dy * stride) for dx, dy, cost in NEIGHBORS_8]
+
+        start = self._index(goal_x, goal_y)
+        dist[start] = 0.0
+        heap = [(0.0, start)]
+        max_cost = self.radius
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while heap:
+            d, i = heappop(heap)
+            if d > dist[i] or d >= max_cost:
+                continue
+            for delta, cost, ox, oy in neighbors:
+                j = i + delta
+                if not walkable[j]:
+                    continue
+                # Sem cortar quinas na diagonal
+                if ox and oy and not (walkable[i + ox] and walkable[i + oy]):
+                    continue
+                nd = d + cost
+                if nd < dist[j]:
+                    dist[j] = nd
+                    heappush(heap, (nd, j))
+
+    def _step_from(self, i):
+        dist = self.dist
+        stride = self.width + 2
+        best, best_dist = None, dist[i]
+        for dx, dy, _ in NEIGHBORS_8:
+            j = i + dy * stride + dx
+            if dx and dy and (dist[i + dx] == math.inf or dist[i + dy * stride] == math.inf):
+                continue
+            if dist[j] < best_dist:
+                best, best_dist = j, dist[j]
+        return best
+
+    def next_waypoint(self, px, py):
+        """
+        Centro (em pixels) do próximo tile no caminho até o alvo, ou None se
+        (px, py) está fora do campo ou já no tile do alvo.
+        """
+        if self.target is None:
+            return None
+        if self.stale or self.grid_version != self.collision.version:
+            self._build()
+
+        x, y = int(px // TILE_SIZE), int(py // TILE_SIZE)
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        i = self._index(x, y)
+        if i in self.steps:
+            step = self.steps[i]
+        else:
+            step = self._step_from(i)
+            self.steps[i] = step
+        if step is None:
+            return None
+
+        stride = self.width + 2
+        half = TILE_SIZE / 2
+        return ((step % stride - 1) * TILE_SIZE + half, (step // stride - 1) * TILE_SIZE + half)
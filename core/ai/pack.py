@@ -0,0 +1,116 @@
+import pygame
+from core.settings import TILE_SIZE, ENEMY_SEARCH_DURATION
+from .states import AIState
+
+vec = pygame.math.Vector2
+
+PACK_NEIGHBOR_RADIUS = TILE_SIZE * 4
+PACK_SEPARATION_RADIUS = TILE_SIZE * 1.5
+SEPARATION_WEIGHT = 1.5
+ALIGNMENT_WEIGHT = 0.3
+COHESION_WEIGHT = 0.4
+# Estados em que um membro ainda não reagiu ao alerta da matilha
+CALM_STATES = (AIState.IDLE, AIState.WANDER, AIState.PATROL)
+
+class Pack:
+    """
+    Matilha de cães selvagens com um quadro-negro compartilhado.
+
+    A percepção é feita uma vez por frame pela matilha: o primeiro membro que
+    decide lança o raio de visão e os outros reaproveitam o resultado. Quem vê
+    o jogador (ou leva dano) alerta a matilha com a última posição conhecida;
+    os membros ainda calmos vão procurar ali na próxima decisão.
+
+    Os membros ficam no sprite (WildDog.pack), não no controlador, porque o
+    controlador pode ser recriado depois do spawn. Vizinhos para o flocking
+    vêm do broadphase, sem varrer todos os pares.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.members = []
+
+        self.perceived_frame = None
+        self.player_in_sight = False
+        self.last_known_player_pos = None
+        self.alert_time = None
+
+    def add(self, dog):
+        dog.pack = self
+        self.members.append(dog)
+
+    def can_see(self, enemy_pos, player_pos):
+        """Visão do jogador pela matilha, calculada no máximo uma vez por frame."""
+        frame = self.game.ai_scheduler.frame
+        if self.perceived_frame != frame:
+            self.perceived_frame = frame
+            line_of_sight = getattr(self.game, 'line_of_sight', None)
+            if line_of_sight is None:
+                self.player_in_sight = True
+            else:
+                self.player_in_sight = line_of_sight.can_see(enemy_pos.x, enemy_pos.y, player_pos.x, player_pos.y,
+                                                             default=self.player_in_sight)
+            if self.player_in_sight:
+                self.alert(player_pos)
+        return self.player_in_sight
+
+    def alert(self, position):
+        now = pygame.time.get_ticks()
+        was_alerted = self.is_alerted(now)
+        self.last_known_player_pos = vec(position)
+        self.alert_time = now
+        if was_alerted:
+            return
+        # Acorda os membros no AIBatch para decidirem mesmo se estavam quietos
+        columns = self.game.ai_batch.columns
+        for dog in self.members:
+            controller = dog.ai_controller
+            if dog.alive() and controller is not None and getattr(controller, 'slot', None) is not None:
+                columns['alerted'][controller.slot] = True
+
+    def is_alerted(self, now):
+        return self.alert_time is not None and now - self.alert_time < ENEMY_SEARCH_DURATION
+
+    def share_alert(self, controller, now):
+        """Leva um membro calmo a procurar na última posição conhecida pela matilha."""
+        if controller.state in CALM_STATES and self.is_alerted(now):
+            controller.state = AIState.SEARCH
+            controller.target_position = vec(self.last_known_player_pos)
+            controller.search_start_time = now
+
+    def flock(self, dog):
+        """Separação, alinhamento e coesão aplicados à velocidade já escolhida pelo controlador."""
+        position = dog.position
+        separation = vec(0, 0)
+        heading = vec(0, 0)
+        center = vec(0, 0)
+        mates = 0
+        for other in self.game.broadphase.query_radius('enemies', position.x, position.y, PACK_NEIGHBOR_RADIUS):
+            if other is dog:
+                continue
+            offset = position - other.position
+            distance = offset.length()
+            if 0 < distance < PACK_SEPARATION_RADIUS:
+                separation += offset / distance * (1 - distance / PACK_SEPARATION_RADIUS)
+            if getattr(other, 'pack', None) is self:
+                heading += other.velocity
+                center += other.position
+                mates += 1
+
+        if separation.length_squared() == 0 and mates == 0:
+            return
+
+        velocity = vec(dog.velocity)
+        velocity += separation * dog.speed * SEPARATION_WEIGHT
+        # Parado, só se afasta de quem está colado nele (a meia velocidade);
+        # alinhamento e coesão valem para quem já anda e nunca o aceleram
+        moving = dog.velocity.length_squared() > 0
+        if mates and moving:
+            velocity += (heading / mates - dog.velocity) * ALIGNMENT_WEIGHT
+            to_center = center / mates - position
+            if to_center.length() > PACK_SEPARATION_RADIUS:
+                velocity += to_center.normalize() * dog.speed * COHESION_WEIGHT
+        limit = dog.velocity.length() if moving else dog.speed * 0.5
+        if velocity.length() > limit:
+            velocity.scale_to_length(limit)
+        dog.velocity = velocity
@@ -0,0 +1,340 @@
+import heapq
+import math
+from collections import OrderedDict
+from core.settings import TILE_SIZE
+from core.collision import NEIGHBORS_8
+
+CLUSTER_TILES = 10
+# Aberturas a partir desta largura ganham duas transições, uma em cada ponta
+WIDE_ENTRANCE = 6
+PATH_CACHE_SIZE = 256
+PATH_CLEARANCE = 1
+SNAP_RADIUS = 2
+# Rota do cache só é reaproveitada se custar até isso vezes a distância octil entre os extremos
+PATH_CACHE_SLACK = 1.2
+
+_GOAL = None
+
+def octile(ax, ay, bx, by):
+    dx, dy = abs(ax - bx), abs(ay - by)
+    return max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
+
+def _reverse(start, path):
+    """Inverte um trecho que sai de `start` (exclusive) e termina no último tile (inclusive)."""
+    return path[-2::-1] + [start]
+
+class HierarchicalPathfinder:
+    """
+    A* hierárquico (HPA*) sobre clusters de CLUSTER_TILES × CLUSTER_TILES tiles.
+
+    Na construção, as aberturas entre clusters vizinhos viram nós de um grafo
+    abstrato; nós do mesmo cluster são ligados pelo custo (e o trecho) do
+    caminho dentro do cluster. Uma consulta liga início e destino aos nós dos
+    seus clusters, busca no grafo abstrato e refina emendando os trechos já
+    guardados. A rota abstrata fica em cache por (cluster de início, cluster
+    de destino) e é reaproveitada por outros inimigos que saem e chegam nos
+    mesmos clusters, desde que o caminho refinado não passe de
+    PATH_CACHE_SLACK vezes a distância octil entre início e destino; acima
+    disso a rota é buscada de novo, para ninguém fazer um desvio visível.
+
+    Usa a mesma folga do FlowField: só tiles onde o corpo de um inimigo cabe.
+    """
+
+    def __init__(self, collision, cluster_tiles=CLUSTER_TILES, clearance=PATH_CLEARANCE,
+                 cache_size=PATH_CACHE_SIZE):
+        self.collision = collision
+        self.cluster_tiles = cluster_tiles
+        self.clearance = clearance
+        self.cache_size = cache_size
+        self.width = collision.width
+        self.height = collision.height
+
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.build()
+
+    def build(self):
+        """(Re)constrói o grafo abstrato a partir da grade de colisão atual."""
+        self.walkable = bytearray(self.collision.clearance_mask(self.clearance).astype('uint8').tobytes())
+        self.grid_version = self.collision.version
+        self.edges = {}
+        self.cluster_nodes = {}
+        self.cluster_grids = {}
+        self.links = OrderedDict()
+        self.cache.clear()
+
+        self._find_entrances()
+        for cluster, nodes in self.cluster_nodes.items():
+            for index, node in enumerate(nodes):
+                for other, (cost, path) in self._search(node, cluster, nodes[index + 1:]).items():
+                    self._link(node, other, cost, path)
+
+    def _cluster_of(self, x, y):
+        return (x // self.cluster_tiles, y // self.cluster_tiles)
+
+    def _cluster_grid(self, cluster):
+        """
+        Cópia do cluster com borda de um tile não caminhável, como bytearray
+        plano: buscas internas andam por índice sem checar limites.
+        """
+        grid = self.cluster_grids.get(cluster)
+        if grid is None:
+            c = self.cluster_tiles
+            grid = self._window_grid(cluster[0] * c, cluster[1] * c, cluster[0] * c + c, cluster[1] * c + c)
+            self.cluster_grids[cluster] = grid
+        return grid
+
+    def _window_grid(self, x0, y0, x1, y1):
+        """Como _cluster_grid, para o retângulo de tiles [x0, x1) × [y0, y1)."""
+        x1, y1 = min(self.width, x1), min(self.height, y1)
+        stride = x1 - x0 + 2
+        cells = bytearray(stride * (y1 - y0 + 2))
+        for y in range(y0, y1):
+            row = (y - y0 + 1) * stride + 1
+            cells[row:row + x1 - x0] = self.walkable[y * self.width + x0:y * self.width + x1]
+        neighbors = [(dy * stride + dx, cost, dx, dy * stride) for dx, dy, cost in NEIGHBORS_8]
+        return (x0, y0, stride, cells, neighbors)
+
+    def _is_walkable(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.walkable[y * self.width + x] == 1
+
+    def _add_node(self, tile):
+        if tile not in self.edges:
+            self.edges[tile] = {}
+            self.cluster_nodes.setdefault(self._cluster_of(*tile), []).append(tile)
+
+    def _link(self, a, b, cost, path):
+        self.edges[a][b] = (cost, path)
+        self.edges[b][a] = (cost, _reverse(a, path))
+
+    def _find_entrances(self):
+        c = self.cluster_tiles
+        for border_x in range(c, self.width, c):
+            for y0 in range(0, self.height, c):
+                self._scan_border([((border_x - 1, y), (border_x, y))
+                                   for y in range(y0, min(y0 + c, self.height))])
+        for border_y in range(c, self.height, c):
+            for x0 in range(0, self.width, c):
+                self._scan_border([((x, border_y - 1), (x, border_y))
+                                   for x in range(x0, min(x0 + c, self.width))])
+
+    def _scan_border(self, pairs):
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and self._is_walkable(*a) and self._is_walkable(*b):
+                run.append((a, b))
+                continue
+            if run:
+                if len(run) < WIDE_ENTRANCE:
+                    transitions = [run[len(run) // 2]]
+                else:
+                    transitions = [run[0], run[-1]]
+                for inside, outside in transitions:
+                    self._add_node(inside)
+                    self._add_node(outside)
+                    self._link(inside, outside, 1.0, [outside])
+                run = []
+
+    def _search(self, start, cluster, targets, goal=None, grid=None):
+        """
+        Dijkstra (A* rumo a `goal`, se dado) de `start` sem sair de `cluster`
+        (ou da janela `grid`, de _window_grid).
+
+        Retorna {alvo: (custo, trecho)} para cada tile de `targets` alcançado;
+        o trecho exclui `start` e inclui o alvo.
+        """
+        x0, y0, stride, cells, neighbors = grid or self._cluster_grid(cluster)
+        source = (start[1] - y0 + 1) * stride + start[0] - x0 + 1
+        wanted = {(y - y0 + 1) * stride + x - x0 + 1: (x, y) for x, y in targets}
+        remaining = len(wanted)
+        if goal is not None:
+            goal_x, goal_y = goal[0] - x0 + 1, goal[1] - y0 + 1
+
+        dist = [math.inf] * len(cells)
+        parent = [-1] * len(cells)
+        dist[source] = 0.0
+        heap = [(0.0, 0.0, source)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        while heap and remaining:
+            _, d, i = heappop(heap)
+            if d > dist[i]:
+                continue
+            if i in wanted:
+                remaining -= 1
+            for delta, cost, ox, oy in neighbors:
+                j = i + delta
+                if not cells[j]:
+                    continue
+                # Sem cortar quinas na diagonal
+                if ox and oy and not (cells[i + ox] and cells[i + oy]):
+                    continue
+                nd = d + cost
+                if nd < dist[j]:
+                    dist[j] = nd
+                    parent[j] = i
+                    if goal is None:
+                        heappush(heap, (nd, nd, j))
+                    else:
+                        heappush(heap, (nd + octile(j % stride, j // stride, goal_x, goal_y), nd, j))
+
+        found = {}
+        for index, tile in wanted.items():
+            if index == source or dist[index] == math.inf:
+                continue
+            path = []
+            i = index
+            while i != source:
+                path.append((i % stride - 1 + x0, i // stride - 1 + y0))
+                i = parent[i]
+            path.reverse()
+            found[tile] = (dist[index], path)
+        return found
+
+    def _snap(self, x, y):
+        """O próprio tile se for caminhável, senão o caminhável mais próximo até SNAP_RADIUS."""
+        if self._is_walkable(x, y):
+            return (x, y)
+        best, best_dist = None, math.inf
+        for dy in range(-SNAP_RADIUS, SNAP_RADIUS + 1):
+            for dx in range(-SNAP_RADIUS, SNAP_RADIUS + 1):
+                d = dx * dx + dy * dy
+                if d < best_dist and self._is_walkable(x + dx, y + dy):
+                    best, best_dist = (x + dx, y + dy), d
+        return best
+
+    def _connect(self, tile):
+        """Custos e trechos de `tile` até cada nó abstrato do seu cluster, memorizados por tile."""
+        links = self.links.get(tile)
+        if links is not None:
+            self.links.move_to_end(tile)
+            return links
+
+        cluster = self._cluster_of(*tile)
+        nodes = self.cluster_nodes.get(cluster, [])
+        links = self._search(tile, cluster, nodes)
+        if tile in nodes:
+            links[tile] = (0.0, [])
+        self.links[tile] = links
+        if len(self.links) > self.cache_size * 4:
+            self.links.popitem(last=False)
+        return links
+
+    def _abstract_search(self, start_links, goal_links, goal):
+        """A* no grafo abstrato; retorna a lista de nós do primeiro ao último, ou None."""
+        g_score = {}
+        came_from = {}
+        heap = []
+        # O contador desempata na heap, já que o nó-destino (None) não se compara com tuplas
+        counter = 0
+        for node, (cost, _) in start_links.items():
+            g_score[node] = cost
+            came_from[node] = None
+            counter += 1
+            heapq.heappush(heap, (cost + octile(*node, *goal), counter, cost, node))
+
+        while heap:
+            _, _, g, node = heapq.heappop(heap)
+            if node is _GOAL:
+                break
+            if g > g_score.get(node, math.inf):
+                continue
+            neighbors = [(other, cost) for other, (cost, _) in self.edges[node].items()]
+            if node in goal_links:
+                neighbors.append((_GOAL, goal_links[node][0]))
+            for other, cost in neighbors:
+                ng = g + cost
+                if ng < g_score.get(other, math.inf):
+                    g_score[other] = ng
+                    came_from[other] = node
+                    counter += 1
+                    heapq.heappush(heap, (ng + (0.0 if other is _GOAL else octile(*other, *goal)), counter, ng, other))
+        else:
+            return None
+
+        route = [came_from[_GOAL]]
+        while came_from[route[-1]] is not None:
+            route.append(came_from[route[-1]])
+        route.reverse()
+        return route
+
+    def _route_cost(self, start_links, route, goal_links):
+        cost = start_links[route[0]][0] + goal_links[route[-1]][0]
+        for a, b in zip(route, route[1:]):
+            cost += self.edges[a][b][0]
+        return cost
+
+    def _refine(self, start_links, route, goal_links):
+        tiles = list(start_links[route[0]][1])
+        for a, b in zip(route, route[1:]):
+            tiles.extend(self.edges[a][b][1])
+        tiles.extend(goal_links[route[-1]][1])
+        return tiles
+
+    def find_tiles(self, start, goal):
+        """Caminho de tiles de `start` até `goal` (sem o tile inicial), ou None."""
+        if self.grid_version != self.collision.version:
+            self.build()
+
+        start = self._snap(*start)
+        goal = self._snap(*goal)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return []
+
+        start_cluster = self._cluster_of(*start)
+        goal_cluster = self._cluster_of(*goal)
+        if start_cluster == goal_cluster:
+            local = self._search(start, start_cluster, [goal], goal)
+            if goal in local:
+                return local[goal][1]
+
+        start_links = self._connect(start)
+        # O grafo é simétrico: trechos do destino até os nós, invertidos, levam ao destino
+        goal_links = {node: (cost, _reverse(goal, path) if path else [])
+                      for node, (cost, path) in self._connect(goal).items()}
+        if not start_links or not goal_links:
+            return None
+
+        key = (start_cluster, goal_cluster)
+        cached = self.cache.get(key)
+        route = None
+        if cached is not None and cached[0] in start_links and cached[-1] in goal_links:
+            if self._route_cost(start_links, cached, goal_links) <= PATH_CACHE_SLACK * octile(*start, *goal):
+                route = cached
+                self.cache.move_to_end(key)
+                self.hits += 1
+        if route is None:
+            self.misses += 1
+            route = self._abstract_search(start_links, goal_links, goal)
+            if route is None:
+                return None
+            self.cache[key] = route
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+            # Entre clusters vizinhos, passar pelas transições pode dar uma volta grande; busca direta na janela dos dois
+            bound = PATH_CACHE_SLACK * octile(*start, *goal)
+            cost = self._route_cost(start_links, route, goal_links)
+            if (cost > bound and abs(start_cluster[0] - goal_cluster[0]) <= 1
+                    and abs(start_cluster[1] - goal_cluster[1]) <= 1):
+                c = self.cluster_tiles
+                window = self._window_grid(min(start_cluster[0], goal_cluster[0]) * c,
+                                           min(start_cluster[1], goal_cluster[1]) * c,
+                                           (max(start_cluster[0], goal_cluster[0]) + 1) * c,
+                                           (max(start_cluster[1], goal_cluster[1]) + 1) * c)
+                local = self._search(start, None, [goal], goal, window)
+                if goal in local and local[goal][0] < cost:
+                    return local[goal][1]
+
+        return self._refine(start_links, route, goal_links)
+
+    def find_path(self, x0, y0, x1, y1):
+        """Caminho em pixels (centros de tiles) de (x0, y0) até (x1, y1), ou None."""
+        tiles = self.find_tiles((int(x0 // TILE_SIZE), int(y0 // TILE_SIZE)),
+                                (int(x1 // TILE_SIZE), int(y1 // TILE_SIZE)))
+        if tiles is None:
+            return None
+        half = TILE_SIZE / 2
+        return [(x * TILE_SIZE + half, y * TILE_SIZE + half) for x, y in tiles]
@@ -0,0 +1,67 @@
+from core.settings import TILE_SIZE
+
+LOS_RAYS_PER_FRAME = 24
+LOS_CACHE_SIZE = 4096
+
+class LineOfSight:
+    """
+    Linha de visão entre tiles, com cache e orçamento de raios por frame.
+
+    O resultado é memorizado por par (tile de origem, tile de destino): um
+    inimigo parado olhando um jogador parado não lança raio nenhum, e um
+    novo raio só sai quando um dos dois muda de tile. O cache é descartado
+    quando a grade de colisão muda. Se o orçamento do frame acabar, quem
+    pergunta recebe o valor `default` (normalmente o que já sabia) e tenta
+    de novo no próximo frame.
+    """
+
+    def __init__(self, collision, ray_budget=LOS_RAYS_PER_FRAME, max_entries=LOS_CACHE_SIZE):
+        self.collision = collision
+        self.ray_budget = ray_budget
+        self.max_entries = max_entries
+        self.cache = {}
+        self.grid_version = collision.version
+
+        self.rays_left = ray_budget
+        self.rays_cast = 0
+        self.hits = 0
+        self.deferred = 0
+
+    def begin_frame(self):
+        self.rays_left = self.ray_budget
+        self.rays_cast = 0
+        self.hits = 0
+        self.deferred = 0
+
+    def clear(self):
+        self.cache.clear()
+
+    def can_see(self, x0, y0, x1, y1, default=False):
+        """O tile de (x0, y0) enxerga o tile de (x1, y1)? Coordenadas em pixels."""
+        if self.collision.version != self.grid_version:
+            self.cache.clear()
+            self.grid_version = self.collision.version
+
+        from_x, from_y = int(x0 // TILE_SIZE), int(y0 // TILE_SIZE)
+        to_x, to_y = int(x1 // TILE_SIZE), int(y1 // TILE_SIZE)
+        key = (from_x, from_y, to_x, to_y)
+        visible = self.cache.get(key)
+        if visible is not None:
+            self.hits += 1
+            return visible
+
+        if self.rays_left <= 0:
+            self.deferred += 1
+            return default
+        self.rays_left -= 1
+        self.rays_cast += 1
+
+        # Raio entre os centros dos tiles, para o resultado valer para o par inteiro
+        half = TILE_SIZE / 2
+        visible = self.collision.raycast(from_x * TILE_SIZE + half, from_y * TILE_SIZE + half,
+                                         to_x * TILE_SIZE + half, to_y * TILE_SIZE + half) is None
+
+        if len(self.cache) >= self.max_entries:
+            self.cache.clear()
+        self.cache[key] = visible
+        return visible
@@ -0,0 +1,74 @@
+import time
+import numpy as np
+
+AI_DECISION_BUDGET_MS = 2.0
+# Nenhum inimigo fica mais que isso sem decidir, mesmo com o orçamento estourado
+AI_MAX_DECISION_WAIT = 10
+
+class DecisionScheduler:
+    """
+    Reparte as decisões da IA entre frames sob um orçamento em milissegundos.
+
+    A cada frame, os inimigos que precisam decidir (os que o AIBatch não
+    marcou como quietos) entram numa fila ordenada pelo frame da última
+    decisão, em rodízio. Recebem vez tantos quanto cabem no orçamento pelo
+    custo médio medido de uma decisão; os demais só mantêm a velocidade
+    atual e decidem num dos próximos frames. Quem esperou
+    AI_MAX_DECISION_WAIT frames decide de qualquer jeito. Cada inimigo
+    decide no máximo uma vez por frame, mesmo atualizado em vários passos.
+    """
+
+    def __init__(self, budget_ms=AI_DECISION_BUDGET_MS, max_wait=AI_MAX_DECISION_WAIT):
+        self.budget = budget_ms / 1000
+        self.max_wait = max_wait
+        self.frame = 0
+        self.average_cost = 0.00005
+        self.spent = 0.0
+
+        self.decided = 0
+        self.deferred = 0
+
+    def begin_frame(self, batch):
+        self.frame += 1
+        self.spent = 0.0
+        self.decided = 0
+        self.deferred = 0
+
+        n = batch.count
+        columns = batch.columns
+        granted = columns['granted'][:n]
+        granted[:] = False
+        pending = np.flatnonzero(~columns['quiet'][:n] & ~columns['dormant'][:n])
+        if not len(pending):
+            return
+
+        last_decided = columns['last_decided'][:n]
+        order = pending[np.argsort(last_decided[pending], kind='stable')]
+        allowed = max(1, int(self.budget / self.average_cost))
+        granted[order[:allowed]] = True
+        granted[pending[self.frame - last_decided[pending] >= self.max_wait]] = True
+
+    def should_decide(self, batch, slot):
+        """A vez deste slot neste frame, se ainda houver orçamento (ou se ele já esperou demais)."""
+        columns = batch.columns
+        # Já decidiu neste frame: os outros passos de recuperação do SimulationLOD só integram o movimento
+        if columns['last_decided'].item(slot) == self.frame:
+            return False
+        if not columns['granted'].item(slot):
+            self.deferred += 1
+            return False
+        if self.spent >= self.budget and self.frame - columns['last_decided'].item(slot) < self.max_wait:
+            self.deferred += 1
+            return False
+        return True
+
+    def begin_decision(self):
+        return time.perf_counter()
+
+    def end_decision(self, batch, slot, started):
+        cost = time.perf_counter() - started
+        self.spent += cost
+        self.decided += 1
+        self.average_cost += (cost - self.average_cost) * 0.05
+        if slot is not None:
+            batch.columns['last_decided'][slot] = self.frame
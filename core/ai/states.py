@@ -0,0 +1,30 @@
+from enum import Enum
+
+class AIState(Enum):
+    IDLE = 1
+    PATROL = 2
+    CHASE = 3
+    ATTACK = 4
+    SEARCH = 5
+    WANDER = 6
+    INVESTIGATE = 7
+
+class AIPersonality(Enum):
+    AGGRESSIVE = 1
+    CAUTIOUS = 2
+    LAZY = 3
+    ERRATIC = 4
+
+# Multiplicadores de velocidade; estados/personalidades ausentes valem 1.0
+STATE_SPEED = {
+    AIState.WANDER: 0.4,
+    AIState.PATROL: 0.6,
+    AIState.SEARCH: 0.8,
+    AIState.CHASE: 1.0,
+    AIState.INVESTIGATE: 0.5,
+    AIState.IDLE: 0.0,
+}
+PERSONALITY_SPEED = {
+    AIPersonality.AGGRESSIVE: 1.2,
+    AIPersonality.LAZY: 0.7,
+}
@@ -0,0 +1,157 @@
+import math
+import numpy as np
+import pygame
+from core.settings import TILE_SIZE
+from level.tile_map import FLAG_BLOCKED
+
+# Vizinhança 8 com custo octil: (dx, dy, custo)
+NEIGHBORS_8 = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+               (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)))
+
+class CollisionGrid:
+    """
+    Bitmap de tiles bloqueados para consultas de colisão contra o mundo.
+
+    Obstáculos são alinhados à grade, então um rect só precisa checar os
+    poucos tiles que sobrepõe em vez de todos os obstáculos do mapa. Fora do
+    mapa nada é bloqueado (as bordas já são paredes).
+
+    É a fonte única de colisão durante o jogo. O FLAG_BLOCKED do TileMap só
+    descreve o nível gerado: serve para montar a grade (from_tile_map) e
+    para o mini mapa; mudanças em jogo passam por Game.set_tile_kind, que
+    chama set_blocked.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.blocked = bytearray(width * height)
+        # Incrementado a cada alteração, para quem guarda resultados derivados da grade
+        self.version = 0
+
+    @classmethod
+    def from_tile_map(cls, tile_map):
+        grid = cls(tile_map.width, tile_map.height)
+        grid.blocked[:] = ((tile_map.flags & FLAG_BLOCKED) != 0).astype('uint8').tobytes()
+        return grid
+
+    def set_blocked(self, x, y, blocked=True):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.blocked[y * self.width + x] = 1 if blocked else 0
+            self.version += 1
+
+    def is_blocked(self, x, y):
+        """Tile (x, y) bloqueado? Coordenadas em tiles."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.blocked[y * self.width + x] == 1
+        return False
+
+    def clearance_mask(self, clearance):
+        """
+        Array (altura, largura) de bools: tiles sem nenhum bloqueado a até
+        `clearance` tiles (vizinhança quadrada). É onde cabe o centro de um
+        corpo com ~2 * clearance + 1 tiles de largura.
+        """
+        blocked = np.frombuffer(bytes(self.blocked), dtype=np.uint8).reshape(self.height, self.width)
+        padded = np.pad(blocked, clearance, constant_values=0)
+        dilated = np.zeros_like(blocked)
+        for dy in range(2 * clearance + 1):
+            for dx in range(2 * clearance + 1):
+                dilated |= padded[dy:dy + self.height, dx:dx + self.width]
+        return dilated == 0
+
+    def point_blocked(self, px, py):
+        """Ponto do mundo (em pixels) dentro de um tile bloqueado?"""
+        return self.is_blocked(int(px // TILE_SIZE), int(py // TILE_SIZE))
+
+    def _tile_range(self, rect):
+        x0 = max(0, rect.left // TILE_SIZE)
+        y0 = max(0, rect.top // TILE_SIZE)
+        x1 = min(self.width, (rect.right - 1) // TILE_SIZE + 1)
+        y1 = min(self.height, (rect.bottom - 1) // TILE_SIZE + 1)
+        return x0, y0, x1, y1
+
+    def rect_blocked(self, rect):
+        """`rect` sobrepõe algum tile bloqueado?"""
+        x0, y0, x1, y1 = self._tile_range(rect)
+        blocked = self.blocked
+        for y in range(y0, y1):
+            row = y * self.width
+            if 1 in blocked[row + x0:row + x1]:
+                return True
+        return False
+
+    def first_blocked_rect(self, rect):
+        """Rect do primeiro tile bloqueado (em ordem de linha) que `rect` sobrepõe, ou None."""
+        x0, y0, x1, y1 = self._tile_range(rect)
+        blocked = self.blocked
+        for y in range(y0, y1):
+            row = y * self.width
+            for x in range(x0, x1):
+                if blocked[row + x]:
+                    return pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        return None
+
+    def raycast(self, x0, y0, x1, y1):
+        """
+        Primeiro tile bloqueado no segmento (x0, y0)-(x1, y1), em pixels.
+
+        Percorre a grade com DDA (Amanatides & Woo), visitando só os tiles que
+        o segmento atravessa. Retorna (t, tile_x, tile_y), com t em [0, 1] no
+        ponto em que o segmento entra no tile, ou None.
+        """
+        tile_x, tile_y = int(x0 // TILE_SIZE), int(y0 // TILE_SIZE)
+        if self.is_blocked(tile_x, tile_y):
+            return (0.0, tile_x, tile_y)
+
+        dx, dy = x1 - x0, y1 - y0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx:
+            t_max_x = ((tile_x + (step_x > 0)) * TILE_SIZE - x0) / dx
+            t_delta_x = TILE_SIZE / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy:
+            t_max_y = ((tile_y + (step_y > 0)) * TILE_SIZE - y0) / dy
+            t_delta_y = TILE_SIZE / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        steps = abs(int(x1 // TILE_SIZE) - tile_x) + abs(int(y1 // TILE_SIZE) - tile_y)
+        for _ in range(steps):
+            if t_max_x < t_max_y:
+                t = t_max_x
+                tile_x += step_x
+                t_max_x += t_delta_x
+            else:
+                t = t_max_y
+                tile_y += step_y
+                t_max_y += t_delta_y
+            if t > 1.0:
+                break
+            if self.is_blocked(tile_x, tile_y):
+                return (t, tile_x, tile_y)
+        return None
+
+def segment_rect_entry(x0, y0, x1, y1, rect, pad_x=0, pad_y=0):
+    """
+    t em [0, 1] em que o segmento entra em `rect` (inflado por pad_x/pad_y
+    de cada lado), ou None se não o cruza. Começando dentro, retorna 0.
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for start, delta, low, high in ((x0, x1 - x0, rect.left - pad_x, rect.right + pad_x),
+                                    (y0, y1 - y0, rect.top - pad_y, rect.bottom + pad_y)):
+        if delta == 0:
+            if start < low or start >= high:
+                return None
+            continue
+        t0 = (low - start) / delta
+        t1 = (high - start) / delta
+        if t0 > t1:
+            t0, t1 = t1, t0
+        t_enter = max(t_enter, t0)
+        t_exit = min(t_exit, t1)
+        if t_enter > t_exit:
+            return None
+    return t_enter
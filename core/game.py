@@ -12,10 +12,23 @@ from .audio_manager import AudioManager
 from .spawner import spawn_initial_enemies
 from .noise_generator import NoiseGenerator
 from .asset_manager import AssetManager
+from .collision import CollisionGrid
+from .spatial_hash import Broadphase
+from .ai.perception import LineOfSight
+from .ai.flow_field import FlowField
+from .ai.pathfinding import HierarchicalPathfinder
+from .ai.batch import AIBatch
+from .ai.scheduler import DecisionScheduler
+from .simulation_lod import SimulationLOD
 from graphics.particles import RadiationSystem
+from graphics.effects_budget import EffectsBudget
+from graphics.fx_pool import FXPool
 
 from level.generator import LevelGenerator
+from level.tile_map import FLAG_BLOCKED, FLAG_RADIOACTIVE
 from graphics.camera import Camera
+from graphics.tile_chunks import TileChunkCache
+from graphics.water import WaterAnimator
 from graphics.ui.hud import draw_hud
 from graphics.ui.screens import display_intro
 from graphics.ui.minimap import MiniMap
@@ -43,19 +56,30 @@ class Game:
         self.asset_manager = AssetManager()
         self.audio_manager = AudioManager(self.asset_manager)
 
+        self.effects_budget = EffectsBudget()
         self.particle_systems = type('ParticleSystems', (), {})()
-        self.particle_systems.radiation = RadiationSystem()
+        self.particle_systems.radiation = RadiationSystem(self.effects_budget)
 
         self.all_sprites = None
-        self.world_tiles = None
+        self.tickers = None
         self.enemies = None
         self.bullets = None
-        self.obstacles = None
-        self.radioactive_zones = None
         self.items = None
         self.camera = None
         self.player = None
         self.level_generator = None
+        self.tile_map = None
+        self.tile_chunks = None
+        self.collision = None
+        self.line_of_sight = None
+        self.flow_field = None
+        self.pathfinder = None
+        self.ai_batch = AIBatch()
+        self.ai_scheduler = DecisionScheduler()
+        self.simulation_lod = SimulationLOD()
+        self.fx = FXPool(self)
+        self.broadphase = Broadphase(('enemies', 'items'))
+        self.water_animator = WaterAnimator()
 
         self.noise_generator = NoiseGenerator(
             seed=random.randint(0, 1000),
@@ -86,15 +110,22 @@ class Game:
 
     def new(self):
         self.all_sprites = pygame.sprite.Group()
-        self.world_tiles = pygame.sprite.Group()
+        # Só quem tem comportamento por frame; inimigos são atualizados pelo SimulationLOD
+        self.tickers = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
-        self.obstacles = pygame.sprite.Group()
-        self.radioactive_zones = pygame.sprite.Group()
         self.items = pygame.sprite.Group()
+        self.ai_batch.clear()
+        self.fx.clear()
+        self.effects_budget.clear()
 
         self.level_generator = LevelGenerator(self)
         spawn_point = self.level_generator.create_level()
+        self.collision = CollisionGrid.from_tile_map(self.tile_map)
+        self.line_of_sight = LineOfSight(self.collision)
+        self.flow_field = FlowField(self.collision)
+        self.pathfinder = HierarchicalPathfinder(self.collision)
+        self.tile_chunks = TileChunkCache(self.tile_map, self.water_animator, self.map_width, self.map_height)
 
         if not self.camera:
             self.camera = Camera(self.map_width, self.map_height)
@@ -174,10 +205,24 @@ class Game:
             self.playing = False
             return
 
+        # Tempo de trabalho do frame anterior, sem a espera do clock
+        self.effects_budget.begin_frame(self.dt, self.clock.get_rawtime())
         self.camera.update(self.player)
-        self.all_sprites.update(self.dt)
-
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
+        self.water_animator.update(self.dt)
+        self.broadphase.rebuild('enemies', self.enemies)
+        self.broadphase.rebuild('items', self.items)
+        self.line_of_sight.begin_frame()
+        self.flow_field.set_target(self.player.position.x, self.player.position.y)
+        self.simulation_lod.begin_frame(self, self.dt)
+        self.ai_batch.update(self.dt, self.player.position)
+        self.ai_scheduler.begin_frame(self.ai_batch)
+        self.simulation_lod.update(self, self.dt)
+        self.fx.update(self.dt)
+
+        for item in self.broadphase.query_rect('items', self.player.rect):
+            item.collect()
+
+        hits = self.broadphase.query_rect('enemies', self.player.rect)
         for enemy in hits:
 
             if hasattr(enemy, 'attack'):
@@ -204,11 +249,18 @@ class Game:
             if not self.cause_of_death:
                 self.cause_of_death = "Eliminado"
 
+    def set_tile_kind(self, x, y, kind, variant=None):
+        """Troca o tipo de um tile durante o jogo, mantendo colisão, chunks do chão e mini mapa em dia."""
+        self.tile_map.set_kind(x, y, kind, variant)
+        self.collision.set_blocked(x, y, bool(self.tile_map.flags[y, x] & FLAG_BLOCKED))
+        self.tile_chunks.invalidate(x, y)
+        if getattr(self, 'minimap', None):
+            self.minimap.refresh_tiles()
+
     def check_radioactive_zones(self):
-        if not self.player or not self.radioactive_zones:
+        if not self.player or not self.tile_map:
             return
-        in_zone = pygame.sprite.spritecollide(self.player, self.radioactive_zones, False)
-        self.player.is_in_radioactive_zone = bool(in_zone)
+        self.player.is_in_radioactive_zone = self.tile_map.any_in_rect(self.player.rect, FLAG_RADIOACTIVE)
 
     def draw(self):
         if not self.camera:
@@ -218,9 +270,7 @@ class Game:
 
         self.screen.fill(BLACK)
 
-        for tile in self.world_tiles:
-            if self.camera.is_rect_visible(tile.rect):
-                self.screen.blit(tile.image, self.camera.apply(tile))
+        self.tile_chunks.draw(self.screen, self.camera)
 
         for sprite in self.all_sprites:
             if self.camera.is_rect_visible(sprite.rect) and hasattr(sprite, 'image'):
@@ -228,6 +278,8 @@ class Game:
                 if not hasattr(sprite, 'item'):
                     self.screen.blit(sprite.image, self.camera.apply(sprite))
 
+        self.fx.draw(self.screen, self.camera)
+
         # Desenhar o player
         if self.player and hasattr(self.player, 'image'):
             self.screen.blit(self.player.image, self.camera.apply(self.player))
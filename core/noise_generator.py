@@ -1,22 +1,159 @@
 import noise
 import random
+from collections import OrderedDict
 import numpy as np
 
+# Mesma tabela de permutação e gradientes usados pelo noise.pnoise2 (_perlin.c)
+_PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247,
+    120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57,
+    177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74,
+    165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3,
+    64, 52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85,
+    212, 207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170,
+    213, 119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43,
+    172, 9, 129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185,
+    112, 104, 218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191,
+    179, 162, 241, 81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31,
+    181, 199, 106, 157, 184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150,
+    254, 138, 236, 205, 93, 222, 114, 67, 29, 24, 72, 243, 141, 128, 195,
+    78, 66, 215, 61, 156, 180
+], dtype=np.int32)
+_GRAD2 = np.array([
+    (1, 1), (-1, 1), (1, -1), (-1, -1),
+    (1, 0), (-1, 0), (1, 0), (-1, 0),
+    (0, 1), (0, -1), (0, 1), (0, -1),
+    (1, 0), (-1, 0), (0, -1), (0, 1)
+], dtype=np.float64)
+
+# Gradiente final de cada hash de canto: GRAD2[PERM[PERM[k]] & 15]
+_CORNER_GRAD_X = _GRAD2[_PERM[_PERM] & 15, 0]
+_CORNER_GRAD_Y = _GRAD2[_PERM[_PERM] & 15, 1]
+
+def _lattice_axis(coords, repeat, base):
+    """Parte de um eixo que não depende do outro: célula, vizinha, fração e curva de fade."""
+    coords = coords.astype(np.float32)
+    cell = np.floor(np.fmod(coords, repeat)).astype(np.int32)
+    next_cell = np.fmod(cell + 1, repeat).astype(np.int32)
+    frac = (coords - np.floor(coords)).astype(np.float64)
+    fade = frac * frac * frac * (frac * (frac * 6 - 15) + 10)
+    return (cell & 255) + base, (next_cell & 255) + base, frac, fade
+
+def _perlin_2d_grid(xs, ys, repeat, base):
+    """
+    Uma oitava do noise2 do pacote `noise` avaliada na grade xs × ys.
+
+    Retorna um array (len(ys), len(xs)). Reproduz o pnoise2 enquanto os
+    índices cabem na tabela; para bases grandes o C lê além do fim dela,
+    aqui os índices dão a volta em 256.
+    """
+    i, ii, x, fx = _lattice_axis(xs, repeat, base)
+    j, jj, y, fy = _lattice_axis(ys, repeat, base)
+
+    a = _PERM[i & 255][np.newaxis, :]
+    b = _PERM[ii & 255][np.newaxis, :]
+    j = j[:, np.newaxis]
+    jj = jj[:, np.newaxis]
+    x = x[np.newaxis, :]
+    y = y[:, np.newaxis]
+
+    def corner(hash_index, dx, dy):
+        hash_index &= 255
+        return _CORNER_GRAD_X[hash_index] * dx + _CORNER_GRAD_Y[hash_index] * dy
+
+    n00 = corner(a + j, x, y)
+    n10 = corner(b + j, x - 1, y)
+    n01 = corner(a + jj, x, y - 1)
+    n11 = corner(b + jj, x - 1, y - 1)
+
+    fx = fx[np.newaxis, :]
+    nx0 = n00 + fx * (n10 - n00)
+    nx1 = n01 + fx * (n11 - n01)
+    return nx0 + fy[:, np.newaxis] * (nx1 - nx0)
+
+class NoiseCache:
+    """
+    Cache LRU limitado por memória, compartilhado entre os NoiseGenerators.
+
+    Guarda blocos de NOISE_BLOCK_SIZE × NOISE_BLOCK_SIZE amostras (e amostras
+    avulsas de get_noise_2d) sob chaves que incluem a semente, os parâmetros
+    do fBm e as coordenadas exatas. Quando passa de `max_bytes`, descarta as
+    entradas usadas há mais tempo.
+    """
+
+    POINT_ENTRY_BYTES = 64
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, nbytes):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        self.entries[key] = (value, nbytes)
+        self.bytes_used += nbytes
+
+        while self.bytes_used > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.bytes_used -= evicted_bytes
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.bytes_used,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+NOISE_BLOCK_SIZE = 64
+shared_noise_cache = NoiseCache()
+
 class NoiseGenerator:
-    def __init__(self, seed=None, scale=100.0, octaves=6, persistence=0.5, lacunarity=2.0):
+    def __init__(self, seed=None, scale=100.0, octaves=6, persistence=0.5, lacunarity=2.0, cache=None):
         self.seed = seed if seed is not None else random.randint(0, 1000)
         self.scale = scale
         self.octaves = octaves
         self.persistence = persistence
         self.lacunarity = lacunarity
 
-        self.noise_cache = {}
+        self.noise_cache = cache if cache is not None else shared_noise_cache
+
+    @property
+    def params(self):
+        return (self.seed, self.scale, self.octaves, self.persistence, self.lacunarity)
 
     def get_noise_2d(self, x, y):
 
-        cache_key = (int(x), int(y))
-        if cache_key in self.noise_cache:
-            return self.noise_cache[cache_key]
+        cache_key = ('point', self.params, float(x), float(y))
+        cached = self.noise_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         value = 0
         amplitude = 1.0
@@ -35,15 +172,54 @@ class NoiseGenerator:
 
         value = max(-1.0, min(1.0, value))
 
-        self.noise_cache[cache_key] = value
+        self.noise_cache.put(cache_key, value, NoiseCache.POINT_ENTRY_BYTES)
         return value
 
-    def get_noise_2d_array(self, width, height, x_offset=0, y_offset=0):
-        noise_array = np.zeros((height, width))
+    def _fbm_grid(self, xs, ys):
+        noise_array = np.zeros((len(ys), len(xs)))
+        amplitude = 1.0
+        frequency = 1.0
 
-        for y in range(height):
-            for x in range(width):
-                noise_array[y][x] = self.get_noise_2d(x + x_offset, y + y_offset)
+        # Todas as oitavas somadas sobre a grade inteira, como em get_noise_2d
+        for _ in range(self.octaves):
+            noise_array += _perlin_2d_grid(xs / self.scale * frequency, ys / self.scale * frequency,
+                                           1024, self.seed) * amplitude
+
+            amplitude *= self.persistence
+            frequency *= self.lacunarity
+
+        np.clip(noise_array, -1.0, 1.0, out=noise_array)
+        return noise_array
+
+    def _get_block(self, block_x, block_y, frac_x, frac_y):
+        cache_key = ('block', self.params, frac_x, frac_y, block_x, block_y)
+        block = self.noise_cache.get(cache_key)
+        if block is None:
+            xs = np.arange(block_x * NOISE_BLOCK_SIZE, (block_x + 1) * NOISE_BLOCK_SIZE) + frac_x
+            ys = np.arange(block_y * NOISE_BLOCK_SIZE, (block_y + 1) * NOISE_BLOCK_SIZE) + frac_y
+            block = self._fbm_grid(xs, ys)
+            block.setflags(write=False)
+            self.noise_cache.put(cache_key, block, block.nbytes)
+        return block
+
+    def get_noise_2d_array(self, width, height, x_offset=0, y_offset=0):
+        # A parte inteira do offset escolhe os blocos; a fracionária entra na chave,
+        # então amostras em posições diferentes nunca compartilham entrada.
+        origin_x, origin_y = int(np.floor(x_offset)), int(np.floor(y_offset))
+        frac_x, frac_y = float(x_offset - origin_x), float(y_offset - origin_y)
+
+        noise_array = np.empty((height, width))
+        size = NOISE_BLOCK_SIZE
+        for block_y in range(origin_y // size, (origin_y + height - 1) // size + 1):
+            top = max(origin_y, block_y * size)
+            bottom = min(origin_y + height, (block_y + 1) * size)
+            for block_x in range(origin_x // size, (origin_x + width - 1) // size + 1):
+                left = max(origin_x, block_x * size)
+                right = min(origin_x + width, (block_x + 1) * size)
+
+                block = self._get_block(block_x, block_y, frac_x, frac_y)
+                noise_array[top - origin_y:bottom - origin_y, left - origin_x:right - origin_x] = \
+                    block[top - block_y * size:bottom - block_y * size, left - block_x * size:right - block_x * size]
 
         return noise_array
 
@@ -62,3 +238,15 @@ class NoiseGenerator:
                 break
 
         return terrain_type if terrain_type else list(thresholds.keys())[0]
+
+    def get_terrain_type_array(self, width, height, thresholds, x_offset=0, y_offset=0):
+        """Versão em lote de get_terrain_type: retorna um array (height, width) de nomes."""
+        noise_array = self.get_noise_2d_array(width, height, x_offset, y_offset)
+
+        # Em empates vale o tipo declarado primeiro, como na versão escalar
+        ordered = sorted(enumerate(thresholds.items()), key=lambda item: (item[1][1], -item[0]))
+        names = np.array([name for _, (name, _) in ordered] + [list(thresholds.keys())[0]], dtype=object)
+        bins = np.array([threshold for _, (_, threshold) in ordered])
+
+        # digitize - 1 dá o maior limiar <= valor; -1 (abaixo de todos) cai no tipo padrão
+        return names[np.digitize(noise_array, bins) - 1]
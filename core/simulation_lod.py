@@ -0,0 +1,102 @@
+import math
+import random
+from core.settings import TILE_SIZE
+
+LOD_FULL = 0
+LOD_REDUCED = 1
+LOD_ASLEEP = 2
+
+# Margens em volta da área visível da câmera
+LOD_FULL_MARGIN = TILE_SIZE * 4
+LOD_REDUCED_MARGIN = TILE_SIZE * 20
+# Intervalo entre atualizações no anel intermediário
+LOD_REDUCED_TICK = 0.1
+# Maior passo de uma atualização: o inimigo mais rápido anda menos de um tile nesse tempo
+LOD_MAX_STEP = 0.1
+# Quanto tempo de sono um inimigo recupera ao acordar
+LOD_MAX_CATCH_UP = 0.5
+
+class SimulationLOD:
+    """
+    Níveis de simulação dos inimigos pela distância à câmera.
+
+    Perto da área visível (LOD_FULL_MARGIN) o inimigo atualiza todo frame.
+    No anel até LOD_REDUCED_MARGIN, atualiza a cada LOD_REDUCED_TICK
+    segundos com o tempo acumulado (movimento mais grosseiro, mas fora da
+    tela). Além disso ele dorme: nem é visitado; ao voltar ao anel recupera
+    até LOD_MAX_CATCH_UP segundos em passos de LOD_MAX_STEP, o que também
+    expira suas partículas de sangue.
+
+    Os inimigos próximos saem de consultas ao broadphase, então o custo do
+    frame acompanha o que está perto do jogador, não a população do mapa.
+    Inimigos que não atualizam no frame são marcados como dormentes no
+    AIBatch, para o lote não ler nem avançar o estado deles e o
+    DecisionScheduler não gastar vez com eles; quem atualiza recebe ali o
+    tempo simulado. Roda antes do AIBatch.update do frame. Ao acordar,
+    depois de mais de LOD_MAX_CATCH_UP sem atualizar, o inimigo recomeça a
+    contagem de "preso" do zero.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.ticking = []
+        self.counts = {LOD_FULL: 0, LOD_REDUCED: 0, LOD_ASLEEP: 0}
+
+    def begin_frame(self, game, dt):
+        """Escolhe quem atualiza neste frame e com quanto tempo acumulado."""
+        self.time += dt
+        view = game.camera.view_rect
+        full_rect = view.inflate(LOD_FULL_MARGIN * 2, LOD_FULL_MARGIN * 2)
+        reduced_rect = view.inflate(LOD_REDUCED_MARGIN * 2, LOD_REDUCED_MARGIN * 2)
+
+        self.ticking = []
+        woken = []
+        full = reduced = 0
+        for enemy in game.broadphase.query_rect('enemies', reduced_rect):
+            if enemy.lod_time is None or self.time - enemy.lod_time > LOD_MAX_CATCH_UP + dt:
+                woken.append(enemy)
+            if full_rect.colliderect(enemy.rect):
+                full += 1
+                if enemy.lod_time is None:
+                    enemy.lod_time = self.time - dt
+            else:
+                reduced += 1
+                if enemy.lod_time is None:
+                    # Fase aleatória, para o anel não atualizar todo mundo no mesmo frame
+                    enemy.lod_time = self.time - random.uniform(0, LOD_REDUCED_TICK)
+                if self.time - enemy.lod_time < LOD_REDUCED_TICK:
+                    continue
+            self.ticking.append((enemy, min(self.time - enemy.lod_time, LOD_MAX_CATCH_UP)))
+            enemy.lod_time = self.time
+
+        self.counts[LOD_FULL] = full
+        self.counts[LOD_REDUCED] = reduced
+        self.counts[LOD_ASLEEP] = len(game.enemies) - full - reduced
+
+        batch = game.ai_batch
+        columns = batch.columns
+        columns['dormant'][:batch.count] = True
+        columns['elapsed'][:batch.count] = 0.0
+        for enemy, elapsed in self.ticking:
+            controller = enemy.ai_controller
+            if controller is not None and getattr(controller, 'slot', None) is not None:
+                columns['dormant'][controller.slot] = False
+                columns['elapsed'][controller.slot] = elapsed
+        for enemy in woken:
+            controller = enemy.ai_controller
+            if controller is not None and getattr(controller, 'slot', None) is not None:
+                slot = controller.slot
+                columns['last_x'][slot], columns['last_y'][slot] = enemy.position
+                columns['stuck_timer'][slot] = 0.0
+                columns['stuck'][slot] = False
+
+    def update(self, game, dt):
+        """Atualiza os sprites registrados em game.tickers e os inimigos escolhidos em begin_frame."""
+        game.tickers.update(dt)
+
+        for enemy, elapsed in self.ticking:
+            steps = max(1, math.ceil(elapsed / LOD_MAX_STEP))
+            for _ in range(steps):
+                if not enemy.alive():
+                    break
+                enemy.update(elapsed / steps)
@@ -0,0 +1,133 @@
+import math
+from core.settings import TILE_SIZE
+
+SPATIAL_CELL_SIZE = TILE_SIZE * 4
+# Folga na inserção: entidades ainda se movem depois da reconstrução do frame
+SPATIAL_MARGIN = TILE_SIZE // 2
+
+class SpatialHash:
+    """
+    Hash espacial de entidades com `rect`, reconstruído a cada frame.
+
+    Cada entidade entra em todas as células que seu rect (com uma folga)
+    cobre. As consultas testam o rect atual das entidades candidatas, então
+    ignoram quem morreu ou se mexeu depois da reconstrução.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE, margin=SPATIAL_MARGIN):
+        self.cell_size = cell_size
+        self.margin = margin
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cell_range(self, left, top, right, bottom):
+        size = self.cell_size
+        return (int(left // size), int(top // size), int(right // size), int(bottom // size))
+
+    def insert(self, entity):
+        rect = entity.rect
+        margin = self.margin
+        x0, y0, x1, y1 = self._cell_range(rect.left - margin, rect.top - margin,
+                                          rect.right + margin, rect.bottom + margin)
+        cells = self.cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entity]
+                else:
+                    bucket.append(entity)
+
+    def rebuild(self, entities):
+        self.cells.clear()
+        for entity in entities:
+            if getattr(entity, 'rect', None) is not None:
+                self.insert(entity)
+
+    def _candidates(self, left, top, right, bottom):
+        x0, y0, x1, y1 = self._cell_range(left, top, right, bottom)
+        cells = self.cells
+        seen = set()
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                for entity in cells.get((cx, cy), ()):
+                    if entity not in seen:
+                        seen.add(entity)
+                        yield entity
+
+    def query_rect(self, rect):
+        """Entidades vivas cujo rect colide com `rect`."""
+        return [entity for entity in self._candidates(rect.left, rect.top, rect.right, rect.bottom)
+                if entity.alive() and entity.rect.colliderect(rect)]
+
+    def query_radius(self, x, y, radius):
+        """Entidades vivas com o centro do rect a até `radius` de (x, y)."""
+        radius_sq = radius * radius
+        found = []
+        for entity in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            if not entity.alive():
+                continue
+            cx, cy = entity.rect.center
+            if (cx - x) ** 2 + (cy - y) ** 2 <= radius_sq:
+                found.append(entity)
+        return found
+
+    def nearest(self, x, y, max_radius=None, predicate=None):
+        """
+        Entidade viva mais próxima de (x, y) pelo centro do rect, ou None.
+
+        Procura em anéis de células crescentes e para assim que nenhum anel
+        ainda não visitado pode conter algo mais perto.
+        """
+        if not self.cells:
+            return None
+
+        size = self.cell_size
+        origin_x, origin_y = int(x // size), int(y // size)
+        max_ring = None if max_radius is None else int(math.ceil(max_radius / size)) + 1
+        if max_ring is None:
+            xs = [cx for cx, _ in self.cells]
+            ys = [cy for _, cy in self.cells]
+            max_ring = max(abs(origin_x - min(xs)), abs(origin_x - max(xs)),
+                           abs(origin_y - min(ys)), abs(origin_y - max(ys)))
+
+        best, best_dist_sq = None, None if max_radius is None else max_radius * max_radius
+        seen = set()
+        for ring in range(max_ring + 1):
+            # Nada num anel >= ring pode estar a menos de (ring - 1) células de distância
+            if best is not None and ((ring - 1) * size) ** 2 > best_dist_sq:
+                break
+            for cy in range(origin_y - ring, origin_y + ring + 1):
+                step = 1 if cy in (origin_y - ring, origin_y + ring) else 2 * ring
+                for cx in range(origin_x - ring, origin_x + ring + 1, max(1, step)):
+                    for entity in self.cells.get((cx, cy), ()):
+                        if entity in seen:
+                            continue
+                        seen.add(entity)
+                        if not entity.alive() or (predicate and not predicate(entity)):
+                            continue
+                        ex, ey = entity.rect.center
+                        dist_sq = (ex - x) ** 2 + (ey - y) ** 2
+                        if best_dist_sq is None or dist_sq <= best_dist_sq:
+                            best, best_dist_sq = entity, dist_sq
+        return best
+
+class Broadphase:
+    """Um SpatialHash por categoria de entidade ('enemies', 'items', ...)."""
+
+    def __init__(self, categories):
+        self.hashes = {category: SpatialHash() for category in categories}
+
+    def rebuild(self, category, entities):
+        self.hashes[category].rebuild(entities)
+
+    def query_rect(self, category, rect):
+        return self.hashes[category].query_rect(rect)
+
+    def query_radius(self, category, x, y, radius):
+        return self.hashes[category].query_radius(x, y, radius)
+
+    def nearest(self, category, x, y, max_radius=None, predicate=None):
+        return self.hashes[category].nearest(x, y, max_radius, predicate)
@@ -1,13 +1,8 @@
-import pygame
 import random
-from core.settings import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE
+from core.settings import TILE_SIZE
+from core.ai.pack import Pack
 
-def _is_obstacle_at(game, tile_x, tile_y):
-    check_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-    for obstacle in game.obstacles:
-        if obstacle.rect.colliderect(check_rect):
-            return True
-    return False
+SPAWNABLE_TILES = ['grass', 'dirt', 'concrete']
 
 def spawn_initial_enemies(game, asset_manager):
     print("Iniciando geração de inimigos...")
@@ -20,30 +15,25 @@ def spawn_initial_enemies(game, asset_manager):
         print("ERRO: Falha ao carregar as classes de inimigos do AssetManager!")
         return
 
-    world_width_tiles = MAP_WIDTH // TILE_SIZE
-    world_height_tiles = MAP_HEIGHT // TILE_SIZE
+    regions = game.level_generator.regions
 
     player_spawn_tile_x = game.player.rect.centerx // TILE_SIZE
     player_spawn_tile_y = game.player.rect.centery // TILE_SIZE
+    player_tile = (player_spawn_tile_x, player_spawn_tile_y)
 
     min_spawn_dist_from_player = 20
 
     num_raiders = 10
     print(f"  Gerando {num_raiders} Saqueadores...")
     for i in range(num_raiders):
-        attempts = 0
-        while attempts < 100:
-            attempts += 1
+        tile = regions.take_tile(SPAWNABLE_TILES, min_dist=min_spawn_dist_from_player,
+                                 origin=player_tile, clearance=True)
+        if tile is None:
+            print(f"  AVISO: Sem espaço livre para os Saqueadores restantes ({i}/{num_raiders} gerados).")
+            break
 
-            x = random.randint(5, world_width_tiles - 6)
-            y = random.randint(5, world_height_tiles - 6)
-
-            dist_from_player = abs(x - player_spawn_tile_x) + abs(y - player_spawn_tile_y)
-            if dist_from_player > min_spawn_dist_from_player:
-
-                if not _is_obstacle_at(game, x, y):
-                    RaiderClass(game, x * TILE_SIZE, y * TILE_SIZE)
-                    break
+        x, y = tile
+        RaiderClass(game, x * TILE_SIZE, y * TILE_SIZE)
 
     num_packs = 5
     dogs_per_pack_min = 2
@@ -52,40 +42,21 @@ def spawn_initial_enemies(game, asset_manager):
     print(f"  Gerando {num_packs} matilhas de Cães Selvagens...")
 
     for i in range(num_packs):
-        attempts = 0
-        pack_placed = False
-
-        while attempts < 50:
-            attempts += 1
-
-            pack_x = random.randint(10, world_width_tiles - 11)
-            pack_y = random.randint(10, world_height_tiles - 11)
-
-            dist_from_player = abs(pack_x - player_spawn_tile_x) + abs(pack_y - player_spawn_tile_y)
-            if dist_from_player > min_spawn_dist_from_player + 5:
-
-                if not _is_obstacle_at(game, pack_x, pack_y):
-
-                    pack_size = random.randint(dogs_per_pack_min, dogs_per_pack_max)
-                    dogs_spawned_in_pack = 0
-
-                    for _ in range(pack_size):
-                        dog_attempts = 0
-                        while dog_attempts < 20:
-                            dog_attempts += 1
-
-                            dog_x = pack_x + random.randint(-pack_radius, pack_radius)
-                            dog_y = pack_y + random.randint(-pack_radius, pack_radius)
-
-                            dog_x = max(1, min(world_width_tiles - 2, dog_x))
-                            dog_y = max(1, min(world_height_tiles - 2, dog_y))
-
-                            if not _is_obstacle_at(game, dog_x, dog_y):
-                                WildDogClass(game, dog_x * TILE_SIZE, dog_y * TILE_SIZE)
-                                dogs_spawned_in_pack += 1
-                                break
-                    pack_placed = True
-                    break
+        pack_tile = regions.take_tile(SPAWNABLE_TILES, min_dist=min_spawn_dist_from_player + 5,
+                                      origin=player_tile, clearance=True)
+        if pack_tile is None:
+            print(f"  AVISO: Sem espaço livre para as matilhas restantes ({i}/{num_packs} geradas).")
+            break
+
+        pack_x, pack_y = pack_tile
+        pack = Pack(game)
+        pack.add(WildDogClass(game, pack_x * TILE_SIZE, pack_y * TILE_SIZE))
+
+        pack_size = random.randint(dogs_per_pack_min, dogs_per_pack_max)
+        nearby_tiles = regions.free_tiles_near(pack_x, pack_y, pack_radius, clearance=True)
+        for dog_x, dog_y in random.sample(nearby_tiles, min(pack_size - 1, len(nearby_tiles))):
+            regions.occupy((dog_x, dog_y))
+            pack.add(WildDogClass(game, dog_x * TILE_SIZE, dog_y * TILE_SIZE))
 
     if FriendlyScavengerClass:
         print("  Gerando Saqueador Amigável...")
@@ -93,30 +64,14 @@ def spawn_initial_enemies(game, asset_manager):
         friendly_min_dist = 10
         friendly_max_dist = 20
 
-        attempts = 0
-        while attempts < 100:
-            attempts += 1
-
-            angle = random.uniform(0, 2 * 3.14159)
-
-            dist = random.randint(friendly_min_dist, friendly_max_dist)
-
-            offset_x = int(dist * pygame.math.Vector2(1, 0).rotate_rad(angle).x)
-            offset_y = int(dist * pygame.math.Vector2(1, 0).rotate_rad(angle).y)
-
-            friendly_x = player_spawn_tile_x + offset_x
-            friendly_y = player_spawn_tile_y + offset_y
-
-            friendly_x = max(1, min(world_width_tiles - 2, friendly_x))
-            friendly_y = max(1, min(world_height_tiles - 2, friendly_y))
-
-            if not _is_obstacle_at(game, friendly_x, friendly_y):
-                FriendlyScavengerClass(game, friendly_x * TILE_SIZE, friendly_y * TILE_SIZE)
-                print(f"  Saqueador Amigável gerado em ({friendly_x}, {friendly_y})")
-                break
-
-        if attempts >= 100:
-            print("  AVISO: Não foi possível gerar o Saqueador Amigável após 100 tentativas.")
+        tile = regions.take_tile(SPAWNABLE_TILES, min_dist=friendly_min_dist, max_dist=friendly_max_dist,
+                                 origin=player_tile, clearance=True)
+        if tile is not None:
+            friendly_x, friendly_y = tile
+            FriendlyScavengerClass(game, friendly_x * TILE_SIZE, friendly_y * TILE_SIZE)
+            print(f"  Saqueador Amigável gerado em ({friendly_x}, {friendly_y})")
+        else:
+            print("  AVISO: Não foi possível gerar o Saqueador Amigável: nenhum tile livre alcançável por perto.")
     else:
         print("  AVISO: Classe FriendlyScavenger não encontrada no AssetManager.")
 
@@ -5,7 +5,7 @@ from items.item_base import Item
 
 class Collectible(pygame.sprite.Sprite):
     def __init__(self, game, x, y, item):
-        self.groups = game.all_sprites, game.items
+        self.groups = game.all_sprites, game.tickers, game.items
         super().__init__(self.groups)
         self.game = game
         self.item = item
@@ -39,9 +39,6 @@ class Collectible(pygame.sprite.Sprite):
         self.float_timer += dt * 2
         self.rect.centery = self.base_y + int(math.sin(self.float_timer) * 3)
 
-        if self.rect.colliderect(self.game.player.rect):
-            self.collect()
-
     def collect(self):
         if self.game.player.inventory.add_item(self.item):
             print(f"Coletado: {self.item.name}")
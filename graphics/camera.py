@@ -6,6 +6,7 @@ from core.settings import WIDTH, HEIGHT, CAMERA_LERP_FACTOR
 class Camera:
     def __init__(self, map_width, map_height):
         self.camera = pygame.Rect(0, 0, map_width, map_height)
+        self.view_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
         self.map_width = map_width
         self.map_height = map_height
 
@@ -69,6 +70,7 @@ class Camera:
 
         self.camera.x = int(self.x)
         self.camera.y = int(self.y)
+        self.view_rect.topleft = (-self.camera.x, -self.camera.y)
 
     def screen_to_world(self, screen_pos):
         return (screen_pos[0] - int(self.x + self.shake_offset_x),
@@ -79,5 +81,4 @@ class Camera:
                 y + int(self.y + self.shake_offset_y))
 
     def is_rect_visible(self, rect):
-        visible_area = pygame.Rect(-self.camera.x, -self.camera.y, WIDTH, HEIGHT)
-        return rect.colliderect(visible_area)
+        return rect.colliderect(self.view_rect)
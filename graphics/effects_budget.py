@@ -0,0 +1,124 @@
+import math
+import random
+from core.settings import FPS
+
+# Prioridades dos efeitos: quanto maior, mais cedo é cortado sob carga
+EFFECT_PRIORITY_GAMEPLAY = 0
+EFFECT_PRIORITY_NORMAL = 1
+EFFECT_PRIORITY_AMBIENT = 2
+
+# Fração da emissão que cada prioridade perde com a carga no máximo
+EFFECT_PRIORITY_CUT = {
+    EFFECT_PRIORITY_GAMEPLAY: 0.5,
+    EFFECT_PRIORITY_NORMAL: 0.8,
+    EFFECT_PRIORITY_AMBIENT: 1.0,
+}
+# Com a carga no máximo as vidas caem até essa fração
+EFFECTS_MIN_LIFETIME = 0.5
+
+EFFECTS_FRAME_MS = 1000 / FPS
+# Fração do frame gasta em trabalho a partir da qual os efeitos começam a ser cortados
+EFFECTS_LOW_LOAD = 0.6
+EFFECTS_MAX_PARTICLES = 3000
+EFFECTS_SMOOTHING = 0.1
+# Relógio das partículas vivas: baldes de 0.1 s, vidas de até 6.4 s
+EFFECTS_EXPIRY_STEP = 0.1
+EFFECTS_EXPIRY_SLOTS = 64
+
+class EffectsBudget:
+    """
+    Governador global da quantidade de efeitos, guiado pelo tempo de frame.
+
+    Acompanha a média do tempo de trabalho por frame (sem a espera do
+    clock) e uma contagem das partículas vivas. Cada emissor registra aqui
+    quantas criou e por quanto tempo; elas saem da contagem num anel de
+    baldes de EFFECTS_EXPIRY_STEP segundos, sem precisar perguntar a cada
+    sistema (os de sangue são um por inimigo).
+
+    A carga é a maior entre a do tempo de frame (a partir de
+    EFFECTS_LOW_LOAD do frame) e a de partículas (a partir de metade de
+    EFFECTS_MAX_PARTICLES). Com ela os emissores reduzem a quantidade e a
+    vida do que criam, cada prioridade na sua proporção: efeitos de
+    ambiente somem primeiro e o retorno de jogo (sangue e impacto de
+    acerto) sempre emite pelo menos uma partícula.
+    """
+
+    def __init__(self, frame_ms=EFFECTS_FRAME_MS, max_particles=EFFECTS_MAX_PARTICLES):
+        self.frame_budget = frame_ms
+        self.max_particles = max_particles
+        self.frame_ms = 0.0
+        self.pressure = 0.0
+
+        self.live = 0
+        self.expiring = [0] * EFFECTS_EXPIRY_SLOTS
+        self.cursor = 0
+        self.ticks = 0
+        self.clock = 0.0
+
+    def begin_frame(self, dt, frame_ms):
+        """Expira as partículas do tempo que passou e recalcula a carga com o trabalho do último frame."""
+        self.clock += dt
+        while self.clock >= EFFECTS_EXPIRY_STEP:
+            self.clock -= EFFECTS_EXPIRY_STEP
+            self.ticks += 1
+            self.cursor = (self.cursor + 1) % EFFECTS_EXPIRY_SLOTS
+            self.live -= self.expiring[self.cursor]
+            self.expiring[self.cursor] = 0
+
+        self.frame_ms += (frame_ms - self.frame_ms) * EFFECTS_SMOOTHING
+        low = self.frame_budget * EFFECTS_LOW_LOAD
+        frame_pressure = (self.frame_ms - low) / (self.frame_budget - low)
+        half = self.max_particles / 2
+        particle_pressure = (self.live - half) / half
+        self.pressure = max(0.0, min(1.0, max(frame_pressure, particle_pressure)))
+
+    def scale(self, priority):
+        """Fração da emissão normal permitida agora para a prioridade."""
+        return 1.0 - self.pressure * EFFECT_PRIORITY_CUT[priority]
+
+    def lifetime(self, priority):
+        """Fator aplicado à vida das partículas novas da prioridade."""
+        cut = self.pressure * EFFECT_PRIORITY_CUT[priority]
+        return 1.0 - cut * (1.0 - EFFECTS_MIN_LIFETIME)
+
+    def count(self, count, priority):
+        """
+        Quantas de `count` partículas emitir agora. O arredondamento é
+        sorteado, então um emissor de uma partícula por vez também diminui
+        em média.
+        """
+        if count <= 0:
+            return 0
+        scaled = count * self.scale(priority)
+        allowed = int(scaled)
+        if random.random() < scaled - allowed:
+            allowed += 1
+        if priority == EFFECT_PRIORITY_GAMEPLAY:
+            allowed = max(1, allowed)
+        return allowed
+
+    def charge(self, count, life):
+        """
+        Registra `count` partículas novas que vivem `life` segundos. Devolve
+        o tique em que elas saem da contagem, para um `refund` posterior.
+        """
+        if count <= 0:
+            return self.ticks
+        offset = min(EFFECTS_EXPIRY_SLOTS - 1, max(1, math.ceil(life / EFFECTS_EXPIRY_STEP)))
+        self.expiring[(self.cursor + offset) % EFFECTS_EXPIRY_SLOTS] += count
+        self.live += count
+        return self.ticks + offset
+
+    def refund(self, count, tick):
+        """Tira da contagem `count` partículas cobradas para o tique `tick` que sumiram antes da hora."""
+        if tick <= self.ticks:
+            return
+        slot = tick % EFFECTS_EXPIRY_SLOTS
+        count = min(count, self.expiring[slot])
+        self.expiring[slot] -= count
+        self.live -= count
+
+    def clear(self):
+        self.live = 0
+        self.expiring = [0] * EFFECTS_EXPIRY_SLOTS
+        self.pressure = 0.0
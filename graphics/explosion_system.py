@@ -1,345 +1,155 @@
-import pygame
 import random
 import math
+import heapq
+import itertools
+import numpy as np
 from core.settings import *
+from graphics import sprite_cache
+from graphics.effects_budget import EFFECT_PRIORITY_NORMAL
+
+# Parâmetros de cada tipo de explosão; tipos desconhecidos usam "normal"
+EXPLOSION_STYLES = {
+    "grenade": {
+        'particles': 30, 'radius': 80, 'flash': 40, 'secondaries': 0,
+        'speed': (50, 200), 'size': (2, 6), 'life': (0.5, 1.5),
+        'start_color': (255, 255, 100), 'end_color': (255, 100, 0),
+        'shock_color': (255, 255, 150), 'thickness': 3, 'flash_color': (255, 255, 255),
+    },
+    "fuel": {
+        'particles': 50, 'radius': 120, 'flash': 60, 'secondaries': 3,
+        'speed': (30, 150), 'size': (3, 8), 'life': (1.0, 2.5),
+        'start_color': (255, 150, 0), 'end_color': (150, 50, 0),
+        'shock_color': (255, 100, 0), 'thickness': 4, 'flash_color': (255, 200, 100),
+    },
+    "normal": {
+        'particles': 25, 'radius': 60, 'flash': 30, 'secondaries': 0,
+        'speed': (40, 180), 'size': (2, 5), 'life': (0.3, 1.2),
+        'start_color': (255, 200, 100), 'end_color': (200, 50, 0),
+        'shock_color': (255, 200, 100), 'thickness': 2, 'flash_color': (255, 255, 200),
+    },
+}
+EXPLOSION_STYLE_NAMES = list(EXPLOSION_STYLES)
+
+SHOCKWAVE_DURATION = 0.8
+FLASH_DURATION = 0.3
+# Pico do flash, como fração da duração
+FLASH_PEAK = 0.3
+EXPLOSION_FRICTION = 0.95
+SECONDARY_OFFSET = 50
+SECONDARY_DELAY = (0.2, 1.0)
+SECONDARY_INTENSITY = 0.3
+
+# Limites que deixam o custo de explosões em cadeia previsível
+EXPLOSION_MAX_PARTICLES = 2048
+EXPLOSION_MAX_PENDING = 32
+EXPLOSION_MAX_DETONATIONS = 4
+
+EXPLOSION_PARTICLE_FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    'vx': np.float64,
+    'vy': np.float64,
+    'gravity': np.float64,
+    'age': np.float64,
+    'life': np.float64,
+    'size': np.int32,
+    'style': np.int8,
+}
+EXPLOSION_RING_FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    'radius': np.float64,
+    'age': np.float64,
+    'style': np.int8,
+}
+
+def _color_steps(style):
+    """Cor de início a fim em ALPHA_LEVELS + 1 passos de progresso, para caber no sprite_cache."""
+    start, end = style['start_color'], style['end_color']
+    steps = []
+    for step in range(sprite_cache.ALPHA_LEVELS + 1):
+        progress = step / sprite_cache.ALPHA_LEVELS
+        steps.append(tuple(max(0, min(255, int(a + (b - a) * progress))) for a, b in zip(start, end)))
+    return steps
+
+EXPLOSION_COLOR_STEPS = [_color_steps(EXPLOSION_STYLES[name]) for name in EXPLOSION_STYLE_NAMES]
+
+_rng = np.random.default_rng(random.getrandbits(32))
+
+class ComponentPool:
+    """Colunas NumPy de um tipo de componente, que crescem dobrando e se compactam por máscara."""
+
+    def __init__(self, fields, capacity=16):
+        self.fields = fields
+        self.capacity = capacity
+        self.count = 0
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in fields.items()}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, count, **values):
+        """Acrescenta `count` linhas; cada valor é escalar ou array de `count` elementos."""
+        needed = self.count + count
+        if needed > self.capacity:
+            while self.capacity < needed:
+                self.capacity *= 2
+            for name, dtype in self.fields.items():
+                column = np.zeros(self.capacity, dtype=dtype)
+                column[:self.count] = self.columns[name][:self.count]
+                self.columns[name] = column
+        for name, value in values.items():
+            self.columns[name][self.count:needed] = value
+        self.count = needed
+
+    def view(self):
+        return {name: column[:self.count] for name, column in self.columns.items()}
+
+    def keep(self, alive):
+        remaining = int(np.count_nonzero(alive))
+        if remaining < self.count:
+            for name, column in self.columns.items():
+                column[:remaining] = column[:self.count][alive]
+            self.count = remaining
+
+    def clear(self):
+        self.count = 0
 
-class ExplosionParticle:
-
-    def __init__(self, x, y, explosion_type="normal"):
-        self.x = x
-        self.y = y
-        self.explosion_type = explosion_type
-
-        angle = random.uniform(0, 2 * math.pi)
-        if explosion_type == "grenade":
-            speed = random.uniform(50, 200)
-            self.size = random.randint(2, 6)
-            self.lifetime = random.uniform(0.5, 1.5)
-        elif explosion_type == "fuel":
-            speed = random.uniform(30, 150)
-            self.size = random.randint(3, 8)
-            self.lifetime = random.uniform(1.0, 2.5)
-        else:
-            speed = random.uniform(40, 180)
-            self.size = random.randint(2, 5)
-            self.lifetime = random.uniform(0.3, 1.2)
-
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-
-        self.age = 0.0
-        self.gravity = random.uniform(20, 50)
-
-        if explosion_type == "grenade":
-            self.start_color = (255, 255, 100)
-            self.end_color = (255, 100, 0)
-        elif explosion_type == "fuel":
-            self.start_color = (255, 150, 0)
-            self.end_color = (150, 50, 0)
-        else:
-            self.start_color = (255, 200, 100)
-            self.end_color = (200, 50, 0)
-
-    def update(self, dt):
-        self.age += dt
-
-        self.vy += self.gravity * dt
-
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-
-        friction = 0.95
-        self.vx *= friction
-        self.vy *= friction
-
-    def is_dead(self):
-        return self.age >= self.lifetime
-
-    def get_color(self):
-        if self.lifetime <= 0:
-            return self.end_color
-
-        progress = min(1.0, self.age / self.lifetime)
-
-        r = int(self.start_color[0] + (self.end_color[0] - self.start_color[0]) * progress)
-        g = int(self.start_color[1] + (self.end_color[1] - self.start_color[1]) * progress)
-        b = int(self.start_color[2] + (self.end_color[2] - self.start_color[2]) * progress)
-
-        return (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-
-    def get_alpha(self):
-        if self.lifetime <= 0:
-            return 0
-
-        progress = self.age / self.lifetime
-        return int(255 * (1 - progress))
-
-    def draw(self, screen, camera):
-        alpha = self.get_alpha()
-        if alpha <= 0:
-            return
-
-        screen_x, screen_y = camera.apply_pos((self.x, self.y))
-
-        if (screen_x < -self.size or screen_x > WIDTH + self.size or
-            screen_y < -self.size or screen_y > HEIGHT + self.size):
-            return
-
-        size = max(1, int(self.size * (1 - self.age / self.lifetime)))
-        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-
-        color = self.get_color()
-        color_with_alpha = (*color, alpha)
-
-        pygame.draw.circle(surf, color_with_alpha, (size, size), size)
-        screen.blit(surf, (screen_x - size, screen_y - size))
-
-class ShockWave:
-
-    def __init__(self, x, y, max_radius=100, duration=0.5, explosion_type="normal"):
-        self.x = x
-        self.y = y
-        self.max_radius = max_radius
-        self.duration = duration
-        self.age = 0.0
-        self.explosion_type = explosion_type
-
-        if explosion_type == "grenade":
-            self.color = (255, 255, 150)
-            self.thickness = 3
-        elif explosion_type == "fuel":
-            self.color = (255, 100, 0)
-            self.thickness = 4
-        else:
-            self.color = (255, 200, 100)
-            self.thickness = 2
-
-    def update(self, dt):
-        self.age += dt
-
-    def is_dead(self):
-        return self.age >= self.duration
-
-    def get_radius(self):
-        if self.duration <= 0:
-            return self.max_radius
-
-        progress = min(1.0, self.age / self.duration)
-        return self.max_radius * progress
-
-    def get_alpha(self):
-        if self.duration <= 0:
-            return 0
-
-        progress = self.age / self.duration
-        return int(255 * (1 - progress))
-
-    def draw(self, screen, camera):
-        alpha = self.get_alpha()
-        if alpha <= 0:
-            return
-
-        radius = self.get_radius()
-        if radius <= 0:
-            return
-
-        screen_x, screen_y = camera.apply_pos((self.x, self.y))
-
-        if (screen_x + radius < 0 or screen_x - radius > WIDTH or
-            screen_y + radius < 0 or screen_y - radius > HEIGHT):
-            return
-
-        surf_size = int(radius * 2 + self.thickness * 2)
-        surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
-
-        color_with_alpha = (*self.color, alpha)
-        center = (surf_size // 2, surf_size // 2)
-
-        pygame.draw.circle(surf, color_with_alpha, center, int(radius), self.thickness)
-
-        screen.blit(surf, (screen_x - surf_size // 2, screen_y - surf_size // 2))
-
-class ExplosionFlash:
-
-    def __init__(self, x, y, max_radius=50, duration=0.2, explosion_type="normal"):
-        self.x = x
-        self.y = y
-        self.max_radius = max_radius
-        self.duration = duration
-        self.age = 0.0
-        self.explosion_type = explosion_type
-
-        if explosion_type == "grenade":
-            self.color = (255, 255, 255)
-        elif explosion_type == "fuel":
-            self.color = (255, 200, 100)
-        else:
-            self.color = (255, 255, 200)
-
-    def update(self, dt):
-        self.age += dt
-
-    def is_dead(self):
-        return self.age >= self.duration
-
-    def get_radius(self):
-        if self.duration <= 0:
-            return 0
-
-        progress = self.age / self.duration
-
-        if progress < 0.3:
-            return self.max_radius * (progress / 0.3)
-        else:
-            return self.max_radius * (1 - (progress - 0.3) / 0.7)
-
-    def get_alpha(self):
-        if self.duration <= 0:
-            return 0
-
-        progress = self.age / self.duration
-        return int(255 * (1 - progress))
-
-    def draw(self, screen, camera):
-        alpha = self.get_alpha()
-        radius = self.get_radius()
-
-        if alpha <= 0 or radius <= 0:
-            return
-
-        screen_x, screen_y = camera.apply_pos((self.x, self.y))
-
-        if (screen_x + radius < 0 or screen_x - radius > WIDTH or
-            screen_y + radius < 0 or screen_y - radius > HEIGHT):
-            return
-
-        surf_size = int(radius * 2)
-        if surf_size <= 0:
-            return
-
-        surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
-
-        color_with_alpha = (*self.color, alpha)
-        center = (surf_size // 2, surf_size // 2)
-
-        pygame.draw.circle(surf, color_with_alpha, center, int(radius))
-
-        screen.blit(surf, (screen_x - surf_size // 2, screen_y - surf_size // 2))
-
-class Explosion:
-
-    def __init__(self, x, y, explosion_type="normal", intensity=1.0):
-        self.x = x
-        self.y = y
-        self.explosion_type = explosion_type
-        self.intensity = intensity
-        self.age = 0.0
-
-        if explosion_type == "grenade":
-            particle_count = int(30 * intensity)
-            max_radius = int(80 * intensity)
-            flash_radius = int(40 * intensity)
-            self.duration = 2.0
-        elif explosion_type == "fuel":
-            particle_count = int(50 * intensity)
-            max_radius = int(120 * intensity)
-            flash_radius = int(60 * intensity)
-            self.duration = 3.0
-        else:
-            particle_count = int(25 * intensity)
-            max_radius = int(60 * intensity)
-            flash_radius = int(30 * intensity)
-            self.duration = 1.5
-
-        self.particles = []
-        for _ in range(particle_count):
-            self.particles.append(ExplosionParticle(x, y, explosion_type))
-
-        self.shock_wave = ShockWave(x, y, max_radius, 0.8, explosion_type)
-        self.flash = ExplosionFlash(x, y, flash_radius, 0.3, explosion_type)
-
-        self.secondary_explosions = []
-        if explosion_type == "fuel":
-
-            for _ in range(int(3 * intensity)):
-                offset_x = random.uniform(-50, 50)
-                offset_y = random.uniform(-50, 50)
-                delay = random.uniform(0.2, 1.0)
-                self.secondary_explosions.append({
-                    'x': x + offset_x,
-                    'y': y + offset_y,
-                    'delay': delay,
-                    'triggered': False,
-                    'explosion': None
-                })
-
-    def update(self, dt):
-        self.age += dt
-
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if particle.is_dead():
-                self.particles.remove(particle)
-
-        if self.shock_wave and not self.shock_wave.is_dead():
-            self.shock_wave.update(dt)
-        elif self.shock_wave:
-            self.shock_wave = None
-
-        if self.flash and not self.flash.is_dead():
-            self.flash.update(dt)
-        elif self.flash:
-            self.flash = None
-
-        for secondary in self.secondary_explosions:
-            if not secondary['triggered'] and self.age >= secondary['delay']:
-                secondary['triggered'] = True
-                secondary['explosion'] = Explosion(
-                    secondary['x'], secondary['y'],
-                    "normal", 0.3
-                )
-            elif secondary['explosion']:
-                secondary['explosion'].update(dt)
-
-    def is_dead(self):
-        if self.age < self.duration:
-            return False
-
-        if self.particles or self.shock_wave or self.flash:
-            return False
-
-        for secondary in self.secondary_explosions:
-            if secondary['explosion'] and not secondary['explosion'].is_dead():
-                return False
-
-        return True
-
-    def draw(self, screen, camera):
-
-        if self.flash:
-            self.flash.draw(screen, camera)
-
-        for particle in self.particles:
-            particle.draw(screen, camera)
+class ExplosionSystem:
+    """
+    Explosões como componentes soltos em pools planos.
 
-        if self.shock_wave:
-            self.shock_wave.draw(screen, camera)
+    Cada explosão vira um flash, uma onda de choque e um punhado de
+    partículas, cada um no pool do seu tipo; não sobra objeto por explosão.
+    O update é uma passada vetorizada por pool, e o draw junta flashes,
+    partículas e ondas num só `screen.blits`.
 
-        for secondary in self.secondary_explosions:
-            if secondary['explosion']:
-                secondary['explosion'].draw(screen, camera)
-
-class ExplosionSystem:
+    As detonações secundárias do combustível vão para uma fila de
+    prioridade pelo instante em que disparam. Com no máximo
+    EXPLOSION_MAX_PENDING na fila, EXPLOSION_MAX_DETONATIONS por frame e
+    EXPLOSION_MAX_PARTICLES partículas vivas, uma cadeia de explosões custa
+    um teto conhecido por frame.
+    """
 
     def __init__(self, game):
         self.game = game
-        self.explosions = []
+        self.time = 0.0
+
+        self.particles = ComponentPool(EXPLOSION_PARTICLE_FIELDS, 256)
+        self.flashes = ComponentPool(EXPLOSION_RING_FIELDS)
+        self.shock_waves = ComponentPool(EXPLOSION_RING_FIELDS)
+        # (instante, ordem, x, y, tipo, intensidade); a ordem desempata instantes iguais
+        self.pending = []
+        self.sequence = itertools.count()
 
         self.explosion_sounds = {}
 
+    def __len__(self):
+        """Componentes vivos mais detonações na fila."""
+        return len(self.particles) + len(self.flashes) + len(self.shock_waves) + len(self.pending)
+
     def create_explosion(self, x, y, explosion_type="normal", intensity=1.0, play_sound=True):
-        explosion = Explosion(x, y, explosion_type, intensity)
-        self.explosions.append(explosion)
+        self._spawn(x, y, explosion_type, intensity)
 
         if play_sound and hasattr(self.game, 'audio_manager'):
             sound_key = f"explosion_{explosion_type}"
@@ -351,7 +161,48 @@ class ExplosionSystem:
             shake_intensity = min(20, int(10 * intensity))
             self.game.camera.add_shake(shake_intensity, 0.5)
 
-        return explosion
+    def _spawn(self, x, y, explosion_type, intensity):
+        """Só o visual: flash, onda de choque, partículas e secundárias agendadas."""
+        if explosion_type not in EXPLOSION_STYLES:
+            explosion_type = "normal"
+        style = EXPLOSION_STYLES[explosion_type]
+        index = EXPLOSION_STYLE_NAMES.index(explosion_type)
+
+        self.flashes.add(1, x=x, y=y, radius=int(style['flash'] * intensity), age=0.0, style=index)
+        self.shock_waves.add(1, x=x, y=y, radius=int(style['radius'] * intensity), age=0.0, style=index)
+
+        particle_count = int(style['particles'] * intensity)
+        secondary_count = int(style['secondaries'] * intensity)
+        lifetime_scale = 1.0
+        # Fogo e fumaça cedem sob carga; o flash e a onda de choque marcam o dano e ficam
+        budget = getattr(self.game, 'effects_budget', None)
+        if budget is not None:
+            particle_count = budget.count(particle_count, EFFECT_PRIORITY_NORMAL)
+            secondary_count = budget.count(secondary_count, EFFECT_PRIORITY_NORMAL)
+            lifetime_scale = budget.lifetime(EFFECT_PRIORITY_NORMAL)
+        particle_count = min(particle_count, EXPLOSION_MAX_PARTICLES - len(self.particles))
+
+        if particle_count > 0:
+            angle = _rng.uniform(0, 2 * math.pi, particle_count)
+            speed = _rng.uniform(*style['speed'], particle_count)
+            life = _rng.uniform(*style['life'], particle_count) * lifetime_scale
+            self.particles.add(particle_count, x=x, y=y,
+                               vx=np.cos(angle) * speed, vy=np.sin(angle) * speed,
+                               gravity=_rng.uniform(20, 50, particle_count), age=0.0, life=life,
+                               size=_rng.integers(style['size'][0], style['size'][1] + 1, particle_count),
+                               style=index)
+            if budget is not None:
+                budget.charge(particle_count, float(life.mean()))
+
+        for _ in range(secondary_count):
+            if len(self.pending) >= EXPLOSION_MAX_PENDING:
+                break
+            heapq.heappush(self.pending, (
+                self.time + random.uniform(*SECONDARY_DELAY), next(self.sequence),
+                x + random.uniform(-SECONDARY_OFFSET, SECONDARY_OFFSET),
+                y + random.uniform(-SECONDARY_OFFSET, SECONDARY_OFFSET),
+                "normal", SECONDARY_INTENSITY,
+            ))
 
     def _apply_area_damage(self, x, y, explosion_type, intensity):
 
@@ -377,17 +228,105 @@ class ExplosionSystem:
                             entity.take_damage(actual_damage)
 
     def update(self, dt):
-        for explosion in self.explosions[:]:
-            explosion.update(dt)
-            if explosion.is_dead():
-                self.explosions.remove(explosion)
+        self.time += dt
+
+        # Secundárias vencidas; as que passam do limite do frame ficam para o próximo
+        detonated = 0
+        while self.pending and self.pending[0][0] <= self.time and detonated < EXPLOSION_MAX_DETONATIONS:
+            _, _, x, y, explosion_type, intensity = heapq.heappop(self.pending)
+            self._spawn(x, y, explosion_type, intensity)
+            detonated += 1
+
+        if self.particles.count:
+            c = self.particles.view()
+            c['age'] += dt
+            c['vy'] += c['gravity'] * dt
+            c['x'] += c['vx'] * dt
+            c['y'] += c['vy'] * dt
+            c['vx'] *= EXPLOSION_FRICTION
+            c['vy'] *= EXPLOSION_FRICTION
+            self.particles.keep(c['age'] < c['life'])
+
+        for pool, duration in ((self.flashes, FLASH_DURATION), (self.shock_waves, SHOCKWAVE_DURATION)):
+            if pool.count:
+                c = pool.view()
+                c['age'] += dt
+                pool.keep(c['age'] < duration)
 
     def draw(self, screen, camera):
-        for explosion in self.explosions:
-            explosion.draw(screen, camera)
+        if not (self.particles.count or self.flashes.count or self.shock_waves.count):
+            return
+        offset_x, offset_y = camera.apply_pos((0, 0))
+        width, height = screen.get_size()
+        blits = []
+
+        if self.flashes.count:
+            c = self.flashes.view()
+            progress = c['age'] / FLASH_DURATION
+            radius = np.where(progress < FLASH_PEAK, c['radius'] * (progress / FLASH_PEAK),
+                              c['radius'] * (1 - (progress - FLASH_PEAK) / (1 - FLASH_PEAK)))
+            self._add_rings(blits, c, radius, progress, 'flash_color', offset_x, offset_y, width, height)
+
+        if self.particles.count:
+            self._add_particles(blits, offset_x, offset_y, width, height)
+
+        if self.shock_waves.count:
+            c = self.shock_waves.view()
+            progress = c['age'] / SHOCKWAVE_DURATION
+            radius = c['radius'] * np.minimum(1.0, progress)
+            self._add_rings(blits, c, radius, progress, 'shock_color', offset_x, offset_y, width, height)
+
+        if blits:
+            screen.blits(blits, doreturn=False)
+
+    def _add_rings(self, blits, c, radius, progress, color_key, offset_x, offset_y, width, height):
+        """Flashes e ondas de choque: poucos por frame, então um laço simples basta."""
+        alpha = (255 * (1 - progress)).astype(np.int32)
+        radius = radius.astype(np.int32)
+        screen_x = c['x'].astype(np.int32) + offset_x
+        screen_y = c['y'].astype(np.int32) + offset_y
+        visible = ((alpha > 0) & (radius > 0) & (screen_x + radius >= 0) & (screen_x - radius <= width)
+                   & (screen_y + radius >= 0) & (screen_y - radius <= height))
+        for i in np.flatnonzero(visible).tolist():
+            style = EXPLOSION_STYLES[EXPLOSION_STYLE_NAMES[c['style'][i]]]
+            r = int(radius[i])
+            thickness = style['thickness'] if color_key == 'shock_color' else 0
+            surf = sprite_cache.circle(r, style[color_key], sprite_cache.alpha_level(alpha[i]), thickness)
+            blits.append((surf, (int(screen_x[i]) - r, int(screen_y[i]) - r)))
+
+    def _add_particles(self, blits, offset_x, offset_y, width, height):
+        c = self.particles.view()
+        levels = sprite_cache.ALPHA_LEVELS
+        progress = np.minimum(1.0, c['age'] / c['life'])
+        alpha = (255 * (1 - progress)).astype(np.int32)
+        size = np.maximum(1, (c['size'] * (1 - progress)).astype(np.int32))
+        screen_x = c['x'].astype(np.int32) + offset_x
+        screen_y = c['y'].astype(np.int32) + offset_y
+        visible = ((alpha > 0) & (screen_x >= -size) & (screen_x <= width + size)
+                   & (screen_y >= -size) & (screen_y <= height + size))
+        if not visible.any():
+            return
+
+        # Uma superfície por combinação de tipo, passo de cor, alfa e tamanho
+        step = (progress[visible] * levels).astype(np.int64)
+        level = np.clip(alpha[visible] * levels // 256, 0, levels - 1)
+        size = size[visible]
+        code = ((c['style'][visible].astype(np.int64) * (levels + 1) + step) * levels + level) * 64 + size
+        keys, inverse = np.unique(code, return_inverse=True)
+        sprites = np.empty(len(keys), dtype=object)
+        for i, key in enumerate(keys.tolist()):
+            rest, radius = divmod(key, 64)
+            rest, alpha_key = divmod(rest, levels)
+            style, step_key = divmod(rest, levels + 1)
+            sprites[i] = sprite_cache.circle(radius, EXPLOSION_COLOR_STEPS[style][step_key], alpha_key)
+        positions = zip((screen_x[visible] - size).tolist(), (screen_y[visible] - size).tolist())
+        blits.extend(zip(sprites[inverse].tolist(), positions))
 
     def clear_all(self):
-        self.explosions.clear()
+        self.particles.clear()
+        self.flashes.clear()
+        self.shock_waves.clear()
+        self.pending.clear()
 
 def create_grenade_explosion(explosion_system, x, y, intensity=1.0):
     return explosion_system.create_explosion(x, y, "grenade", intensity)
@@ -0,0 +1,262 @@
+import pygame
+import random
+import numpy as np
+from core.settings import BLACK
+from graphics import sprite_cache
+from graphics.effects_budget import EFFECT_PRIORITY_GAMEPLAY, EFFECT_PRIORITY_NORMAL, EFFECT_PRIORITY_AMBIENT
+
+FX_CAPACITY = 512
+CASING_ANGLE_BUCKETS = 24
+CASING_GRAVITY = 500
+
+FX_IMPACT = 0
+FX_BLOOD = 1
+FX_TRAIL = 2
+FX_EXPLOSION = 3
+FX_CASING = 4
+
+EXPLOSION_COLORS = [(255, 100, 0), (255, 150, 0), (255, 200, 100)]
+CASING_TYPES = {"pistol": 0, "rifle": 1}
+FX_PRIORITIES = {
+    FX_IMPACT: EFFECT_PRIORITY_GAMEPLAY,
+    FX_BLOOD: EFFECT_PRIORITY_GAMEPLAY,
+    FX_TRAIL: EFFECT_PRIORITY_AMBIENT,
+    FX_EXPLOSION: EFFECT_PRIORITY_NORMAL,
+    FX_CASING: EFFECT_PRIORITY_AMBIENT,
+}
+# Prioridade indexada pelo tipo, para consultar o pool inteiro de uma vez
+FX_PRIORITY_TABLE = np.array([FX_PRIORITIES[kind] for kind in range(len(FX_PRIORITIES))], dtype=np.int8)
+
+# Colunas do pool: nome -> dtype
+FX_FIELDS = {
+    'active': np.bool_,
+    'kind': np.int8,
+    'variant': np.int16,
+    'x': np.float64,
+    'y': np.float64,
+    'vx': np.float64,
+    'vy': np.float64,
+    'gravity': np.float64,
+    'age': np.float64,
+    'life': np.float64,
+    'angle': np.float64,
+    'spin': np.float64,
+    'bounces': np.int8,
+    'max_bounces': np.int8,
+    'charge_tick': np.int64,
+}
+
+_casing_images = {}
+
+def _casing_image(variant, bucket):
+    """Casquinha já girada para o balde de ângulo `bucket`, uma vez por variante."""
+    key = (variant, bucket)
+    image = _casing_images.get(key)
+    if image is None:
+        if variant == 0:
+            base = pygame.Surface((6, 3), pygame.SRCALPHA)
+            pygame.draw.ellipse(base, (200, 180, 0), (0, 0, 6, 3))
+            pygame.draw.ellipse(base, (220, 200, 20), (1, 0, 4, 2))
+        elif variant == 1:
+            base = pygame.Surface((8, 4), pygame.SRCALPHA)
+            pygame.draw.ellipse(base, (180, 160, 0), (0, 0, 8, 4))
+            pygame.draw.ellipse(base, (200, 180, 20), (1, 1, 6, 2))
+        else:
+            # Casquinha padrão
+            base = pygame.Surface((5, 3))
+            base.fill((200, 180, 0))
+            base.set_colorkey(BLACK)
+        image = pygame.transform.rotate(base, bucket * 360 / CASING_ANGLE_BUCKETS)
+        _casing_images[key] = image
+    return image
+
+def _fx_sprite(kind, variant, level, bucket):
+    if kind == FX_CASING:
+        return _casing_image(variant, bucket)
+    if kind == FX_IMPACT:
+        return sprite_cache.circle(1, (150, 150, 100), sprite_cache.ALPHA_LEVELS - 1)
+    if kind == FX_BLOOD:
+        return sprite_cache.circle(1, (150, 20, 20), sprite_cache.ALPHA_LEVELS - 1)
+    if kind == FX_TRAIL:
+        return sprite_cache.circle(2, (100, 100, 100), level)
+    size, color = divmod(variant, len(EXPLOSION_COLORS))
+    return sprite_cache.circle(max(1, size // 2), EXPLOSION_COLORS[color], level)
+
+class FXPool:
+    """
+    Efeitos curtos dos projéteis (impacto, sangue, rastro de foguete,
+    estilhaços e casquinhas) num buffer circular de capacidade fixa.
+
+    Não são sprites: ficam em colunas NumPy pré-alocadas, fora de
+    all_sprites. Cada efeito novo ocupa o slot seguinte do anel, então com o
+    pool cheio o mais antigo é reciclado; um efeito ainda vivo de prioridade
+    maior que o novo é pulado, e se não sobrar slot o novo é descartado.
+    `update` integra e expira todos de
+    uma vez; `draw` usa círculos do sprite_cache e casquinhas pré-giradas em
+    CASING_ANGLE_BUCKETS ângulos, num só `screen.blits`.
+
+    Quantidade e vida de cada efeito passam pelo game.effects_budget, com a
+    prioridade do tipo em FX_PRIORITIES.
+    """
+
+    def __init__(self, game, capacity=FX_CAPACITY):
+        self.game = game
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in FX_FIELDS.items()}
+        self.head = 0
+
+    def clear(self):
+        self.columns['active'][:] = False
+        self.head = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.columns['active']))
+
+    def _budget(self, kind, count):
+        budget = getattr(self.game, 'effects_budget', None)
+        if budget is None:
+            return count
+        return budget.count(count, FX_PRIORITIES[kind])
+
+    def _slot(self, priority):
+        """Próximo slot do anel livre ou com efeito de prioridade igual ou menor; None se não houver."""
+        c = self.columns
+        slot = self.head
+        if not c['active'][slot] or FX_PRIORITY_TABLE[c['kind'][slot]] >= priority:
+            return slot
+        free = ~c['active'] | (FX_PRIORITY_TABLE[c['kind']] >= priority)
+        ahead = np.flatnonzero(np.roll(free, -slot))
+        if not len(ahead):
+            return None
+        return (slot + int(ahead[0])) % self.capacity
+
+    def _spawn(self, kind, x, y, vx, vy, life, variant=0, gravity=0.0):
+        priority = FX_PRIORITIES[kind]
+        slot = self._slot(priority)
+        if slot is None:
+            return None
+        self.head = (slot + 1) % self.capacity
+        c = self.columns
+        budget = getattr(self.game, 'effects_budget', None)
+        if budget is not None:
+            # O efeito reciclado ainda estava na contagem do orçamento
+            if c['active'][slot]:
+                budget.refund(1, int(c['charge_tick'][slot]))
+            life *= budget.lifetime(priority)
+            c['charge_tick'][slot] = budget.charge(1, life)
+        c['active'][slot] = True
+        c['kind'][slot] = kind
+        c['variant'][slot] = variant
+        c['x'][slot] = x
+        c['y'][slot] = y
+        c['vx'][slot] = vx
+        c['vy'][slot] = vy
+        c['gravity'][slot] = gravity
+        c['age'][slot] = 0.0
+        c['life'][slot] = life
+        c['angle'][slot] = 0.0
+        c['spin'][slot] = 0.0
+        c['bounces'][slot] = 0
+        c['max_bounces'][slot] = 0
+        return slot
+
+    def impact(self, x, y, count=1, spread=0.0):
+        """Partículas de impacto quando a bala atinge um obstáculo, até `spread` px em volta de (x, y)."""
+        for _ in range(self._budget(FX_IMPACT, count)):
+            self._spawn(FX_IMPACT, x + random.uniform(-spread, spread), y + random.uniform(-spread, spread),
+                        random.uniform(-30, 30), random.uniform(-30, 30), random.uniform(0.2, 0.5))
+
+    def blood(self, x, y, count=1, spread=0.0):
+        """Partículas de sangue quando a bala atinge um inimigo."""
+        for _ in range(self._budget(FX_BLOOD, count)):
+            self._spawn(FX_BLOOD, x + random.uniform(-spread, spread), y + random.uniform(-spread, spread),
+                        random.uniform(-50, 50), random.uniform(-50, 50), random.uniform(0.3, 0.8))
+
+    def trail(self, x, y):
+        """Partícula de rastro para foguetes."""
+        if self._budget(FX_TRAIL, 1):
+            self._spawn(FX_TRAIL, x, y, random.uniform(-10, 10), random.uniform(-10, 10), random.uniform(0.5, 1.0))
+
+    def explosion(self, x, y, count=1, spread=0.0):
+        """Estilhaços da explosão de um foguete."""
+        for _ in range(self._budget(FX_EXPLOSION, count)):
+            variant = random.randint(3, 8) * len(EXPLOSION_COLORS) + random.randrange(len(EXPLOSION_COLORS))
+            self._spawn(FX_EXPLOSION, x + random.uniform(-spread, spread), y + random.uniform(-spread, spread),
+                        random.uniform(-100, 100), random.uniform(-100, 100), random.uniform(0.3, 0.8), variant)
+
+    def casing(self, x, y, player_facing_right, weapon_type="pistol"):
+        """Casquinha ejetada para o lado em que o jogador está virado."""
+        if not self._budget(FX_CASING, 1):
+            return
+        eject_x = random.uniform(20, 40) if player_facing_right else random.uniform(-40, -20)
+        slot = self._spawn(FX_CASING, x, y, eject_x, random.uniform(-100, -140), random.uniform(0.8, 1.2),
+                           CASING_TYPES.get(weapon_type, 2), CASING_GRAVITY)
+        if slot is None:
+            return
+        c = self.columns
+        c['angle'][slot] = random.uniform(0, 360)
+        c['spin'][slot] = random.uniform(-360, 360)
+        c['max_bounces'][slot] = random.randint(1, 3)
+
+    def update(self, dt):
+        c = self.columns
+        active = c['active']
+        if not active.any():
+            return
+        c['vy'] += c['gravity'] * dt
+        c['x'] += c['vx'] * dt
+        c['y'] += c['vy'] * dt
+        c['angle'] = (c['angle'] + c['spin'] * dt) % 360
+        c['age'] += dt
+
+        # Quique das casquinhas num chão imaginário perto da borda de baixo do mapa
+        ground = getattr(self.game, 'map_height', None)
+        if ground is not None:
+            ground -= 50
+            bounce = active & (c['kind'] == FX_CASING) & (c['y'] > ground) & (c['bounces'] < c['max_bounces'])
+            if bounce.any():
+                c['y'][bounce] = ground
+                c['vy'][bounce] *= -0.3
+                c['vx'][bounce] *= 0.7
+                c['bounces'][bounce] += 1
+                if hasattr(self.game, 'play_audio'):
+                    self.game.play_audio('casing_drop', volume=0.1)
+
+        active &= c['age'] < c['life']
+
+    def draw(self, screen, camera):
+        c = self.columns
+        active = c['active']
+        if not active.any() or not camera:
+            return
+        index = np.flatnonzero(active)
+        kind = c['kind'][index]
+        progress = c['age'][index] / c['life'][index]
+        # Rastro começa translúcido (150 de 255); estilhaços e rastro somem ao longo da vida
+        fade = np.where(kind == FX_TRAIL, 150 / 255, 1.0) * np.where(kind >= FX_TRAIL, 1.0 - progress, 1.0)
+        level = np.minimum((fade * sprite_cache.ALPHA_LEVELS).astype(np.int64), sprite_cache.ALPHA_LEVELS) - 1
+        bucket = (c['angle'][index] * CASING_ANGLE_BUCKETS / 360).astype(np.int64) % CASING_ANGLE_BUCKETS
+        sub = np.where(kind == FX_CASING, bucket, level)
+        visible = (kind == FX_CASING) | (level >= 0)
+
+        offset_x, offset_y = camera.apply_pos((0, 0))
+        screen_x = c['x'][index].astype(np.int64) + offset_x
+        screen_y = c['y'][index].astype(np.int64) + offset_y
+        width, height = screen.get_size()
+        visible &= (screen_x > -16) & (screen_y > -16) & (screen_x < width + 16) & (screen_y < height + 16)
+        if not visible.any():
+            return
+
+        code = (kind[visible].astype(np.int64) * 1024 + c['variant'][index][visible]) * 64 + sub[visible]
+        keys, inverse = np.unique(code, return_inverse=True)
+        sprites = np.empty(len(keys), dtype=object)
+        half_w = np.empty(len(keys), dtype=np.int64)
+        half_h = np.empty(len(keys), dtype=np.int64)
+        for i, key in enumerate(keys.tolist()):
+            rest, sub_key = divmod(key, 64)
+            kind_key, variant = divmod(rest, 1024)
+            sprite = _fx_sprite(kind_key, variant, sub_key, sub_key)
+            sprites[i] = sprite
+            half_w[i], half_h[i] = sprite.get_width() // 2, sprite.get_height() // 2
+        positions = zip((screen_x[visible] - half_w[inverse]).tolist(), (screen_y[visible] - half_h[inverse]).tolist())
+        screen.blits(list(zip(sprites[inverse].tolist(), positions)), doreturn=False)
@@ -1,6 +1,5 @@
-import pygame
 import random
-import math
+import numpy as np
 from core.settings import (
     BLOOD_PARTICLE_SIZE,
     BLOOD_PARTICLE_COLOR,
@@ -11,159 +10,213 @@ from core.settings import (
     RAD_PARTICLE_LIFETIME,
     WATER_HIGHLIGHT
 )
-
-class BloodParticle:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.size = BLOOD_PARTICLE_SIZE
-        self.color = BLOOD_PARTICLE_COLOR
-        self.lifetime = BLOOD_PARTICLE_LIFETIME
-        self.created_at = pygame.time.get_ticks()
-
-        angle = random.uniform(0, 2*math.pi)
-        speed = random.uniform(BLOOD_PARTICLE_SPEED*0.5, BLOOD_PARTICLE_SPEED*1.5)
-        self.vx = math.cos(angle)*speed
-        self.vy = math.sin(angle)*speed
-        self.gravity = 0.1
+from graphics import sprite_cache
+from graphics.sprite_cache import ALPHA_LEVELS
+from graphics.effects_budget import EFFECT_PRIORITY_GAMEPLAY, EFFECT_PRIORITY_AMBIENT
+
+PARTICLE_SHAPE_DOT = 'dot'
+PARTICLE_SHAPE_RING = 'ring'
+
+# Colunas do motor de partículas: nome -> dtype
+PARTICLE_FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    'vx': np.float64,
+    'vy': np.float64,
+    'age': np.float64,
+    'life': np.float64,
+    'size': np.float64,
+    'color': np.uint8,
+}
+
+_rng = np.random.default_rng(random.getrandbits(32))
+
+class ParticleEngine:
+    """
+    Partículas em arrays NumPy pré-alocados (SoA).
+
+    Posição, velocidade, idade, vida, tamanho e cor (índice numa paleta
+    pequena) ficam em colunas que crescem dobrando. `update` integra e
+    descarta as mortas de uma vez; `draw` recorta as que estão fora da tela,
+    quantiza o alfa em ALPHA_LEVELS níveis e desenha tudo num só
+    `screen.blits` com superfícies do sprite_cache. Sem partículas vivas,
+    update e draw retornam de imediato.
+
+    `shape` RING desenha anéis cujo raio cresce de 0 a `size` ao longo da
+    vida (as ondulações da água); DOT desenha discos de raio `size`.
+
+    Com um EffectsBudget, `emit` corta quantidade e vida conforme a carga e
+    a `priority` do motor.
+    """
+
+    def __init__(self, shape=PARTICLE_SHAPE_DOT, gravity=0.0, capacity=16, budget=None,
+                 priority=EFFECT_PRIORITY_AMBIENT):
+        self.shape = shape
+        self.gravity = gravity
+        self.budget = budget
+        self.priority = priority
+        self.capacity = capacity
+        self.count = 0
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in PARTICLE_FIELDS.items()}
+        self.palette = []
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, count):
+        needed = self.count + count
+        if needed <= self.capacity:
+            return
+        while self.capacity < needed:
+            self.capacity *= 2
+        for name, dtype in PARTICLE_FIELDS.items():
+            column = np.zeros(self.capacity, dtype=dtype)
+            column[:self.count] = self.columns[name][:self.count]
+            self.columns[name] = column
+
+    def _color_index(self, color):
+        color = tuple(color[:3])
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def emit(self, x, y, count, speed=(0.0, 0.0), life=(1.0, 1.0), size=(1, 1), color=(255, 255, 255),
+             integer_size=True):
+        """
+        Cria `count` partículas em (x, y) com direção aleatória. `speed`,
+        `life` e `size` são intervalos (mín, máx) sorteados por partícula;
+        com `integer_size` o tamanho é um inteiro entre os dois, inclusive.
+        """
+        if self.budget is not None:
+            count = self.budget.count(count, self.priority)
+            factor = self.budget.lifetime(self.priority)
+            life = (life[0] * factor, life[1] * factor)
+            self.budget.charge(count, (life[0] + life[1]) / 2)
+        if count <= 0:
+            return
+        self._reserve(count)
+        start, end = self.count, self.count + count
+        c = self.columns
+
+        angle = _rng.uniform(0, 2 * np.pi, count)
+        magnitude = _rng.uniform(speed[0], speed[1], count)
+        c['x'][start:end] = x
+        c['y'][start:end] = y
+        c['vx'][start:end] = np.cos(angle) * magnitude
+        c['vy'][start:end] = np.sin(angle) * magnitude
+        c['age'][start:end] = 0.0
+        c['life'][start:end] = _rng.uniform(life[0], life[1], count)
+        if integer_size:
+            c['size'][start:end] = _rng.integers(size[0], size[1] + 1, count)
+        else:
+            c['size'][start:end] = _rng.uniform(size[0], size[1], count)
+        c['color'][start:end] = self._color_index(color)
+        self.count = end
 
     def update(self, dt):
-        self.vy += self.gravity * dt * 60
-        self.x += self.vx * dt * 60
-        self.y += self.vy * dt * 60
-
-    def is_dead(self):
-        return pygame.time.get_ticks() - self.created_at > self.lifetime
-
-    def get_alpha(self):
-        elapsed = pygame.time.get_ticks() - self.created_at
-        frac = max(0.0, 1.0 - elapsed/self.lifetime)
-        return int(255*frac) if self.lifetime>0 else 0
+        n = self.count
+        if not n:
+            return
+        c = {name: column[:n] for name, column in self.columns.items()}
+        if self.gravity:
+            c['vy'] += self.gravity * dt
+        c['x'] += c['vx'] * dt
+        c['y'] += c['vy'] * dt
+        c['age'] += dt
+
+        alive = c['age'] < c['life']
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            for name, column in c.items():
+                self.columns[name][:remaining] = column[alive]
+            self.count = remaining
 
     def draw(self, screen, camera):
-        alpha = self.get_alpha()
-        if alpha<=0: return
-
-        rect = pygame.Rect(int(self.x), int(self.y), self.size*2, self.size*2)
-        screen_rect = camera.apply(rect)
-        if not screen_rect.colliderect(screen.get_rect()): return
+        n = self.count
+        if not n or not camera:
+            return
+        c = {name: column[:n] for name, column in self.columns.items()}
+        offset_x, offset_y = camera.apply_pos((0, 0))
+
+        progress = c['age'] / c['life']
+        if self.shape == PARTICLE_SHAPE_RING:
+            size = (c['size'] * progress).astype(np.int32)
+        else:
+            size = c['size'].astype(np.int32)
+        level = ((1.0 - progress) * ALPHA_LEVELS).astype(np.int32)
+        screen_x = c['x'].astype(np.int32) + offset_x - size
+        screen_y = c['y'].astype(np.int32) + offset_y - size
+        width, height = screen.get_size()
+        visible = ((level > 0) & (size > 0) & (screen_x < width) & (screen_y < height)
+                   & (screen_x + size * 2 >= 0) & (screen_y + size * 2 >= 0))
+        if not visible.any():
+            return
 
-        surf = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        draw_color = (*self.color[:3], alpha)
-        pygame.draw.circle(surf, draw_color, (self.size, self.size), self.size)
-        screen.blit(surf, screen_rect.topleft)
+        # Poucas combinações distintas por frame: busca uma superfície por combinação, não por partícula
+        size = size[visible]
+        code = (c['color'][visible].astype(np.int64) * 4096 + size) * ALPHA_LEVELS + level[visible] - 1
+        keys, inverse = np.unique(code, return_inverse=True)
+        sprites = np.empty(len(keys), dtype=object)
+        for index, key in enumerate(keys.tolist()):
+            color, rest = divmod(key, 4096 * ALPHA_LEVELS)
+            sprites[index] = sprite_cache.circle(rest // ALPHA_LEVELS, self.palette[color], rest % ALPHA_LEVELS,
+                                                 1 if self.shape == PARTICLE_SHAPE_RING else 0)
+        positions = zip(screen_x[visible].tolist(), screen_y[visible].tolist())
+        screen.blits(list(zip(sprites[inverse].tolist(), positions)), doreturn=False)
 
 class BloodParticleSystem:
-    def __init__(self):
-        self.particles = []
+    # Velocidade e gravidade originais eram por frame a 60 FPS
+    GRAVITY = 0.1 * 60 * 60
+
+    def __init__(self, budget=None):
+        self.engine = ParticleEngine(PARTICLE_SHAPE_DOT, gravity=self.GRAVITY, budget=budget,
+                                     priority=EFFECT_PRIORITY_GAMEPLAY)
 
     def add_particles(self, x, y, count=BLOOD_PARTICLE_COUNT):
-        for _ in range(count):
-            self.particles.append(BloodParticle(x, y))
+        lifetime = BLOOD_PARTICLE_LIFETIME / 1000
+        self.engine.emit(x, y, count,
+                         speed=(BLOOD_PARTICLE_SPEED * 0.5 * 60, BLOOD_PARTICLE_SPEED * 1.5 * 60),
+                         life=(lifetime, lifetime),
+                         size=(BLOOD_PARTICLE_SIZE, BLOOD_PARTICLE_SIZE),
+                         color=BLOOD_PARTICLE_COLOR)
 
     def update(self, dt):
-        for p in self.particles: p.update(dt)
-        self.particles = [p for p in self.particles if not p.is_dead()]
+        self.engine.update(dt)
 
     def draw(self, screen, camera):
-        for p in self.particles: p.draw(screen, camera)
-
-class RadiationParticle:
-    def __init__(self, x, y):
-        self.pos = pygame.Vector2(x, y)
-
-        angle = random.uniform(0, 2*math.pi)
-        speed = random.uniform(RAD_PARTICLE_SPEED*0.5, RAD_PARTICLE_SPEED*1.5)
-        self.vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-        self.life = random.uniform(RAD_PARTICLE_LIFETIME*0.5, RAD_PARTICLE_LIFETIME)
-        self.age = 0.0
-        self.size = random.randint(1, 3)
-
-    def update(self, dt):
-        self.pos += self.vel * dt
-        self.age += dt
-
-    def is_dead(self):
-        return self.age >= self.life
-
-    def draw(self, screen, camera):
-        alpha = max(0, 255 * (1 - self.age/self.life))
-        if alpha<=0: return
-
-        surf = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (0,255,0,int(alpha)), (self.size, self.size), self.size)
-
-        rect = pygame.Rect(
-            int(self.pos.x-self.size),
-            int(self.pos.y-self.size),
-            self.size*2, self.size*2
-        )
-        screen.blit(surf, camera.apply(rect).topleft)
+        self.engine.draw(screen, camera)
 
 class RadiationSystem:
-    def __init__(self):
-        self.particles = []
+    def __init__(self, budget=None):
+        self.engine = ParticleEngine(PARTICLE_SHAPE_DOT, budget=budget)
 
     def emit(self, x, y, count=10):
-        for _ in range(count):
-            self.particles.append(RadiationParticle(x, y))
+        self.engine.emit(x, y, count,
+                         speed=(RAD_PARTICLE_SPEED * 0.5, RAD_PARTICLE_SPEED * 1.5),
+                         life=(RAD_PARTICLE_LIFETIME * 0.5, RAD_PARTICLE_LIFETIME),
+                         size=(1, 3),
+                         color=(0, 255, 0))
 
     def update(self, dt):
-        for p in self.particles: p.update(dt)
-        self.particles = [p for p in self.particles if not p.is_dead()]
+        self.engine.update(dt)
 
     def draw(self, screen, camera):
-        for p in self.particles: p.draw(screen, camera)
+        self.engine.draw(screen, camera)
 
 class WaterRippleSystem:
-    def __init__(self):
-        self.ripples = []
+    def __init__(self, budget=None):
+        self.engine = ParticleEngine(PARTICLE_SHAPE_RING, budget=budget)
         self.max_ripples = 10
 
     def add_ripple(self, x, y):
 
-        if len(self.ripples) >= self.max_ripples:
+        if len(self.engine) >= self.max_ripples:
             return
 
-        size = random.uniform(8, 15)
-        duration = random.uniform(0.6, 1.0)
-        max_radius = random.uniform(20, 35)
-
-        self.ripples.append({
-            'x': x,
-            'y': y,
-            'radius': size,
-            'max_radius': max_radius,
-            'duration': duration,
-            'age': 0,
-            'color': WATER_HIGHLIGHT
-        })
+        self.engine.emit(x, y, 1, life=(0.6, 1.0), size=(20, 35), color=WATER_HIGHLIGHT, integer_size=False)
 
     def update(self, dt):
-
-        for ripple in self.ripples[:]:
-            ripple['age'] += dt
-
-            progress = ripple['age'] / ripple['duration']
-
-            ripple['radius'] = ripple['max_radius'] * progress
-
-            if ripple['age'] >= ripple['duration']:
-                self.ripples.remove(ripple)
+        self.engine.update(dt)
 
     def draw(self, screen, camera):
-        if not camera:
-            return
-
-        for ripple in self.ripples:
-
-            alpha = int(255 * (1 - ripple['age'] / ripple['duration']))
-
-            screen_x, screen_y = camera.apply_pos((ripple['x'], ripple['y']))
-
-            surf = pygame.Surface((ripple['radius'] * 2, ripple['radius'] * 2), pygame.SRCALPHA)
-
-            color_with_alpha = (*ripple['color'][:3], alpha)
-            pygame.draw.circle(surf, color_with_alpha, (ripple['radius'], ripple['radius']), ripple['radius'], 1)
-
-            screen.blit(surf, (screen_x - ripple['radius'], screen_y - ripple['radius']))
+        self.engine.draw(screen, camera)
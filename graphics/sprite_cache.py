@@ -0,0 +1,49 @@
+import pygame
+from collections import OrderedDict
+
+# Níveis de transparência pré-renderizados
+ALPHA_LEVELS = 16
+# Teto de pixels somando todas as superfícies guardadas (~16 MB em RGBA)
+SPRITE_CACHE_MAX_PIXELS = 4_000_000
+
+_cache = OrderedDict()
+_pixels = 0
+
+def alpha_level(alpha):
+    """Nível quantizado (0 a ALPHA_LEVELS - 1) de um alfa entre 1 e 255."""
+    return max(0, min(ALPHA_LEVELS - 1, int(alpha) * ALPHA_LEVELS // 256))
+
+def level_alpha(level):
+    return (level + 1) * 256 // ALPHA_LEVELS - 1
+
+def circle(radius, color, level, thickness=0):
+    """
+    Círculo de raio `radius` já desenhado numa superfície SRCALPHA de lado
+    2 * radius + 1, com o centro em (radius, radius). `thickness` 0 é
+    preenchido; maior que 0 é um anel com essa espessura para dentro.
+
+    Cada variante (raio, cor, nível de alfa, espessura) é desenhada uma vez
+    e reaproveitada por todos os efeitos; as menos usadas saem quando o
+    total passa de SPRITE_CACHE_MAX_PIXELS.
+    """
+    global _pixels
+    key = (radius, color, level, thickness)
+    surf = _cache.get(key)
+    if surf is not None:
+        _cache.move_to_end(key)
+        return surf
+
+    side = radius * 2 + 1
+    surf = pygame.Surface((side, side), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color[:3], level_alpha(level)), (radius, radius), radius, thickness)
+    _cache[key] = surf
+    _pixels += side * side
+    while _pixels > SPRITE_CACHE_MAX_PIXELS and len(_cache) > 1:
+        _, old = _cache.popitem(last=False)
+        _pixels -= old.get_width() * old.get_height()
+    return surf
+
+def clear():
+    global _pixels
+    _cache.clear()
+    _pixels = 0
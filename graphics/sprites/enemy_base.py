@@ -23,10 +23,12 @@ class Enemy(pygame.sprite.Sprite):
         self.rect = None
 
         self.ai_controller = None
+        # Último instante simulado pelo SimulationLOD do jogo (None: ainda não visto)
+        self.lod_time = None
         self.last_hit_time = 0
         self.invincible = False
 
-        self.blood_system = BloodParticleSystem()
+        self.blood_system = BloodParticleSystem(game.effects_budget)
 
         self.animations = {}
         self.current_animation = None
@@ -153,10 +155,9 @@ class Enemy(pygame.sprite.Sprite):
     def collide_with_obstacles(self, new_position):
          potential_rect = self.rect.copy()
          potential_rect.center = new_position
-         for obstacle in self.game.obstacles:
-              if potential_rect.colliderect(obstacle.rect):
-                   self.velocity = vec(0, 0)
-                   return self.position
+         if self.game.collision.rect_blocked(potential_rect):
+              self.velocity = vec(0, 0)
+              return self.position
          return new_position
 
     def take_damage(self, amount):
@@ -10,7 +10,7 @@ vec = pygame.math.Vector2
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, game, x_pixel, y_pixel):
-        self.groups = game.all_sprites
+        self.groups = game.all_sprites, game.tickers
         super().__init__(self.groups)
         self.game = game
         self._layer = PLAYER_RENDER_LAYER
@@ -53,7 +53,7 @@ class Player(pygame.sprite.Sprite):
         self.reserve_ammo = PLAYER_STARTING_RESERVE_AMMO
         self.pistol = Pistol(game, self)
         self.current_weapon = self.pistol
-        self.blood_system = BloodParticleSystem()
+        self.blood_system = BloodParticleSystem(game.effects_budget)
         self.has_filter_module = False
         self.is_in_radioactive_zone = False
 
@@ -238,21 +238,19 @@ class Player(pygame.sprite.Sprite):
 
         potential_rect.centerx = new_position.x
         potential_rect.centery = self.position.y
-        for obstacle in self.game.obstacles:
-            if potential_rect.colliderect(obstacle.rect):
-                if self.velocity.x > 0: final_pos.x = obstacle.rect.left - self.rect.width / 2
-                elif self.velocity.x < 0: final_pos.x = obstacle.rect.right + self.rect.width / 2
-                self.velocity.x = 0
-                potential_rect.centerx = final_pos.x
-                break
+        obstacle_rect = self.game.collision.first_blocked_rect(potential_rect)
+        if obstacle_rect:
+            if self.velocity.x > 0: final_pos.x = obstacle_rect.left - self.rect.width / 2
+            elif self.velocity.x < 0: final_pos.x = obstacle_rect.right + self.rect.width / 2
+            self.velocity.x = 0
+            potential_rect.centerx = final_pos.x
 
         potential_rect.centery = new_position.y
-        for obstacle in self.game.obstacles:
-            if potential_rect.colliderect(obstacle.rect):
-                if self.velocity.y > 0: final_pos.y = obstacle.rect.top - self.rect.height / 2
-                elif self.velocity.y < 0: final_pos.y = obstacle.rect.bottom + self.rect.height / 2
-                self.velocity.y = 0
-                break
+        obstacle_rect = self.game.collision.first_blocked_rect(potential_rect)
+        if obstacle_rect:
+            if self.velocity.y > 0: final_pos.y = obstacle_rect.top - self.rect.height / 2
+            elif self.velocity.y < 0: final_pos.y = obstacle_rect.bottom + self.rect.height / 2
+            self.velocity.y = 0
 
         return final_pos
 
@@ -275,10 +273,9 @@ class Player(pygame.sprite.Sprite):
         attack_hitbox = pygame.Rect(0, 0, hitbox_width, hitbox_height)
         attack_hitbox.center = (hitbox_center_x, hitbox_center_y)
 
-        for enemy in self.game.enemies:
-            if attack_hitbox.colliderect(enemy.rect):
-                 if hasattr(enemy, 'take_damage'):
-                      enemy.take_damage(MELEE_WEAPON_DAMAGE)
+        for enemy in self.game.broadphase.query_rect('enemies', attack_hitbox):
+            if hasattr(enemy, 'take_damage'):
+                enemy.take_damage(MELEE_WEAPON_DAMAGE)
 
     def update(self, dt):
 
@@ -392,17 +389,8 @@ class Player(pygame.sprite.Sprite):
             tile_y < 0 or tile_y >= self.game.map_height):
             return
 
-        self.current_terrain = None
-        terrain_found = False
-
-        for tile in self.game.world_tiles:
-            if not hasattr(tile, 'kind'):
-                continue
-
-            if tile.rect.collidepoint(self.position):
-                self.current_terrain = tile.kind
-                terrain_found = True
-                break
+        self.current_terrain = self.game.tile_map.kind_at_point(self.position.x, self.position.y)
+        terrain_found = self.current_terrain is not None
 
         if terrain_found:
             if self.current_terrain == 'water':
@@ -12,6 +12,8 @@ class WildDog(Enemy):
         self.max_health = ENEMY_DOG_HEALTH
         self.damage = ENEMY_DOG_DAMAGE
         self.speed = ENEMY_DOG_SPEED * TILE_SIZE
+        # Matilha do spawner (core.ai.pack.Pack), se houver
+        self.pack = None
 
         if not self.setup_animations('wild_dog'):
 
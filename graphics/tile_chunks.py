@@ -0,0 +1,119 @@
+import pygame
+from core.settings import TILE_SIZE, WIDTH, HEIGHT, BLACK
+from level.tile_map import FLAG_ANIMATED
+
+CHUNK_TILES = 16
+
+class TileChunkCache:
+    """
+    Camada de chão pré-renderizada em chunks de CHUNK_TILES × CHUNK_TILES tiles.
+
+    Os tiles do TileMap são desenhados uma única vez numa superfície por chunk;
+    a cada frame só os chunks que cruzam a câmera são blitados. Tiles animados
+    (FLAG_ANIMATED) são desenhados por cima com o quadro atual do
+    WaterAnimator, apenas quando visíveis. Um chunk só é refeito depois de
+    `invalidate`.
+    """
+
+    def __init__(self, tile_map, water_animator, map_width, map_height, chunk_tiles=CHUNK_TILES):
+        self.tile_map = tile_map
+        self.water_animator = water_animator
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = chunk_tiles * TILE_SIZE
+        self.chunks_x = (map_width + self.chunk_size - 1) // self.chunk_size
+        self.chunks_y = (map_height + self.chunk_size - 1) // self.chunk_size
+
+        self.animated = {}
+        self.surfaces = {}
+        self.dirty = set()
+
+        for x, y in tile_map.tiles_with(FLAG_ANIMATED):
+            self.animated.setdefault(self._chunk_key(x, y), []).append((x, y))
+
+        for chunk_y in range(self.chunks_y):
+            for chunk_x in range(self.chunks_x):
+                self._bake((chunk_x, chunk_y))
+
+    def _chunk_key(self, tile_x, tile_y):
+        return (tile_x // self.chunk_tiles, tile_y // self.chunk_tiles)
+
+    def invalidate(self, tile_x, tile_y):
+        """Marca o chunk do tile para ser refeito (chamado por Game.set_tile_kind)."""
+        key = self._chunk_key(tile_x, tile_y)
+        self.dirty.add(key)
+
+        animated = [tile for tile in self.animated.get(key, ()) if tile != (tile_x, tile_y)]
+        if self.tile_map.flags[tile_y, tile_x] & FLAG_ANIMATED:
+            animated.append((tile_x, tile_y))
+        self.animated[key] = animated
+
+    def _bake(self, key):
+        self.dirty.discard(key)
+        tile_map = self.tile_map
+        x0 = key[0] * self.chunk_tiles
+        y0 = key[1] * self.chunk_tiles
+        x1 = min(tile_map.width, x0 + self.chunk_tiles)
+        y1 = min(tile_map.height, y0 + self.chunk_tiles)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface((self.chunk_size, self.chunk_size))
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            self.surfaces[key] = surf
+
+        surf.fill(BLACK)
+        ids = tile_map.ids[y0:y1, x0:x1].tolist()
+        variants = tile_map.variants[y0:y1, x0:x1].tolist()
+        blits = []
+        for row, (id_row, variant_row) in enumerate(zip(ids, variants)):
+            for col, (tile_id, variant) in enumerate(zip(id_row, variant_row)):
+                images = tile_map.images.get(tile_id)
+                if images:
+                    blits.append((images[variant % len(images)], (col * TILE_SIZE, row * TILE_SIZE)))
+        surf.blits(blits, doreturn=False)
+
+    def visible_chunks(self, camera):
+        left, top = -camera.camera.x, -camera.camera.y
+        first_x = max(0, left // self.chunk_size)
+        first_y = max(0, top // self.chunk_size)
+        last_x = min(self.chunks_x - 1, (left + WIDTH - 1) // self.chunk_size)
+        last_y = min(self.chunks_y - 1, (top + HEIGHT - 1) // self.chunk_size)
+
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                yield (chunk_x, chunk_y)
+
+    def draw(self, screen, camera):
+        offset_x, offset_y = camera.apply_coords(0, 0)
+        view = camera.view_rect
+        tile_map = self.tile_map
+        blits = []
+        animated = []
+
+        for key in self.visible_chunks(camera):
+            if key in self.dirty:
+                self._bake(key)
+            surf = self.surfaces.get(key)
+            if surf is not None:
+                blits.append((surf, (key[0] * self.chunk_size + offset_x, key[1] * self.chunk_size + offset_y)))
+            animated.extend(self.animated.get(key, ()))
+
+        for x, y in animated:
+            px, py = x * TILE_SIZE, y * TILE_SIZE
+            if (px + TILE_SIZE <= view.left or px >= view.right or
+                py + TILE_SIZE <= view.top or py >= view.bottom):
+                continue
+
+            tile_id = int(tile_map.ids[y, x])
+            variant = int(tile_map.variants[y, x])
+            images = tile_map.images.get(tile_id)
+            if not images:
+                continue
+            frame = self.water_animator.frame(images[variant % len(images)], tile_map.textured.get(tile_id, True),
+                                              x, y, variant)
+            blits.append((frame, (px + offset_x, py + offset_y)))
+
+        screen.blits(blits, doreturn=False)
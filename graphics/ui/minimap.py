@@ -8,6 +8,7 @@ from core.settings import (
     MINIMAP_PLAYER, MINIMAP_ENEMIES, MINIMAP_ITEMS, MINIMAP_OBSTACLES,
     MINIMAP_RADIOACTIVE, MINIMAP_VIEWPORT
 )
+from level.tile_map import FLAG_BLOCKED, FLAG_RADIOACTIVE
 
 class MiniMap:
     def __init__(self, game, size=None, position=None):
@@ -60,6 +61,31 @@ class MiniMap:
         self.fog_of_war_enabled = MINIMAP_FOG_OF_WAR
         self.explored_areas = set()
         self.exploration_radius = MINIMAP_EXPLORATION_RADIUS  # Raio em pixels do mundo
+
+        # Obstáculos desenhados uma vez numa camada própria, refeita só quando um tile muda
+        self.obstacle_layer = None
+        self.radioactive_tiles = []
+        self.refresh_tiles()
+
+    def refresh_tiles(self):
+        """Refaz a camada de obstáculos e a lista de zonas radioativas a partir do mapa de tiles."""
+        tile_map = getattr(self.game, 'tile_map', None)
+        if tile_map is None:
+            return
+        self.obstacle_layer = self.create_obstacle_layer(tile_map)
+        self.radioactive_tiles = [
+            (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+            for x, y in tile_map.tiles_with(FLAG_RADIOACTIVE)
+        ]
+
+    def create_obstacle_layer(self, tile_map):
+        """Pré-renderiza os pontos de obstáculo do mapa de tiles."""
+        layer = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        for x, y in tile_map.tiles_with(FLAG_BLOCKED):
+            obs_x, obs_y = self.world_to_minimap(x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+            if 0 <= obs_x < self.size and 0 <= obs_y < self.size:
+                pygame.draw.circle(layer, self.colors['obstacles'], (obs_x, obs_y), 1)
+        return layer
         
     def world_to_minimap(self, world_x, world_y):
         """Converte coordenadas do mundo para coordenadas do mini mapa."""
@@ -169,30 +195,17 @@ class MiniMap:
                                          (item_x, item_y), 2)
         
         # Desenha obstáculos (pontos principais)
-        if self.game.obstacles:
-            for obstacle in self.game.obstacles:
-                if hasattr(obstacle, 'rect'):
-                    obs_x, obs_y = self.world_to_minimap(
-                        obstacle.rect.centerx, 
-                        obstacle.rect.centery
-                    )
-                    if 0 <= obs_x < self.size and 0 <= obs_y < self.size:
-                        pygame.draw.circle(self.surface, self.colors['obstacles'], 
-                                         (obs_x, obs_y), 1)
+        if self.obstacle_layer:
+            self.surface.blit(self.obstacle_layer, (0, 0))
         
         # Desenha zonas radioativas
-        if self.game.radioactive_zones:
-            for zone in self.game.radioactive_zones:
-                zone_x, zone_y = self.world_to_minimap(
-                    zone.rect.centerx, 
-                    zone.rect.centery
-                )
-                if 0 <= zone_x < self.size and 0 <= zone_y < self.size:
-                    if not self.fog_of_war_enabled or self.is_area_explored(zone.rect.centerx, zone.rect.centery):
-                        zone_w = max(3, int(zone.rect.width * self.scale))
-                        zone_h = max(3, int(zone.rect.height * self.scale))
-                        pygame.draw.ellipse(self.surface, self.colors['radioactive_zones'], 
-                                          (zone_x - zone_w//2, zone_y - zone_h//2, zone_w, zone_h))
+        zone_w = zone_h = max(3, int(TILE_SIZE * self.scale))
+        for zone_center_x, zone_center_y in self.radioactive_tiles:
+            zone_x, zone_y = self.world_to_minimap(zone_center_x, zone_center_y)
+            if 0 <= zone_x < self.size and 0 <= zone_y < self.size:
+                if not self.fog_of_war_enabled or self.is_area_explored(zone_center_x, zone_center_y):
+                    pygame.draw.ellipse(self.surface, self.colors['radioactive_zones'], 
+                                      (zone_x - zone_w//2, zone_y - zone_h//2, zone_w, zone_h))
     
     def is_area_explored(self, world_x, world_y):
         """Verifica se uma área do mundo foi explorada."""
@@ -0,0 +1,58 @@
+import pygame
+import math
+from core.settings import TILE_SIZE, WATER_HIGHLIGHT, WATER_DARK
+
+WATER_PHASES = 16
+WATER_ANIMATION_SPEED = 1.5
+
+class WaterAnimator:
+    """
+    Quadros pré-renderizados da ondulação da água.
+
+    Cada imagem base de água ganha WATER_PHASES quadros, gerados uma única vez
+    na primeira vez em que aparece na tela. O relógio é global; cada tile só
+    escolhe o quadro pela sua posição e variante, então tiles fora da tela
+    não custam nada.
+    """
+
+    def __init__(self, phases=WATER_PHASES):
+        self.phases = phases
+        self.time = 0.0
+        self.frames = {}
+
+    def update(self, dt):
+        self.time += dt * WATER_ANIMATION_SPEED
+
+    def _ripple(self, phase_index):
+        return (math.sin(2 * math.pi * phase_index / self.phases) + 1) / 2
+
+    def _render_frames(self, image_base, textured):
+        frames = []
+        for phase_index in range(self.phases):
+            ripple = self._ripple(phase_index)
+            frame = image_base.copy()
+
+            overlay = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            if textured:
+                overlay.fill((255, 255, 255, int(25 * ripple)), special_flags=pygame.BLEND_RGBA_ADD)
+            else:
+                overlay.fill((*WATER_HIGHLIGHT[:3], int(60 * ripple)), special_flags=pygame.BLEND_RGBA_ADD)
+                overlay.fill((*WATER_DARK[:3], int(40 * (1 - ripple))), special_flags=pygame.BLEND_RGBA_SUB)
+            frame.blit(overlay, (0, 0))
+
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert_alpha()
+            frames.append(frame)
+        return frames
+
+    def frame(self, image_base, textured, tile_x, tile_y, variant):
+        frames = self.frames.get(image_base)
+        if frames is None:
+            frames = self._render_frames(image_base, textured)
+            self.frames[image_base] = frames
+
+        # A variante (byte aleatório do tile) desencontra a fase de tiles vizinhos
+        phase_offset = variant / 256 * 2 * math.pi
+        angle = self.time + phase_offset + tile_x * 0.5 + tile_y * 0.3
+        phase_index = int(round(angle / (2 * math.pi) * self.phases)) % self.phases
+        return frames[phase_index]
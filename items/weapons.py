@@ -1,6 +1,6 @@
 import pygame
 from core.settings import *
-from projectiles.projectiles import Bullet, Casing, Rocket
+from projectiles.projectiles import Bullet, Rocket
 
 vec = pygame.math.Vector2
 
@@ -81,7 +81,7 @@ class Pistol(Weapon):
         # Casquinha específica para pistola
         casing_spawn_offset = vec(15 if self.player.facing_right else -15, -5)
         casing_pos = self.player.position + casing_spawn_offset
-        Casing(self.game, casing_pos, self.player.facing_right, weapon_type="pistol")
+        self.game.fx.casing(casing_pos.x, casing_pos.y, self.player.facing_right, weapon_type="pistol")
 
         if self.ammo_in_mag <= 0:
             self.start_reload()
@@ -1,14 +1,72 @@
 import pygame
 import random
 import math
+import numpy as np
 from core.settings import *
 from core.noise_generator import NoiseGenerator
-from entities.tile import Tile
-from entities.obstacle import Obstacle
-from entities.radioactive_zone import RadioactiveZone
+from level.layout import TileLayout, TILE_KINDS, TILE_IDS, OBSTACLE_KINDS
+from level.regions import RegionMap, flood_fill
+from level.tile_map import TileMap
+from entities.tile import get_tile_images, create_tile_image
+from entities.obstacle import create_obstacle_image
+from entities.radioactive_zone import create_radioactive_image
 from entities.collectible import Collectible
 from items.item_base import AmmoItem, MaskItem, HealthPackItem, FilterModuleItem
 
+class ConnectivityEngine:
+    """
+    Mantém a garantia de que o spawn continua ligado à borda do mapa
+    enquanto tiles são bloqueados um a um.
+
+    Guarda um caminho testemunha spawn -> borda. Bloquear um tile fora desse
+    caminho nunca desconecta o spawn, então só os tiles sobre o caminho
+    disparam uma nova busca, que já devolve o próximo caminho testemunha.
+    """
+
+    def __init__(self, grid, spawn_point, walkable_ids):
+        self.height, self.width = grid.shape
+        self.spawn_point = spawn_point
+        self.walkable_ids = tuple(walkable_ids)
+        self.open_rows = np.isin(grid, self.walkable_ids).tolist()
+        self.path = self._find_path()
+        self.searches = 0
+
+    def _find_path(self):
+        spawn_x, spawn_y = self.spawn_point
+        if not self.open_rows[spawn_y][spawn_x]:
+            return None
+
+        parents, border_tile = flood_fill(self.open_rows, spawn_x, spawn_y, stop_at_border=True)
+        if border_tile is None:
+            return None
+
+        path = set()
+        node = border_tile
+        while node is not None:
+            path.add(node)
+            node = parents[node]
+        return path
+
+    def try_block(self, x, y):
+        """Bloqueia (x, y) se isso não isolar o spawn. Retorna True se bloqueou."""
+        if not self.open_rows[y][x]:
+            return True
+        if self.path is None or (x, y) == tuple(self.spawn_point):
+            return False
+
+        self.open_rows[y][x] = False
+        if (x, y) not in self.path:
+            return True
+
+        self.searches += 1
+        new_path = self._find_path()
+        if new_path is None:
+            self.open_rows[y][x] = True
+            return False
+
+        self.path = new_path
+        return True
+
 class LevelGenerator:
     def __init__(self, game):
         self.game = game
@@ -18,10 +76,14 @@ class LevelGenerator:
 
         self.map_width_pixels = MAP_WIDTH
         self.map_height_pixels = MAP_HEIGHT
-        self.layout = []
+        self.layout = TileLayout(self.world_width_tiles, self.world_height_tiles)
 
         self.spawn_point = (self.world_width_tiles // 2, self.world_height_tiles // 2)
         self.industrial_centers = []
+        self.connectivity = None
+        self.regions = None
+        self.reachability_map = None
+        self.tile_map = None
 
         self.noise_generator = NoiseGenerator(
             seed=random.randint(0, 1000),
@@ -34,7 +96,7 @@ class LevelGenerator:
     def generate_layout(self):
         print("Gerando layout do nível...")
 
-        self.layout = [['grass' for _ in range(self.world_width_tiles)] for _ in range(self.world_height_tiles)]
+        self.layout = TileLayout(self.world_width_tiles, self.world_height_tiles)
         self.industrial_centers = []
 
         seed1 = random.random() * 100
@@ -46,37 +108,33 @@ class LevelGenerator:
         forest_scale = 60.0
         industrial_placement_scale = 150.0
 
+        width, height = self.world_width_tiles, self.world_height_tiles
+        grid = self.layout.grid
+
         print("Gerando terreno base...")
-        for y in range(self.world_height_tiles):
-            for x in range(self.world_width_tiles):
-                terrain_value = self.noise_generator.get_noise_2d(x + seed1, y + seed1)
-                water_value = self.noise_generator.get_noise_2d(x + seed2, y + seed2)
-
-                spawn_dist = math.sqrt((x - self.spawn_point[0])**2 + (y - self.spawn_point[1])**2)
-                if spawn_dist < 10:
-                    self.layout[y][x] = 'grass'
-                    continue
-
-                if water_value < -0.55:
-
-                    if self._is_isolating_water(x, y):
-                        self.layout[y][x] = 'grass'
-                    else:
-                        self.layout[y][x] = 'water'
-                elif terrain_value < -0.4 and self.layout[y][x] != 'water':
-                    self.layout[y][x] = 'dirt'
-                else:
-                    self.layout[y][x] = 'grass'
+        terrain_field = self.noise_generator.get_noise_2d_array(width, height, seed1, seed1)
+        water_field = self.noise_generator.get_noise_2d_array(width, height, seed2, seed2)
+        forest_field = self.noise_generator.get_noise_2d_array(width, height, seed3, seed3)
 
-        print("Gerando florestas...")
-        for y in range(self.world_height_tiles):
-            for x in range(self.world_width_tiles):
-                if self.layout[y][x] == 'grass':
-                    forest_value = self.noise_generator.get_noise_2d(x + seed3, y + seed3)
-                    if forest_value > 0.55:
+        ys, xs = np.ogrid[0:height, 0:width]
+        spawn_dist_sq = (xs - self.spawn_point[0])**2 + (ys - self.spawn_point[1])**2
+        outside_spawn = spawn_dist_sq >= 10**2
+
+        water_candidates = outside_spawn & (water_field < -0.55)
+        grid[outside_spawn & ~water_candidates & (terrain_field < -0.4)] = TILE_IDS['dirt']
 
-                        if not self._is_isolating_tree(x, y):
-                            self.layout[y][x] = 'tree'
+        self.connectivity = ConnectivityEngine(grid, self.spawn_point, (TILE_IDS['grass'], TILE_IDS['dirt']))
+
+        # Só os candidatos a água precisam do teste de isolamento, em ordem de varredura
+        for y, x in np.argwhere(water_candidates).tolist():
+            if self.connectivity.try_block(x, y):
+                grid[y, x] = TILE_IDS['water']
+
+        print("Gerando florestas...")
+        forest_candidates = (grid == TILE_IDS['grass']) & (forest_field > 0.55)
+        for y, x in np.argwhere(forest_candidates).tolist():
+            if self.connectivity.try_block(x, y):
+                grid[y, x] = TILE_IDS['tree']
 
         print("Gerando zonas industriais...")
         self._add_industrial_zones(seed4, industrial_placement_scale)
@@ -97,49 +155,15 @@ class LevelGenerator:
         print("Adicionando bordas do mapa...")
         self._add_map_borders()
 
+        print("Rotulando regiões caminháveis...")
+        self.regions = RegionMap(self.layout, self.spawn_point)
+        self.reachability_map = self.regions.reachable
+
         self._generate_collectible_items()
 
         print("Geração do layout completa.")
         return self.layout
 
-    def _is_isolating_water(self, x, y):
-
-        temp_layout = [row[:] for row in self.layout]
-        temp_layout[y][x] = 'water'
-
-        return not self._has_path_to_border(temp_layout, self.spawn_point[0], self.spawn_point[1])
-
-    def _is_isolating_tree(self, x, y):
-
-        temp_layout = [row[:] for row in self.layout]
-        temp_layout[y][x] = 'tree'
-
-        return not self._has_path_to_border(temp_layout, self.spawn_point[0], self.spawn_point[1])
-
-    def _has_path_to_border(self, layout, start_x, start_y):
-        visited = set()
-        queue = [(start_x, start_y)]
-
-        while queue:
-            x, y = queue.pop(0)
-            if (x, y) in visited:
-                continue
-
-            visited.add((x, y))
-
-            if x == 0 or x == self.world_width_tiles - 1 or y == 0 or y == self.world_height_tiles - 1:
-                return True
-
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if (0 <= nx < self.world_width_tiles and
-                    0 <= ny < self.world_height_tiles and
-                    layout[ny][nx] in ['grass', 'dirt'] and
-                    (nx, ny) not in visited):
-                    queue.append((nx, ny))
-
-        return False
-
     def _clear_spawn_area(self, radius=5):
         spawn_x, spawn_y = self.spawn_point
         start_x = max(0, spawn_x - radius)
@@ -170,13 +194,11 @@ class LevelGenerator:
     def _add_map_borders(self):
         if self.world_height_tiles <= 0 or self.world_width_tiles <= 0: return
 
-        for x in range(self.world_width_tiles):
-            if self.world_height_tiles > 0: self.layout[0][x] = 'wall'
-            if self.world_height_tiles > 1: self.layout[self.world_height_tiles - 1][x] = 'wall'
-
-        for y in range(self.world_height_tiles):
-            if self.world_width_tiles > 0: self.layout[y][0] = 'wall'
-            if self.world_width_tiles > 1: self.layout[y][self.world_width_tiles - 1] = 'wall'
+        grid = self.layout.grid
+        grid[0, :] = TILE_IDS['wall']
+        grid[-1, :] = TILE_IDS['wall']
+        grid[:, 0] = TILE_IDS['wall']
+        grid[:, -1] = TILE_IDS['wall']
 
     def _add_industrial_zones(self, seed, scale):
         num_zones = random.randint(3, 6)
@@ -532,7 +554,7 @@ class LevelGenerator:
 
     def create_level(self):
         self.generate_layout()
-        print("Instanciando tiles...")
+        print("Montando mapa de tiles...")
 
         tile_type_to_asset = {
             'grass': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Grass/tile_0048_grass25.png',
@@ -540,62 +562,51 @@ class LevelGenerator:
             'water': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Water/tile_0101_water28.png',
             'concrete': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0102_asphalt1.png',
             'concrete_oil_stain': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0126_asphalt25.png',
-            'radioactive': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Dirt/tile_0005_dirt6.png'
+            'radioactive': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Dirt/tile_0005_dirt6.png',
+            'wall': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0114_asphalt13.png'
         }
 
-        for y, row in enumerate(self.layout):
-            for x, tile_type in enumerate(row):
-
-                groups = [self.game.all_sprites, self.game.world_tiles]
-                is_obstacle = False
-
-                if tile_type == 'wall':
-
-                    asset_key = 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0114_asphalt13.png'
-                    Obstacle(self.game, x, y, groups, kind='wall', asset_key=asset_key)
-                    is_obstacle = True
-                elif tile_type == 'water':
-
-                    asset_key = tile_type_to_asset.get(tile_type)
-                    Tile(self.game, x, y, groups, kind='water', asset_key=asset_key)
-                elif tile_type == 'tree':
-
-                    tree_types = [
-                        'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0022_Tree1.png',
-                        'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0023_Tree2.png',
-                        'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0024_Tree3.png',
-                        'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0025_Tree4.png',
-                    ]
-                    asset_key = random.choice(tree_types)
-                    Obstacle(self.game, x, y, groups, kind='tree', asset_key=asset_key)
-                    is_obstacle = True
-                elif tile_type == 'radioactive':
-
-                    asset_key = tile_type_to_asset.get(tile_type)
-                    RadioactiveZone(self.game, x, y, groups, asset_key=asset_key)
-                    is_obstacle = True
-                elif tile_type in ['building', 'machine', 'pipe', 'tank', 'crane', 'generator',
-                                   'cooling_tower', 'conveyor', 'chimney', 'barrier']:
-
-                    structure_to_asset = {
-                        'building': 'assets/images/tds-modern-tilesets-environment/PNG/House/TDS04_House02.png',
-                        'machine': 'assets/images/tds-modern-tilesets-environment/PNG/Crates Barrels/barrel_01.png',
-                        'pipe': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0120_asphalt19.png',
-                        'tank': 'assets/images/tds-modern-tilesets-environment/PNG/SandBag/sandbag_01.png',
-                        'crane': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0118_asphalt17.png',
-                        'generator': 'assets/images/tds-modern-tilesets-environment/PNG/Crates Barrels/crate_01.png',
-                        'cooling_tower': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0118_asphalt17.png',
-                        'conveyor': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0116_asphalt15.png',
-                        'chimney': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0118_asphalt17.png',
-                        'barrier': 'assets/images/tds-modern-tilesets-environment/PNG/SandBag/sandbag_01.png'
-                    }
-                    asset_key = structure_to_asset.get(tile_type, 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0114_asphalt13.png')
-                    Obstacle(self.game, x, y, groups, kind=tile_type, asset_key=asset_key)
-                    is_obstacle = True
-                else:
+        tree_types = [
+            'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0022_Tree1.png',
+            'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0023_Tree2.png',
+            'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0024_Tree3.png',
+            'assets/images/tds-modern-tilesets-environment/PNG/Trees Bushes/TDS04_0025_Tree4.png',
+        ]
+
+        structure_to_asset = {
+            'building': 'assets/images/tds-modern-tilesets-environment/PNG/House/TDS04_House02.png',
+            'machine': 'assets/images/tds-modern-tilesets-environment/PNG/Crates Barrels/barrel_01.png',
+            'pipe': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0120_asphalt19.png',
+            'tank': 'assets/images/tds-modern-tilesets-environment/PNG/SandBag/sandbag_01.png',
+            'crane': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0118_asphalt17.png',
+            'generator': 'assets/images/tds-modern-tilesets-environment/PNG/Crates Barrels/crate_01.png',
+            'cooling_tower': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0118_asphalt17.png',
+            'conveyor': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0116_asphalt15.png',
+            'chimney': 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Asphalt/tile_0118_asphalt17.png',
+            'barrier': 'assets/images/tds-modern-tilesets-environment/PNG/SandBag/sandbag_01.png'
+        }
+
+        self.tile_map = TileMap.from_layout(self.layout)
+
+        for tile_type in TILE_KINDS:
+            if tile_type == 'tree':
+                asset_keys = tree_types
+            elif tile_type in structure_to_asset:
+                asset_keys = [structure_to_asset[tile_type]]
+            else:
+                asset_keys = [tile_type_to_asset.get(tile_type, 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Grass/tile_0024_grass1.png')]
+
+            if tile_type in OBSTACLE_KINDS:
+                create_image = create_obstacle_image
+            elif tile_type == 'radioactive':
+                create_image = create_radioactive_image
+            else:
+                create_image = create_tile_image
 
-                    asset_key = tile_type_to_asset.get(tile_type, 'assets/images/tds-modern-tilesets-environment/PNG/Tileset_v2/Tiles/Grass/tile_0024_grass1.png')
-                    Tile(self.game, x, y, groups, kind=tile_type, asset_key=asset_key)
+            images, textured = get_tile_images(self.game, tile_type, asset_keys, create_image)
+            self.tile_map.set_images(tile_type, images, textured)
+
+        self.game.tile_map = self.tile_map
 
         self._add_filter_modules(num_modules=FILTER_MODULE_COUNT)
 
@@ -614,52 +625,21 @@ class LevelGenerator:
             print(f"Erro ao importar FilterModule: {e}. Itens não serão adicionados.")
             return
 
-        placed_locations = []
         walkable_tiles = ['grass', 'dirt', 'concrete']
         min_dist_from_spawn = 25
         min_dist_between_items = 15
-        padding = 5
 
         print(f"  Tentando colocar {num_modules} módulos de filtro...")
-        attempts_per_module = 100
-        modules_placed = 0
-
-        for _ in range(num_modules):
-            placed = False
-            for attempt in range(attempts_per_module):
-
-                x = random.randint(padding, self.world_width_tiles - 1 - padding)
-                y = random.randint(padding, self.world_height_tiles - 1 - padding)
-
-                if self.layout[y][x] not in walkable_tiles:
-                    continue
-
-                spawn_dist = math.sqrt((x - self.spawn_point[0])**2 + (y - self.spawn_point[1])**2)
-                if spawn_dist < min_dist_from_spawn:
-                    continue
-
-                too_close = False
-                for px, py in placed_locations:
-                    dist = math.sqrt((x - px)**2 + (y - py)**2)
-                    if dist < min_dist_between_items:
-                        too_close = True
-                        break
-                if too_close:
-                    continue
-
-                pixel_x = x * TILE_SIZE + TILE_SIZE // 2
-                pixel_y = y * TILE_SIZE + TILE_SIZE // 2
+        locations = self.regions.take_spaced_tiles(num_modules, walkable_tiles, min_dist_between_items,
+                                                   min_dist=min_dist_from_spawn)
 
-                FilterModule(self.game, pixel_x, pixel_y)
-                placed_locations.append((x, y))
-                modules_placed += 1
-                placed = True
-                break
+        for x, y in locations:
+            pixel_x = x * TILE_SIZE + TILE_SIZE // 2
+            pixel_y = y * TILE_SIZE + TILE_SIZE // 2
 
-            if not placed:
-                print(f"    Não foi possível encontrar localização para um módulo após {attempts_per_module} tentativas.")
+            FilterModule(self.game, pixel_x, pixel_y)
 
-        print(f"  {modules_placed}/{num_modules} módulos de filtro colocados.")
+        print(f"  {len(locations)}/{num_modules} módulos de filtro colocados.")
 
     def _add_reinforced_masks(self, num_masks=2):
 
@@ -672,52 +652,21 @@ class LevelGenerator:
             print(f"Erro ao importar ReinforcedMask: {e}. Máscaras não serão adicionadas.")
             return
 
-        placed_locations = []
         walkable_tiles = ['grass', 'dirt', 'concrete']
         min_dist_from_spawn = 20
         min_dist_between_items = 12
-        padding = 5
 
         print(f"  Tentando colocar {num_masks} máscaras reforçadas...")
-        attempts_per_item = 100
-        masks_placed = 0
-
-        for _ in range(num_masks):
-            placed = False
-            for attempt in range(attempts_per_item):
+        locations = self.regions.take_spaced_tiles(num_masks, walkable_tiles, min_dist_between_items,
+                                                   min_dist=min_dist_from_spawn)
 
-                x = random.randint(padding, self.world_width_tiles - 1 - padding)
-                y = random.randint(padding, self.world_height_tiles - 1 - padding)
-
-                if self.layout[y][x] not in walkable_tiles:
-                    continue
-
-                spawn_dist = math.sqrt((x - self.spawn_point[0])**2 + (y - self.spawn_point[1])**2)
-                if spawn_dist < min_dist_from_spawn:
-                    continue
-
-                too_close = False
-                for px, py in placed_locations:
-                    dist = math.sqrt((x - px)**2 + (y - py)**2)
-                    if dist < min_dist_between_items:
-                        too_close = True
-                        break
-                if too_close:
-                    continue
-
-                pixel_x = x * TILE_SIZE + TILE_SIZE // 2
-                pixel_y = y * TILE_SIZE + TILE_SIZE // 2
-
-                ReinforcedMask(self.game, pixel_x, pixel_y)
-                placed_locations.append((x, y))
-                masks_placed += 1
-                placed = True
-                break
+        for x, y in locations:
+            pixel_x = x * TILE_SIZE + TILE_SIZE // 2
+            pixel_y = y * TILE_SIZE + TILE_SIZE // 2
 
-            if not placed:
-                print(f"    Não foi possível encontrar localização para uma máscara após {attempts_per_item} tentativas.")
+            ReinforcedMask(self.game, pixel_x, pixel_y)
 
-        print(f"  {masks_placed}/{num_masks} máscaras reforçadas colocadas.")
+        print(f"  {len(locations)}/{num_masks} máscaras reforçadas colocadas.")
 
     def _generate_collectible_items(self):
         print("Gerando itens coletáveis...")
@@ -730,22 +679,13 @@ class LevelGenerator:
 
     def _spawn_ammo_items(self, count):
         placed = 0
-        attempts = 0
-        max_attempts = count * 50
 
-        while placed < count and attempts < max_attempts:
-            attempts += 1
-
-            x = random.randint(5, self.world_width_tiles - 5)
-            y = random.randint(5, self.world_height_tiles - 5)
-
-            if self.layout[y][x] not in ['grass', 'dirt', 'concrete']:
-                continue
-
-            spawn_dist = math.sqrt((x - self.spawn_point[0])**2 + (y - self.spawn_point[1])**2)
-            if spawn_dist < 10:
-                continue
+        while placed < count:
+            tile = self.regions.take_tile(['grass', 'dirt', 'concrete'], min_dist=10)
+            if tile is None:
+                break
 
+            x, y = tile
             pixel_x = x * TILE_SIZE + TILE_SIZE // 2
             pixel_y = y * TILE_SIZE + TILE_SIZE // 2
 
@@ -759,22 +699,13 @@ class LevelGenerator:
 
     def _spawn_health_packs(self, count):
         placed = 0
-        attempts = 0
-        max_attempts = count * 50
 
-        while placed < count and attempts < max_attempts:
-            attempts += 1
-
-            x = random.randint(5, self.world_width_tiles - 5)
-            y = random.randint(5, self.world_height_tiles - 5)
-
-            if self.layout[y][x] not in ['grass', 'dirt', 'concrete']:
-                continue
-
-            spawn_dist = math.sqrt((x - self.spawn_point[0])**2 + (y - self.spawn_point[1])**2)
-            if spawn_dist < 15:
-                continue
+        while placed < count:
+            tile = self.regions.take_tile(['grass', 'dirt', 'concrete'], min_dist=15)
+            if tile is None:
+                break
 
+            x, y = tile
             pixel_x = x * TILE_SIZE + TILE_SIZE // 2
             pixel_y = y * TILE_SIZE + TILE_SIZE // 2
 
@@ -788,22 +719,13 @@ class LevelGenerator:
 
     def _spawn_mask_items(self, count):
         placed = 0
-        attempts = 0
-        max_attempts = count * 50
 
-        while placed < count and attempts < max_attempts:
-            attempts += 1
-
-            x = random.randint(5, self.world_width_tiles - 5)
-            y = random.randint(5, self.world_height_tiles - 5)
-
-            if self.layout[y][x] not in ['grass', 'dirt', 'concrete']:
-                continue
-
-            spawn_dist = math.sqrt((x - self.spawn_point[0])**2 + (y - self.spawn_point[1])**2)
-            if spawn_dist < 20:
-                continue
+        while placed < count:
+            tile = self.regions.take_tile(['grass', 'dirt', 'concrete'], min_dist=20)
+            if tile is None:
+                break
 
+            x, y = tile
             pixel_x = x * TILE_SIZE + TILE_SIZE // 2
             pixel_y = y * TILE_SIZE + TILE_SIZE // 2
 
@@ -0,0 +1,66 @@
+import numpy as np
+
+TILE_KINDS = (
+    'grass', 'dirt', 'water', 'tree', 'wall', 'concrete', 'concrete_oil_stain',
+    'radioactive', 'building', 'machine', 'pipe', 'tank', 'crane', 'generator',
+    'cooling_tower', 'conveyor', 'chimney', 'barrier'
+)
+TILE_IDS = {kind: tile_id for tile_id, kind in enumerate(TILE_KINDS)}
+
+# Tipos que viram obstáculos sólidos no nível instanciado
+OBSTACLE_KINDS = (
+    'wall', 'tree', 'building', 'machine', 'pipe', 'tank', 'crane', 'generator',
+    'cooling_tower', 'conveyor', 'chimney', 'barrier'
+)
+PASSABLE_KINDS = tuple(kind for kind in TILE_KINDS if kind not in OBSTACLE_KINDS)
+
+class _LayoutRow:
+    """Visão de uma linha do layout que traduz ids numéricos para nomes de tile."""
+
+    __slots__ = ('_row',)
+
+    def __init__(self, row):
+        self._row = row
+
+    def __getitem__(self, x):
+        return TILE_KINDS[self._row[x]]
+
+    def __setitem__(self, x, kind):
+        self._row[x] = TILE_IDS[kind]
+
+    def __len__(self):
+        return len(self._row)
+
+    def __iter__(self):
+        for tile_id in self._row.tolist():
+            yield TILE_KINDS[tile_id]
+
+class TileLayout:
+    """
+    Layout do nível armazenado como uma grade NumPy de ids de tile.
+
+    O acesso `layout[y][x]` continua retornando (e aceitando) o nome do tile,
+    enquanto `grid` expõe o array para operações vetorizadas.
+    """
+
+    def __init__(self, width, height, fill='grass'):
+        self.width = width
+        self.height = height
+        self.grid = np.full((height, width), TILE_IDS[fill], dtype=np.uint8)
+
+    def __getitem__(self, y):
+        return _LayoutRow(self.grid[y])
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield _LayoutRow(self.grid[y])
+
+    def kind_at(self, x, y):
+        return TILE_KINDS[self.grid[y, x]]
+
+    def mask(self, kinds):
+        """Retorna um array booleano marcando os tiles cujo tipo está em `kinds`."""
+        return np.isin(self.grid, [TILE_IDS[kind] for kind in kinds])
@@ -0,0 +1,194 @@
+import random
+from collections import deque
+import numpy as np
+from level.layout import TILE_KINDS, TILE_IDS, PASSABLE_KINDS
+
+NEIGHBORS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+def flood_fill(open_rows, start_x, start_y, stop_at_border=False):
+    """
+    BFS sobre uma grade de booleanos (lista de listas) a partir de (start_x, start_y).
+
+    Retorna o dicionário de pais dos tiles visitados. Com `stop_at_border`,
+    para no primeiro tile de borda e retorna (pais, tile_de_borda).
+    """
+    height = len(open_rows)
+    width = len(open_rows[0]) if height else 0
+    parents = {(start_x, start_y): None}
+    queue = deque([(start_x, start_y)])
+
+    while queue:
+        x, y = queue.popleft()
+
+        if stop_at_border and (x == 0 or x == width - 1 or y == 0 or y == height - 1):
+            return parents, (x, y)
+
+        for dx, dy in NEIGHBORS_4:
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < width and 0 <= ny < height and
+                open_rows[ny][nx] and (nx, ny) not in parents):
+                parents[(nx, ny)] = (x, y)
+                queue.append((nx, ny))
+
+    if stop_at_border:
+        return parents, None
+    return parents
+
+class RegionMap:
+    """
+    Rotulagem das regiões caminháveis do layout final.
+
+    Um único flood fill rotula cada componente conectado de tiles passáveis
+    e agrupa os tiles livres por (região, tipo). O posicionamento de inimigos
+    e itens sorteia direto dessas listas, então nunca escolhe um tile
+    bloqueado ou inalcançável a partir do spawn.
+    """
+
+    def __init__(self, layout, spawn_point, passable_kinds=PASSABLE_KINDS):
+        grid = layout.grid
+        self.height, self.width = grid.shape
+        self.spawn_point = tuple(spawn_point)
+
+        passable = np.isin(grid, [TILE_IDS[kind] for kind in passable_kinds])
+        self.labels = self._label_regions(passable.tolist())
+        self.region_count = int(self.labels.max())
+
+        spawn_x, spawn_y = self.spawn_point
+        self.spawn_region = int(self.labels[spawn_y, spawn_x])
+        self.reachable = self.labels == self.spawn_region if self.spawn_region else np.zeros_like(passable)
+
+        # Tiles cujo entorno 3x3 também é passável (espaço para sprites maiores que um tile)
+        padded = np.pad(passable, 1, constant_values=False)
+        clear = passable.copy()
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                clear &= padded[1 + dy:1 + dy + self.height, 1 + dx:1 + dx + self.width]
+        self.clear = clear
+
+        self.free_tiles = {}
+        ys, xs = np.nonzero(self.labels)
+        for x, y, label, tile_id in zip(xs.tolist(), ys.tolist(),
+                                        self.labels[ys, xs].tolist(), grid[ys, xs].tolist()):
+            self.free_tiles.setdefault((label, TILE_KINDS[tile_id]), []).append((x, y))
+
+        self.occupied = set()
+        self._pools = {}
+
+    def _label_regions(self, open_rows):
+        labels = np.zeros((self.height, self.width), dtype=np.int32)
+        label_rows = labels.tolist()
+        next_label = 0
+
+        for y in range(self.height):
+            for x in range(self.width):
+                if not open_rows[y][x] or label_rows[y][x]:
+                    continue
+
+                next_label += 1
+                label_rows[y][x] = next_label
+                queue = deque([(x, y)])
+                while queue:
+                    cx, cy = queue.popleft()
+                    for dx, dy in NEIGHBORS_4:
+                        nx, ny = cx + dx, cy + dy
+                        if (0 <= nx < self.width and 0 <= ny < self.height and
+                            open_rows[ny][nx] and not label_rows[ny][nx]):
+                            label_rows[ny][nx] = next_label
+                            queue.append((nx, ny))
+
+        labels[:] = label_rows
+        return labels
+
+    def region_at(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.labels[y, x])
+        return 0
+
+    def is_reachable(self, x, y):
+        return self.spawn_region != 0 and self.region_at(x, y) == self.spawn_region
+
+    def is_free(self, x, y, clearance=False):
+        if not self.is_reachable(x, y) or (x, y) in self.occupied:
+            return False
+        return not clearance or bool(self.clear[y, x])
+
+    def occupy(self, tile):
+        self.occupied.add(tuple(tile))
+
+    def _pool(self, kinds, region, min_dist, max_dist, origin, clearance):
+        key = (tuple(kinds), region, min_dist, max_dist, origin, clearance)
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+
+        tiles = []
+        for kind in kinds:
+            tiles.extend(self.free_tiles.get((region, kind), ()))
+
+        if tiles:
+            coords = np.array(tiles)
+            keep = np.ones(len(tiles), dtype=bool)
+            dist_sq = (coords[:, 0] - origin[0])**2 + (coords[:, 1] - origin[1])**2
+            if min_dist:
+                keep &= dist_sq >= min_dist**2
+            if max_dist is not None:
+                keep &= dist_sq <= max_dist**2
+            if clearance:
+                keep &= self.clear[coords[:, 1], coords[:, 0]]
+            tiles = [tuple(tile) for tile in coords[keep].tolist()]
+
+        self._pools[key] = tiles
+        return tiles
+
+    def take_tile(self, kinds, min_dist=0, max_dist=None, origin=None, region=None, clearance=False):
+        """
+        Sorteia e ocupa um tile livre de um dos tipos em `kinds`.
+
+        As distâncias são medidas em tiles a partir de `origin` (o spawn por
+        padrão). Retorna (x, y) ou None quando não há mais tiles elegíveis.
+        """
+        origin = tuple(origin) if origin is not None else self.spawn_point
+        region = self.spawn_region if region is None else region
+        pool = self._pool(kinds, region, min_dist, max_dist, origin, clearance)
+
+        # Remoção por troca com o último: O(1). Entradas já ocupadas por outro
+        # pool são descartadas aqui mesmo, uma única vez.
+        while pool:
+            index = random.randrange(len(pool))
+            tile = pool[index]
+            pool[index] = pool[-1]
+            pool.pop()
+            if tile not in self.occupied:
+                self.occupied.add(tile)
+                return tile
+        return None
+
+    def take_spaced_tiles(self, count, kinds, spacing, min_dist=0, origin=None, region=None):
+        """Como `take_tile`, mas mantém `spacing` tiles de distância entre os escolhidos."""
+        origin = tuple(origin) if origin is not None else self.spawn_point
+        region = self.spawn_region if region is None else region
+        pool = list(self._pool(kinds, region, min_dist, None, origin, False))
+        chosen = []
+
+        while pool and len(chosen) < count:
+            index = random.randrange(len(pool))
+            tile = pool[index]
+            pool[index] = pool[-1]
+            pool.pop()
+            if tile in self.occupied:
+                continue
+            if any((tile[0] - cx)**2 + (tile[1] - cy)**2 < spacing**2 for cx, cy in chosen):
+                continue
+            self.occupied.add(tile)
+            chosen.append(tile)
+
+        return chosen
+
+    def free_tiles_near(self, x, y, radius, clearance=False):
+        """Tiles livres e alcançáveis no quadrado de raio `radius` em volta de (x, y)."""
+        tiles = []
+        for ty in range(max(0, y - radius), min(self.height, y + radius + 1)):
+            for tx in range(max(0, x - radius), min(self.width, x + radius + 1)):
+                if self.is_free(tx, ty, clearance):
+                    tiles.append((tx, ty))
+        return tiles
@@ -0,0 +1,125 @@
+import random
+import numpy as np
+from core.settings import TILE_SIZE
+from level.layout import TILE_KINDS, TILE_IDS, OBSTACLE_KINDS
+
+FLAG_BLOCKED = 1
+FLAG_RADIOACTIVE = 2
+FLAG_ANIMATED = 4
+
+KIND_FLAGS = {kind: 0 for kind in TILE_KINDS}
+for _kind in OBSTACLE_KINDS:
+    KIND_FLAGS[_kind] |= FLAG_BLOCKED
+KIND_FLAGS['radioactive'] |= FLAG_RADIOACTIVE
+KIND_FLAGS['water'] |= FLAG_ANIMATED
+
+class TileMap:
+    """
+    Mapa de tiles do nível em arrays compactos, sem um sprite por tile.
+
+    Cada tile ocupa três bytes: id do tipo, variante e flags. A variante é um
+    byte aleatório por tile; escolhe a imagem entre as variações do tipo e,
+    na água, o deslocamento de fase da ondulação. As imagens ficam em
+    `images[id]`, compartilhadas por todos os tiles do mesmo tipo.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.ids = np.zeros((height, width), dtype=np.uint8)
+        self.variants = np.zeros((height, width), dtype=np.uint8)
+        self.flags = np.zeros((height, width), dtype=np.uint8)
+
+        self.images = {}
+        self.textured = {}
+        self._kind_flags = np.array([KIND_FLAGS[kind] for kind in TILE_KINDS], dtype=np.uint8)
+
+    @classmethod
+    def from_layout(cls, layout):
+        tile_map = cls(layout.width, layout.height)
+        tile_map.ids[:] = layout.grid
+        rng = np.random.default_rng(random.getrandbits(32))
+        tile_map.variants[:] = rng.integers(0, 256, size=layout.grid.shape, dtype=np.uint8)
+        tile_map.flags[:] = tile_map._kind_flags[layout.grid]
+        return tile_map
+
+    def set_images(self, kind, images, textured=True):
+        self.images[TILE_IDS[kind]] = list(images)
+        self.textured[TILE_IDS[kind]] = textured
+
+    def set_kind(self, x, y, kind, variant=None):
+        """Só o mapa; durante o jogo use Game.set_tile_kind, que avisa colisão, chunks e mini mapa."""
+        tile_id = TILE_IDS[kind]
+        self.ids[y, x] = tile_id
+        self.flags[y, x] = self._kind_flags[tile_id]
+        if variant is not None:
+            self.variants[y, x] = variant
+        else:
+            self.variants[y, x] = random.randrange(256)
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def kind_at(self, x, y):
+        return TILE_KINDS[self.ids[y, x]]
+
+    def image_at(self, x, y):
+        images = self.images.get(int(self.ids[y, x]))
+        if not images:
+            return None
+        return images[self.variants[y, x] % len(images)]
+
+    def tile_at_point(self, px, py):
+        x, y = int(px // TILE_SIZE), int(py // TILE_SIZE)
+        if self.in_bounds(x, y):
+            return (x, y)
+        return None
+
+    def kind_at_point(self, px, py):
+        tile = self.tile_at_point(px, py)
+        if tile is None:
+            return None
+        return TILE_KINDS[self.ids[tile[1], tile[0]]]
+
+    def flags_at_point(self, px, py):
+        tile = self.tile_at_point(px, py)
+        if tile is None:
+            return 0
+        return int(self.flags[tile[1], tile[0]])
+
+    def tile_rect(self, x, y):
+        return (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+    def tile_range(self, rect):
+        """Faixa de tiles (x0, y0, x1, y1), exclusiva no fim, coberta por `rect` e recortada ao mapa."""
+        x0 = max(0, rect.left // TILE_SIZE)
+        y0 = max(0, rect.top // TILE_SIZE)
+        x1 = min(self.width, (rect.right - 1) // TILE_SIZE + 1)
+        y1 = min(self.height, (rect.bottom - 1) // TILE_SIZE + 1)
+        return x0, y0, x1, y1
+
+    def tiles_in_rect(self, rect, mask=0):
+        """
+        Tiles (x, y) que `rect` sobrepõe, em ordem de linha.
+
+        Com `mask`, apenas os tiles com alguma dessas flags.
+        """
+        x0, y0, x1, y1 = self.tile_range(rect)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        flags = self.flags
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                if not mask or flags[y, x] & mask:
+                    yield (x, y)
+
+    def any_in_rect(self, rect, mask):
+        x0, y0, x1, y1 = self.tile_range(rect)
+        if x0 >= x1 or y0 >= y1:
+            return False
+        return bool((self.flags[y0:y1, x0:x1] & mask).any())
+
+    def tiles_with(self, mask):
+        ys, xs = np.nonzero(self.flags & mask)
+        return list(zip(xs.tolist(), ys.tolist()))